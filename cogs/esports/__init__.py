@@ -154,6 +154,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await EasyTag.create(guild_id=ctx.guild.id, channel_id=channel.id)
         self.bot.cache.eztagchannels.add(channel.id)
+        self.bot.cache.tracked_channel_ids.add(channel.id)
 
         embed = self.bot.embed(ctx, title="Easy Tagging")
         embed.description = """
@@ -268,6 +269,7 @@ class ScrimManager(Cog, name="Esports"):
 
         await TagCheck.create(guild_id=ctx.guild.id, channel_id=channel.id, required_mentions=mentions)
         self.bot.cache.tagcheck.add(channel.id)
+        self.bot.cache.tracked_channel_ids.add(channel.id)
 
         await ctx.success(
             f"Successfully added **{channel}** to tagcheck channels.\n\nAdd {role.mention} to your roles to ignore your messages in **{channel}**"
@@ -9,7 +9,7 @@ from contextlib import suppress
 
 import discord
 
-from constants import EsportsLog, EsportsRole, RegDeny
+from constants import EsportsLog, EsportsRole, OutboundPriority, RegDeny
 from core import Cog
 from models import ArrayAppend, AssignedSlot, EasyTag, ReservedSlot, Scrim, TagCheck, Timer, Tourney
 from utils import plural
@@ -26,6 +26,10 @@ class SMError(Cog):
         embed = discord.Embed(color=discord.Color.red(), description=description)
         return embed
 
+    def send_log(self, logschan: discord.TextChannel, *args, **kwargs):
+        """Queue a message for a logs channel behind registration feedback, role grants & slotlist edits."""
+        return self.bot.outbound.submit(OutboundPriority.log, logschan.id, lambda: logschan.send(*args, **kwargs))
+
     @Cog.listener()
     async def on_tourney_registration_deny(self, message: discord.Message, _type: RegDeny, tourney: Tourney, **kwargs):
         logschan = tourney.logschan
@@ -111,8 +115,7 @@ class SMError(Cog):
                 self.bot.loop.create_task(delete_denied_message(message))
 
             embed = discord.Embed(color=discord.Color.red(), description=text)
-            with suppress(discord.Forbidden):
-                return await logschan.send(embed=embed)
+            self.send_log(logschan, embed=embed)
 
     @Cog.listener()
     async def on_tourney_log(self, _type: EsportsLog, tourney: Tourney, **kwargs):
@@ -148,12 +151,12 @@ class SMError(Cog):
                 f"Registration of [{message.author}]({message.jump_url}) has been accepted in {message.channel.mention}"
             )
 
-        with suppress(discord.Forbidden, AttributeError):
-            await logschan.send(
-                content=modrole.mention if modrole is not None and important is True else None,
-                embed=embed,
-                allowed_mentions=discord.AllowedMentions(roles=True),
-            )
+        self.send_log(
+            logschan,
+            content=modrole.mention if modrole is not None and important is True else None,
+            embed=embed,
+            allowed_mentions=discord.AllowedMentions(roles=True),
+        )
 
     @Cog.listener()
     async def on_scrim_log(self, _type: EsportsLog, scrim: Scrim, **kwargs):
@@ -182,7 +185,7 @@ class SMError(Cog):
                 permission_updated = kwargs.get("permission_updated")
                 embed.description = f"Registration closed for {open_role} in {registration_channel.mention}(ScrimsID: `{scrim.id}`)\n\nUse `smanager slotlist edit {scrim.id}` to edit the slotlist."
 
-                await logschan.send(await scrim.get_text_slotlist())
+                self.send_log(logschan, await scrim.get_text_slotlist())
 
                 if not permission_updated:
                     important = True
@@ -196,7 +199,8 @@ class SMError(Cog):
             #     embed.color = discord.Color.green()
             #     embed.description = f"Registration of [{message.author}]({message.jump_url}) has been accepted in {message.channel.mention}"
 
-            await logschan.send(
+            self.send_log(
+                logschan,
                 content=modrole.mention if modrole is not None and important is True else None,
                 embed=embed,
                 allowed_mentions=discord.AllowedMentions(roles=True),
@@ -297,7 +301,7 @@ class SMError(Cog):
                 self.bot.loop.create_task(delete_denied_message(message))
 
             embed = discord.Embed(color=discord.Color.red(), description=text)
-            return await logschan.send(embed=embed)
+            self.send_log(logschan, embed=embed)
 
     # ==========================================================================================================================
     # ==========================================================================================================================
@@ -334,7 +338,7 @@ class SMError(Cog):
                 description=f"Reservation period of **{team_name.title()}** ({user}) is now over.\nSlot will not be reserved for them in Scrim (`{scrim_id}`).",
             )
 
-            await logschan.send(embed=embed)
+            self.send_log(logschan, embed=embed)
 
     @Cog.listener()
     async def on_scrim_cmd_log(self, **kwargs):
@@ -348,7 +352,11 @@ class SMError(Cog):
         self.bot.cache.scrim_channels.discard(channel.id)
         self.bot.cache.tourney_channels.discard(channel.id)
 
-        await Scrim.filter(registration_channel_id=channel.id).delete()
+        if channel.id not in self.bot.cache.tracked_channel_ids:
+            return
+
+        if await Scrim.filter(registration_channel_id=channel.id).delete():
+            self.bot.scrim_dashboard.invalidate(channel.guild.id)
         await Tourney.filter(registration_channel_id=channel.id).delete()
         await TagCheck.filter(channel_id=channel.id).delete()
         await EasyTag.filter(channel_id=channel.id).delete()
@@ -360,7 +368,8 @@ class SMError(Cog):
         self.bot.loop.create_task(message.author.remove_roles(scrim.role))
         await AssignedSlot.filter(id=slot.id).delete()
         await Scrim.filter(id=scrim.id).update(available_slots=ArrayAppend("available_slots", slot.num))
+        self.bot.slot_ledgers.discard(scrim.id)
         if scrim.logschan is not None:
             embed = discord.Embed(color=discord.Color.red())
             embed.description = f"Slot of {message.author.mention} was deleted from Scrim: {scrim.id}, because their registration was deleted from {message.channel.mention}"
-            await scrim.logschan.send(embed=embed)
+            self.send_log(scrim.logschan, embed=embed)
@@ -7,16 +7,16 @@ if typing.TYPE_CHECKING:
 
 import asyncio
 from datetime import datetime, timedelta
-from unicodedata import normalize
 
 import discord
 
 import utils
 from constants import IST, AutocleanType, Day
 from core import Cog
-from models import ArrayRemove, AssignedSlot, BanLog, BannedTeam, Scrim, Timer
+from models import ArrayRemove, AssignedSlot, BanLog, Scrim, Timer
 
 from ..helpers import (
+    RegistrationMessage,
     before_registrations,
     cannot_take_registration,
     check_scrim_requirements,
@@ -59,15 +59,13 @@ class ScrimEvents(Cog):
         if not before_registrations(message, scrim_role):
             return await cannot_take_registration(message, scrim)
 
-        message.content = normalize("NFKC", message.content.lower())
-
         if not await check_scrim_requirements(self.bot, message, scrim):
             return
 
         async with self.__scrim_lock:
             ctx = await self.bot.get_context(message)
 
-            teamname, drop_location = utils.find_team(message), utils.find_drop_location(message)
+            parsed = RegistrationMessage.of(message)
 
             scrim = await Scrim.get_or_none(pk=scrim.id)
 
@@ -79,14 +77,11 @@ class ScrimEvents(Cog):
             except IndexError:
                 return
 
-            _team = {message.author.id}
-            for _ in message.mentions:
-                if not _.bot:
-                    _team.add(_.id)
+            _team = {message.author.id, *parsed.member_ids}
 
             slot = await AssignedSlot.create(
                 user_id=ctx.author.id,
-                team_name=utils.truncate_string(teamname, 30),
+                team_name=utils.truncate_string(parsed.team_name, 30),
                 # drop_location=utils.truncate_string(drop_location, 30),
                 num=slot_num,
                 jump_url=message.jump_url,
@@ -97,7 +92,7 @@ class ScrimEvents(Cog):
             await scrim.assigned_slots.add(slot)
 
             await Scrim.filter(pk=scrim.id).update(available_slots=ArrayRemove("available_slots", slot_num))
-            self.bot.loop.create_task(scrim.add_tick(message))
+            scrim.add_tick(message)
 
             if len(scrim.available_slots) == 1:
                 try:
@@ -124,6 +119,7 @@ class ScrimEvents(Cog):
         await Scrim.filter(pk=scrim.id).update(
             open_time=scrim.open_time + timedelta(hours=24),
         )
+        self.bot.scrim_dashboard.invalidate(scrim.guild_id)
 
         await self.bot.reminders.create_timer(
             scrim.open_time + timedelta(hours=24),
@@ -217,7 +213,6 @@ class ScrimEvents(Cog):
     @Cog.listener()
     async def on_scrim_ban_timer_complete(self, timer: Timer):
         scrims = timer.kwargs["scrims"]
-        user_id = timer.kwargs["user_id"]
 
         reason = timer.kwargs["reason"]
 
@@ -231,14 +226,15 @@ class ScrimEvents(Cog):
         if not guild:
             return
 
-        count = 0
-        for scrim in scrims:
-            bans = await scrim.banned_teams.filter(user_id=user_id)
-            c = await BannedTeam.filter(pk__in=[_.pk for _ in bans]).delete()
-            count += c
+        if team_ids := timer.kwargs.get("team_ids"):
+            unbanned = await self.bot.scrim_bans.expire(team_ids)
+
+        else:  # timers created before bans were batched, one per user.
+            unbanned = await self.bot.scrim_bans.unban([_.pk for _ in scrims], user_ids=[timer.kwargs["user_id"]])
 
-        if not count:
+        if not unbanned:
             return
 
         if banlog := await BanLog.get_or_none(guild_id=guild.id):
-            await banlog.log_unban(user_id, guild.me, scrims, new_reason)
+            for user_id, scrim_ids in unbanned.items():
+                await banlog.log_unban(user_id, guild.me, [_ for _ in scrims if _.pk in scrim_ids], new_reason)
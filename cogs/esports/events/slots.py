@@ -32,6 +32,9 @@ class SlotManagerEvents(Cog):
 
     @Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.TextChannel):
+        if channel.id not in self.bot.cache.tracked_channel_ids:
+            return
+
         record = await ScrimsSlotManager.get_or_none(main_channel_id=channel.id)
         if not record:
             return
@@ -39,11 +42,21 @@ class SlotManagerEvents(Cog):
 
     @Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
-        if not payload.guild_id:
+        if not payload.guild_id or payload.message_id not in self.bot.cache.slotm_message_ids:
             return
 
-        record = await ScrimsSlotManager.get_or_none(message_id=payload.message_id)
-        if not record:
+        await self.__delete_slotms({payload.message_id})
+
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if not payload.guild_id:
             return
 
-        await record.full_delete()
+        if message_ids := payload.message_ids & self.bot.cache.slotm_message_ids:
+            await self.__delete_slotms(message_ids)
+
+    async def __delete_slotms(self, message_ids: typing.Set[int]):
+        self.bot.cache.slotm_message_ids.difference_update(message_ids)
+
+        async for record in ScrimsSlotManager.filter(message_id__in=message_ids):
+            await record.full_delete()
@@ -11,7 +11,6 @@ from constants import SSType
 if TYPE_CHECKING:
     from core import Quotient
 
-from collections import defaultdict
 from contextlib import suppress
 
 import humanize
@@ -21,18 +20,6 @@ from models import ImageResponse, SSVerify
 from utils import emote, plural
 
 
-class MemberLimits(defaultdict):
-    def __missing__(self, key):
-        r = self[key] = QuotientRatelimiter(1, 7)
-        return r
-
-
-class GuildLimits(defaultdict):
-    def __missing__(self, key):
-        r = self[key] = QuotientRatelimiter(10, 60)
-        return r
-
-
 class Ssverification(Cog):
     def __init__(self, bot: Quotient):
         self.bot = bot
@@ -43,12 +30,12 @@ class Ssverification(Cog):
             "Content-Type": "application/json",
         }
 
-        self.__mratelimiter = MemberLimits(QuotientRatelimiter)  # ss/15s by member
-        self.__gratelimiter = GuildLimits(QuotientRatelimiter)  # ss/minute by guild
+        self.__mratelimiter = QuotientRatelimiter(1, 7, name="ssverify_member")  # ss/7s by member
+        self.__gratelimiter = QuotientRatelimiter(10, 60, name="ssverify_guild")  # ss/minute by guild
         self.__verify_lock = asyncio.Lock()
 
     async def __check_ratelimit(self, message: discord.Message):
-        if retry := self.__mratelimiter[message.author].is_ratelimited(message.author):
+        if retry := self.__mratelimiter.is_ratelimited(message.author):
             await message.reply(
                 embed=discord.Embed(
                     color=discord.Color.red(),
@@ -57,7 +44,7 @@ class Ssverification(Cog):
             )
             return False
 
-        elif retry := self.__gratelimiter[message.guild].is_ratelimited(message.guild):
+        elif retry := self.__gratelimiter.is_ratelimited(message.guild):
             await message.reply(
                 embed=discord.Embed(
                     color=discord.Color.red(),
@@ -194,6 +181,10 @@ class Ssverification(Cog):
 
     @Cog.listener()
     async def on_guild_role_delete(self, role: discord.Role):
+        if role.id not in self.bot.cache.tracked_role_ids:
+            return
+
+        self.bot.cache.tracked_role_ids.discard(role.id)
         records = await SSVerify.filter(role_id=role.id)
         if records:
             for record in records:
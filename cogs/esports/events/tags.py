@@ -5,21 +5,25 @@ import typing
 if typing.TYPE_CHECKING:
     from core import Quotient
 
+import asyncio
 import re
 from contextlib import suppress
 
 import discord
 
-import utils
 from core import Cog
 from models import EasyTag, TagCheck
 
-from ..helpers import EasyMemberConverter, delete_denied_message
+from ..helpers import MemberNameIndex, RegistrationMessage, delete_denied_message
+
+EZTAG_ID = re.compile(r"\b\d{17,20}\b")
+EZTAG_NAME = re.compile(r"(?<![\w<])@(\w+)")
 
 
 class TagEvents(Cog):
     def __init__(self, bot: Quotient):
         self.bot = bot
+        self.name_index = MemberNameIndex()
 
     @Cog.listener(name="on_message")
     async def on_tagcheck_msg(self, message: discord.Message):
@@ -44,17 +48,17 @@ class TagEvents(Cog):
             if ignore_role and ignore_role in message.author.roles:
                 return
 
-            ctx = await self.bot.get_context(message)
+            parsed = RegistrationMessage.of(message)
             _react = True
             
             # Check for bot mentions
-            if any(m.bot for m in message.mentions):
+            if parsed.mentions_bot:
                 _react = False
                 with suppress(discord.HTTPException):
                     await message.reply("❌ Please mention real teammates, not bots.", delete_after=5)
                     
             # Check required mentions
-            elif len(message.mentions) < tagcheck.required_mentions:
+            elif len(parsed.mention_ids) < tagcheck.required_mentions:
                 _react = False
                 with suppress(discord.HTTPException):
                     await message.reply(
@@ -63,8 +67,7 @@ class TagEvents(Cog):
                     )
 
             # Find team name and handle reactions
-            # Find team name and handle reactions
-            team_name = utils.find_team(message)
+            team_name = parsed.team_name
             with suppress(discord.HTTPException):
                 await message.add_reaction("✅" if _react else "❌")
 
@@ -110,8 +113,10 @@ class TagEvents(Cog):
             ctx = await self.bot.get_context(message)
 
             # Find discord tags in message
-            tags = set(re.findall(r"\b\d{18}\b|\b@\w+", message.content, re.IGNORECASE))
-            if not tags:
+            text = RegistrationMessage.of(message).text
+            ids = list(dict.fromkeys(map(int, EZTAG_ID.findall(text))))
+            names = list(dict.fromkeys(EZTAG_NAME.findall(text)))
+            if not ids and not names:
                 with suppress(discord.HTTPException):
                     await message.add_reaction("❌")
                     await ctx.reply(
@@ -123,15 +128,13 @@ class TagEvents(Cog):
                     )
                 return
 
-            # Convert tags to members
-            members = []
-            for tag in tags:
-                try:
-                    member = await EasyMemberConverter().convert(ctx, tag)
-                    if member:
-                        members.append(member)
-                except commands.MemberNotFound:
-                    continue
+            # Resolve tags from cache, then the ids that weren't cached in a single query
+            members, missing = self.name_index.lookup(message.guild, ids, names)
+            if missing:
+                with suppress(discord.HTTPException, asyncio.TimeoutError):
+                    members += [m async for m in self.bot.resolve_member_ids(message.guild, missing)]
+
+            members = list({m.id: m for m in members}.values())
 
             if not members:
                 with suppress(discord.HTTPException):
@@ -158,6 +161,34 @@ class TagEvents(Cog):
             self.bot.dispatch("error", e)  # Log any errors
             return
 
+    @Cog.listener(name="on_member_join")
+    async def on_eztag_member_join(self, member: discord.Member):
+        self.name_index.add(member.guild.id, member)
+
+    @Cog.listener(name="on_member_remove")
+    async def on_eztag_member_remove(self, member: discord.Member):
+        self.name_index.remove(member.guild.id, member)
+
+    @Cog.listener(name="on_member_update")
+    async def on_eztag_member_update(self, before: discord.Member, after: discord.Member):
+        if after.guild.id in self.name_index and before.nick != after.nick:
+            self.name_index.remove(after.guild.id, before)
+            self.name_index.add(after.guild.id, after)
+
+    @Cog.listener(name="on_user_update")
+    async def on_eztag_user_update(self, before: discord.User, after: discord.User):
+        if (before.name, before.global_name) == (after.name, after.global_name):
+            return
+
+        for guild in after.mutual_guilds:
+            if guild.id in self.name_index and (member := guild.get_member(after.id)):
+                self.name_index.remove(guild.id, before)
+                self.name_index.add(guild.id, member)
+
+    @Cog.listener(name="on_guild_remove")
+    async def on_eztag_guild_remove(self, guild: discord.Guild):
+        self.name_index.forget(guild.id)
+
     @Cog.listener(name="on_guild_channel_delete")
     async def on_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
         if not isinstance(channel, discord.TextChannel):
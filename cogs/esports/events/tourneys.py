@@ -3,24 +3,19 @@ from __future__ import annotations
 import typing
 from contextlib import suppress
 
-from cogs.esports.helpers.tourney import get_tourney_from_channel
-
 if typing.TYPE_CHECKING:
     from core import Quotient
 
-import asyncio
-from unicodedata import normalize
-
 import discord
 from tortoise.exceptions import DoesNotExist
 
-import utils
 from constants import EsportsLog, RegDeny
 from core import Cog
-from models import MediaPartner, PartnerSlot, TGroupList, TMSlot, Tourney
+from models import MediaPartner, TGroupList, TMSlot, Tourney
 from utils import truncate_string
 
 from ..helpers import (
+    RegistrationMessage,
     before_registrations,
     cannot_take_registration,
     check_tourney_requirements,
@@ -32,7 +27,6 @@ from ..helpers import (
 class TourneyEvents(Cog):
     def __init__(self, bot: Quotient):
         self.bot = bot
-        self.__tourney_lock = asyncio.Lock()
 
     async def __process_tourney_message(
         self, message: discord.Message, tourney: Tourney, *, check_duplicate=True, mp=False
@@ -43,7 +37,8 @@ class TourneyEvents(Cog):
         :param check_duplicate: In case we want a message to be processed without these checks.
         """
 
-        teamname = utils.find_team(message)
+        parsed = RegistrationMessage.of(message)
+        teamname = truncate_string(parsed.team_name, 30)
 
         try:
             await tourney.refresh_from_db()  # Refetch Tourney to check get its updated instance
@@ -52,42 +47,42 @@ class TourneyEvents(Cog):
         if not tourney or tourney.closed:  # Tourney is deleted or not opened.
             return
 
-        if tourney.no_duplicate_name and check_duplicate:
-            if await tourney.assigned_slots.filter(team_name=teamname).exists():
-                return self.bot.dispatch("tourney_registration_deny", message, RegDeny.duplicate, tourney)
-
-        if not tourney.multiregister and message.author.id in get_tourney_slots(await tourney.assigned_slots.all()):
-            return self.bot.dispatch("tourney_registration_deny", message, RegDeny.multiregister, tourney)
-
-        ctx = await self.bot.get_context(message)
-
-        if mp:
-            partner = await MediaPartner.get(pk=ctx.channel.id)
+        ledger = await self.bot.tourney_ledgers.get(tourney)
 
-            media_slot = await PartnerSlot.create(
-                user_id=ctx.author.id,
-                message_id=ctx.message.id,
-                jump_url=ctx.message.jump_url,
-                members=[m.id for m in message.mentions],
-            )
-            await partner.slots.add(media_slot)
+        # no awaits from here until the slot is claimed, so the checks can't go stale in between.
+        if tourney.no_duplicate_name and check_duplicate and ledger.has_team(teamname):
+            return self.bot.dispatch("tourney_registration_deny", message, RegDeny.duplicate, tourney)
 
-        assigned_slots = await tourney.assigned_slots.order_by("-num").first()
+        if not tourney.multiregister and ledger.has_leader(message.author.id):
+            return self.bot.dispatch("tourney_registration_deny", message, RegDeny.multiregister, tourney)
 
-        numb = 0 if assigned_slots is None else assigned_slots.num
+        if ledger.is_full(tourney):
+            return
 
         slot = TMSlot(
-            leader_id=ctx.author.id,
-            team_name=truncate_string(teamname, 30),
-            num=numb + 1,
-            members=[m.id for m in message.mentions],
+            leader_id=message.author.id,
+            team_name=teamname,
+            num=ledger.claim(message.author.id, teamname, message.id),
+            members=list(parsed.mention_ids),
             jump_url=message.jump_url,
             message_id=message.id,
         )
+        filled = ledger.is_full(tourney)
+
+        ctx = await self.bot.get_context(message)
+
+        if mp:
+            self.bot.partner_slots.add(
+                ctx.channel.id, ctx.author.id, ctx.message.id, ctx.message.jump_url, parsed.mention_ids
+            )
 
-        await tourney.add_assigned_slot(slot, ctx.message)
+        try:
+            await tourney.add_assigned_slot(slot, ctx.message)
+        finally:
+            if slot.pk is None:  # claimed but not saved, give the count back.
+                self.bot.tourney_ledgers.release(tourney.id, slot.leader_id, slot.team_name, slot.message_id)
 
-        self.bot.loop.create_task(tourney.finalize_slot(ctx, slot))
+        tourney.finalize_slot(ctx, slot)
 
         self.bot.dispatch(
             "tourney_log",
@@ -96,7 +91,7 @@ class TourneyEvents(Cog):
             message=ctx.message,
         )
 
-        if tourney.total_slots <= await tourney.assigned_slots.all().count():
+        if filled:
             await tourney.end_process()
 
     @Cog.listener("on_message")
@@ -123,36 +118,48 @@ class TourneyEvents(Cog):
         if not before_registrations(message, tourney.role):
             return await cannot_take_registration(message, tourney)
 
-        message.content = normalize("NFKC", message.content.lower())
-
         if not await check_tourney_requirements(self.bot, message, tourney):
             return
 
-        async with self.__tourney_lock:
-            await self.__process_tourney_message(message, tourney)
+        await self.__process_tourney_message(message, tourney)
 
     @Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """
+        A tourney-mod reacting with the tick emoji registers a message that wasn't registered.
+
+        Everything that can be ruled out in memory is, before the database and REST are touched.
+        """
         if not all((payload.guild_id, payload.member, not payload.member.bot)):
             return
 
         if not payload.channel_id in self.bot.cache.tourney_channels:
             return
 
-        tourney = await Tourney.get_or_none(registration_channel_id=payload.channel_id)
+        if not Tourney.is_ignorable(payload.member):
+            return
 
-        if not tourney:
-            return self.bot.cache.tourney_channels.discard(payload.channel_id)
+        if (target := self.bot.cache.tourney_reaction_targets.get(payload.channel_id)) is None:
+            tourney = await Tourney.get_or_none(registration_channel_id=payload.channel_id)
+            if not tourney:
+                return self.bot.cache.tourney_channels.discard(payload.channel_id)
 
-        if not str(payload.emoji) in tourney.emojis.values():
-            return
+            target = self.bot.cache.tourney_reaction_targets[payload.channel_id] = (tourney.id, tourney.check_emoji)
 
-        if not tourney.is_ignorable(payload.member):
+        tourney_id, check_emoji = target
+        if str(payload.emoji) != check_emoji:
             return
 
-        slot = await TMSlot.get_or_none(message_id=payload.message_id)
+        if ledger := self.bot.tourney_ledgers.peek(tourney_id):
+            if payload.message_id in ledger.message_ids:
+                return
+
+        elif await TMSlot.filter(message_id=payload.message_id).exists():
+            return
 
-        e = str(payload.emoji)
+        tourney = await Tourney.get_or_none(pk=tourney_id)
+        if not tourney:
+            return
 
         message = None
         with suppress(discord.HTTPException, AttributeError):
@@ -162,44 +169,24 @@ class TourneyEvents(Cog):
         if not message:
             return
 
-        member = await self.bot.getch(self.bot.get_user, self.bot.fetch_user, payload.user_id)
+        if (await self.bot.tourney_ledgers.get(tourney)).is_full(tourney):
+            return await channel.send(f"{payload.member.mention}, Slots are already full.", delete_after=6)
 
-        # if not slot and e == tourney.cross_emoji:
-        #     return  # no need to do anything kyuki already registered nai hai user
-
-        if not slot and e == tourney.check_emoji:
-            if tourney.total_slots <= await tourney.assigned_slots.all().count():
-                return await channel.send(f"{getattr(member, 'mention','')}, Slots are already full.", delete_after=6)
-
-            # TODO:send log here
-            return await self.__process_tourney_message(message, tourney, check_duplicate=False)
-
-        if str(payload.emoji) == tourney.check_emoji:
-            return
-
-        if str(payload.emoji) == tourney.cross_emoji:
-            return await ...  # cancel kardo slot user ka
+        # TODO:send log here
+        return await self.__process_tourney_message(message, tourney, check_duplicate=False)
 
     @Cog.listener(name="on_message")
     async def on_media_partner_message(self, message: discord.Message):
-        if not all(
-            (
-                message.guild,
-                not message.author.bot,
-                message.channel.id in self.bot.cache.media_partner_channels,
-            )
-        ):
+        if not message.guild or message.author.bot:
             return
 
-        media_partner = await MediaPartner.get_or_none(pk=message.channel.id)
-
-        if not media_partner:
-            return self.bot.cache.media_partner_channels.discard(message.channel.id)
+        if (partner_channel := self.bot.cache.media_partner_channels.get(message.channel.id)) is None:
+            return
 
-        tourney = await get_tourney_from_channel(message.guild.id, message.channel.id)  # type: ignore # line guarded
+        tourney = await Tourney.get_or_none(pk=partner_channel.tourney_id, guild_id=message.guild.id)
 
         if not tourney:
-            return self.bot.cache.media_partner_channels.discard(message.channel.id)
+            return self.bot.cache.media_partner_channels.pop(message.channel.id, None)
 
         if tourney.started_at is None:
             return
@@ -207,7 +194,7 @@ class TourneyEvents(Cog):
         if tourney.is_ignorable(message.author):
             return
 
-        partner_tourney = await Tourney.get_or_none(pk=media_partner.tourney_id)
+        partner_tourney = await Tourney.get_or_none(pk=partner_channel.partner_tourney_id)
         if not partner_tourney:
             _e = discord.Embed(
                 color=discord.Color.red(),
@@ -232,27 +219,26 @@ class TourneyEvents(Cog):
             )
             return await message.reply(embed=_e, delete_after=7)
 
-        message.content = normalize("NFKC", message.content.lower())
-
         if not await check_tourney_requirements(self.bot, message, tourney):
             return
 
-        async with self.__tourney_lock:
-            await self.__process_tourney_message(message, tourney, mp=True)
+        await self.__process_tourney_message(message, tourney, mp=True)
 
     @Cog.listener()
     async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
         message_id = payload.message_id
-        _del = await Tourney.filter(slotm_message_id=message_id).update(slotm_message_id=None, slotm_channel_id=None)
+        if message_id in self.bot.cache.tourney_message_ids:
+            return await self.__forget_tourney_messages({message_id})
 
         tourney = None
-        if not _del:
-            if payload.channel_id in self.bot.cache.media_partner_channels:
-                media_partner = await MediaPartner.get_or_none(pk=payload.channel_id)
-                if media_partner:
-                    tourney = await get_tourney_from_channel(payload.guild_id, payload.channel_id)
-            elif payload.channel_id in self.bot.cache.tourney_channels:
-                tourney = await Tourney.get_or_none(registration_channel_id=payload.channel_id)
+        if partner_channel := self.bot.cache.media_partner_channels.get(payload.channel_id):
+            tourney = await Tourney.get_or_none(pk=partner_channel.tourney_id)
+        elif payload.channel_id in self.bot.cache.tourney_channels:
+            tourney = await Tourney.get_or_none(registration_channel_id=payload.channel_id)
+
+        if tourney and (ledger := self.bot.tourney_ledgers.peek(tourney.id)):
+            if message_id not in ledger.message_ids:
+                return
 
         if tourney:
             slot = await tourney.assigned_slots.filter(message_id=payload.message_id).first()
@@ -266,13 +252,30 @@ class TourneyEvents(Cog):
                         self.bot.loop.create_task(m.remove_roles(tourney.role))
 
                 await TMSlot.filter(pk=slot.pk).delete()
+                self.bot.tourney_groups.bump(tourney.id)
+                self.bot.tourney_ledgers.release(tourney.id, slot.leader_id, slot.team_name, slot.message_id)
 
-        await TGroupList.filter(message_id=message_id).delete()
+    @Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        if message_ids := payload.message_ids & self.bot.cache.tourney_message_ids:
+            await self.__forget_tourney_messages(message_ids)
+
+    async def __forget_tourney_messages(self, message_ids: typing.Set[int]):
+        """Unlink deleted tourney slot-manager and group list messages."""
+        self.bot.cache.tourney_message_ids.difference_update(message_ids)
+
+        await Tourney.filter(slotm_message_id__in=message_ids).update(slotm_message_id=None, slotm_channel_id=None)
+        await TGroupList.filter(message_id__in=message_ids).delete()
 
     @Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.TextChannel):
+        _cache = self.bot.cache
+        if channel.id not in _cache.tracked_channel_ids and channel.id not in _cache.media_partner_channels:
+            return
+
         await Tourney.filter(slotm_channel_id=channel.id).update(slotm_channel_id=None, slotm_message_id=None)
         await MediaPartner.filter(channel_id=channel.id).delete()
+        _cache.media_partner_channels.pop(channel.id, None)
 
     @Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -1,3 +1,5 @@
 from .converters import *
+from .members import *
+from .registration import *
 from .tourney import *
 from .utils import *
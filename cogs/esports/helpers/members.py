@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import typing as T
+
+import discord
+
+__all__ = ("MemberNameIndex",)
+
+
+class MemberNameIndex:
+    """
+    Lowercase username, global name & nickname -> member id, of the guilds that asked for it.
+
+    A guild is indexed the first time one of its names is looked up,
+    afterwards the index is kept up to date from member events.
+    """
+
+    def __init__(self):
+        self._guilds: T.Dict[int, T.Dict[str, int]] = {}
+
+    @staticmethod
+    def names(member: T.Union[discord.Member, discord.User]) -> T.Set[str]:
+        return {
+            _.lower() for _ in (member.name, member.global_name, getattr(member, "nick", None)) if _ is not None
+        }
+
+    def __contains__(self, guild_id: int) -> bool:
+        return guild_id in self._guilds
+
+    def ensure(self, guild: discord.Guild) -> T.Dict[str, int]:
+        if (index := self._guilds.get(guild.id)) is None:
+            index = self._guilds[guild.id] = {name: m.id for m in guild.members for name in self.names(m)}
+
+        return index
+
+    def add(self, guild_id: int, member: T.Union[discord.Member, discord.User]):
+        if (index := self._guilds.get(guild_id)) is not None:
+            for name in self.names(member):
+                index[name] = member.id
+
+    def remove(self, guild_id: int, member: T.Union[discord.Member, discord.User]):
+        if (index := self._guilds.get(guild_id)) is not None:
+            for name in self.names(member):
+                if index.get(name) == member.id:
+                    del index[name]
+
+    def forget(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+
+    def lookup(
+        self, guild: discord.Guild, ids: T.Iterable[int], names: T.Iterable[str]
+    ) -> T.Tuple[T.List[discord.Member], T.List[int]]:
+        """Members found in cache, and the ids that weren't."""
+        members, missing = [], []
+
+        for _id in ids:
+            if (member := guild.get_member(_id)) is not None:
+                members.append(member)
+            else:
+                missing.append(_id)
+
+        if names:
+            index = self.ensure(guild)
+            for name in names:
+                if (_id := index.get(name.lower())) and (member := guild.get_member(_id)) is not None:
+                    members.append(member)
+
+        return members, missing
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+import typing as T
+from unicodedata import normalize
+
+import discord
+
+from core.fetch import TTLCache
+from utils import find_drop_location, find_team
+
+__all__ = ("RegistrationMessage",)
+
+
+class RegistrationMessage:
+    """
+    Everything registration checks read from a message, worked out once.
+
+    Scrim, tourney & tagcheck listeners all get the same message dispatched, `of()` hands them
+    the same analysis instead of each one normalizing & searching the content again.
+    """
+
+    __slots__ = (
+        "message",
+        "text",
+        "has_team_name",
+        "team_name",
+        "drop_location",
+        "mention_ids",
+        "member_ids",
+        "mentions_bot",
+        "line_count",
+    )
+
+    _parsed = TTLCache(ttl=60, maxsize=2048)
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        self.text = normalize("NFKC", message.content.lower())
+
+        team_line = re.search(r"team.*", self.text)
+        self.has_team_name = bool(team_line and team_line.group().strip())
+        self.team_name = find_team(message, self.text)
+        self.drop_location = find_drop_location(message, self.text)
+
+        self.mention_ids: T.Tuple[int, ...] = tuple(m.id for m in message.mentions)
+        self.member_ids: T.Tuple[int, ...] = tuple(m.id for m in message.mentions if not m.bot)
+        self.mentions_bot = len(self.member_ids) != len(self.mention_ids)
+
+        self.line_count = len(self.text.splitlines())
+
+    @classmethod
+    def of(cls, message: discord.Message) -> RegistrationMessage:
+        # an edit changes the content, the edited message gets its own analysis.
+        key = (message.id, message.edited_at)
+
+        if (parsed := cls._parsed.get(key)) is None:
+            parsed = cls._parsed[key] = cls(message)
+
+        return parsed
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import re
 from contextlib import suppress
-from typing import Iterable, List, Optional
+from typing import Iterable, List
 
 import discord
 
 from constants import EsportsRole, RegDeny
 from models import TMSlot, Tourney
 
+from .registration import RegistrationMessage
+
 
 def get_tourney_slots(slots: List[TMSlot]) -> Iterable[int]:
     for slot in slots:
@@ -54,18 +55,17 @@ def before_registrations(message: discord.Message, role: discord.Role) -> bool:
 
 async def check_tourney_requirements(bot, message: discord.Message, tourney: Tourney) -> bool:
     _bool = True
+    parsed = RegistrationMessage.of(message)
 
-    if tourney.teamname_compulsion:
-        teamname = re.search(r"team.*", message.content)
-        if not teamname or not teamname.group().strip():
-            _bool = False
-            bot.dispatch("tourney_registration_deny", message, RegDeny.noteamname, tourney)
+    if tourney.teamname_compulsion and not parsed.has_team_name:
+        _bool = False
+        bot.dispatch("tourney_registration_deny", message, RegDeny.noteamname, tourney)
 
-    if tourney.required_mentions and not all(map(lambda m: not m.bot, message.mentions)):
+    if tourney.required_mentions and parsed.mentions_bot:
         _bool = False
         bot.dispatch("tourney_registration_deny", message, RegDeny.botmention, tourney)
 
-    elif not len(message.mentions) >= tourney.required_mentions:
+    elif not len(parsed.mention_ids) >= tourney.required_mentions:
         _bool = False
         bot.dispatch("tourney_registration_deny", message, RegDeny.nomention, tourney)
 
@@ -73,7 +73,7 @@ async def check_tourney_requirements(bot, message: discord.Message, tourney: Tou
         _bool = False
         bot.dispatch("tourney_registration_deny", message, RegDeny.banned, tourney)
 
-    elif len(message.content.splitlines()) < tourney.required_lines:
+    elif parsed.line_count < tourney.required_lines:
         _bool = False
         bot.dispatch("tourney_registration_deny", message, RegDeny.nolines, tourney)
 
@@ -113,12 +113,3 @@ async def update_confirmed_message(tourney: Tourney, link: str):
 
             await message.edit(embed=e)
 
-
-async def get_tourney_from_channel(guild_id: int, channel_id: int) -> Optional[Tourney]:
-    tourneys = await Tourney.filter(guild_id=guild_id)
-
-    for tourney in tourneys:
-        if await tourney.media_partners.filter(pk=channel_id).exists():
-            return tourney
-
-    return None
@@ -1,5 +1,4 @@
 import asyncio
-import re
 from contextlib import suppress
 from typing import Union
 
@@ -7,7 +6,8 @@ import discord
 
 import constants
 from models import Scrim, Tourney
-from utils import find_team
+
+from .registration import RegistrationMessage
 
 
 def get_slots(slots):
@@ -81,18 +81,17 @@ async def delete_denied_message(message: discord.Message, seconds=10):
 
 async def check_scrim_requirements(bot, message: discord.Message, scrim: Scrim) -> bool:
     _bool = True
+    parsed = RegistrationMessage.of(message)
 
-    if scrim.teamname_compulsion:
-        teamname = re.search(r"team.*", message.content)
-        if not teamname or not teamname.group().strip():
-            _bool = False
-            bot.dispatch("scrim_registration_deny", message, constants.RegDeny.noteamname, scrim)
+    if scrim.teamname_compulsion and not parsed.has_team_name:
+        _bool = False
+        bot.dispatch("scrim_registration_deny", message, constants.RegDeny.noteamname, scrim)
 
-    if scrim.required_mentions and not all(map(lambda m: not m.bot, message.mentions)):
+    if scrim.required_mentions and parsed.mentions_bot:
         _bool = False
         bot.dispatch("scrim_registration_deny", message, constants.RegDeny.botmention, scrim)
 
-    elif not len(message.mentions) >= scrim.required_mentions:
+    elif not len(parsed.mention_ids) >= scrim.required_mentions:
         _bool = False
         bot.dispatch("scrim_registration_deny", message, constants.RegDeny.nomention, scrim)
 
@@ -100,7 +99,7 @@ async def check_scrim_requirements(bot, message: discord.Message, scrim: Scrim)
         _bool = False
         bot.dispatch("scrim_registration_deny", message, constants.RegDeny.banned, scrim)
 
-    elif len(message.content.splitlines()) < scrim.required_lines:
+    elif parsed.line_count < scrim.required_lines:
         _bool = False
         bot.dispatch("scrim_registration_deny", message, constants.RegDeny.nolines, scrim)
 
@@ -113,7 +112,7 @@ async def check_scrim_requirements(bot, message: discord.Message, scrim: Scrim)
         bot.dispatch("scrim_registration_deny", message, constants.RegDeny.multiregister, scrim)
 
     elif scrim.no_duplicate_name:
-        teamname = find_team(message)
+        teamname = parsed.team_name
         async for slot in scrim.assigned_slots.all():
             if slot.team_name == teamname:
                 _bool = False
@@ -642,6 +642,7 @@ class ConfigEditMenu(menus.Menu):
 
     async def update_scrim(self, **kwargs):
         await Scrim.filter(pk=self.scrim.id).update(**kwargs)
+        self.bot.scrim_dashboard.invalidate(self.scrim.guild_id, kwargs)
         await self.refresh()
 
     @menus.button(regional_indicator("A"))
@@ -670,6 +671,7 @@ class ConfigEditMenu(menus.Menu):
         )
         await inputs.safe_delete(msg)
         await self.update_scrim(registration_channel_id=channel.id)
+        self.bot.cache.tracked_channel_ids.add(channel.id)
 
     @menus.button(regional_indicator("C"))
     async def change_slotlist_channel(self, payload):
@@ -327,6 +327,7 @@ class ScrimsSlash(commands.GroupCog, name="scrims"):
                 ephemeral=True,
             )
         await scrim.save()
+        self.bot.cache.tracked_channel_ids.add(registration_channel.id)
         await self.bot.reminders.create_timer(scrim.open_time, "scrim_open", scrim_id=scrim.id)
         await self.bot.reminders.create_timer(scrim.autoclean_time, "autoclean", scrim_id=scrim.id)
 
@@ -480,12 +481,7 @@ class ScrimsSlash(commands.GroupCog, name="scrims"):
 
         scrims = [scrims] if isinstance(scrims, Scrim) else scrims
 
-        for scrim in scrims:
-            scrim = await Scrim.get_or_none(pk=scrim.id)
-            if scrim:
-                r = await scrim.banned_teams.filter(user_id=user.id).first()
-                if r:
-                    await r.delete()
+        await self.bot.scrim_bans.unban([_.id for _ in scrims], user_ids=[user.id])
 
         await interaction.followup.send(
             f"{emote.check} | {user.mention} has been unbanned from `{plural(scrims):scrim|scrims}`.",
@@ -9,7 +9,9 @@ from contextlib import suppress
 
 import discord
 
+from constants import ExportFormat
 from core import Context
+from utils import BaseSelector
 
 
 class EsportsBaseView(discord.ui.View):
@@ -61,3 +63,37 @@ class EsportsBaseView(discord.ui.View):
 
     def red_embed(self, description: str) -> discord.Embed:
         return discord.Embed(color=discord.Color.red(), title=self.title, description=description)
+
+
+class ExportFormatSelector(discord.ui.Select):
+    view: BaseSelector
+
+    def __init__(self):
+        super().__init__(
+            placeholder="Select the file format...",
+            options=[
+                discord.SelectOption(
+                    label="CSV", description="Opens in MS Excel, Libre Office or Google Sheets.", value="csv"
+                ),
+                discord.SelectOption(
+                    label="JSONL", description="One JSON record per line, for scripts & bots.", value="jsonl"
+                ),
+            ],
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+        self.view.custom_id = self.values[0]
+        self.view.stop()
+
+
+async def ask_export_format(interaction: discord.Interaction) -> typing.Optional[ExportFormat]:
+    view = BaseSelector(interaction.user.id, ExportFormatSelector)
+    view.message = await interaction.followup.send("Choose the format of the file:", view=view, ephemeral=True)
+    await view.wait()
+
+    with suppress(discord.HTTPException):
+        await view.message.delete()
+
+    if view.custom_id:
+        return ExportFormat(view.custom_id)
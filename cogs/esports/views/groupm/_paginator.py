@@ -21,14 +21,14 @@ class GroupPages(EsportsBaseView):
         self.tourney = tourney
 
         self.records: T.List[T.List["TMSlot"]] = None
-        self.record: T.List[TMSlot] = None
+        self.page = 0
 
         self.category: discord.CategoryChannel = category
         self.send_to = None
 
     async def rendor(self, msg: discord.Message):
-        self.records = await self.tourney._get_groups()
-        self.record = self.records[0]
+        self.records = await self.tourney.get_groups()
+        self.page = 0
 
         self.message = await msg.edit(embed=self.initial_embed, view=self)
 
@@ -39,16 +39,20 @@ class GroupPages(EsportsBaseView):
         except discord.HTTPException:
             await self.on_timeout()
 
+    @property
+    def record(self) -> T.List[TMSlot]:
+        return self.records[self.page]
+
     @property
     def send_channel(self):
-        index = self.records.index(self.record) + 1
+        index = self.page + 1
         if self.category:
             with suppress(StopIteration):
                 return next(c for c in self.category.text_channels if str(index) in c.name)
 
     @property
     def initial_embed(self):
-        current_page = self.records.index(self.record) + 1
+        current_page = self.page + 1
         _e = discord.Embed(color=0x00FFB3, title=f"{self.tourney.name} - Group {current_page}")
         _e.set_thumbnail(url=getattr(self.ctx.guild.icon, "url", None))
 
@@ -77,11 +81,7 @@ class GroupPages(EsportsBaseView):
     async def prev_button(self, interaction: discord.Interaction, button: discord.Button):
         await interaction.response.defer()
 
-        index = self.records.index(self.record)
-        if index == 0:
-            self.record = self.records[-1]
-        else:
-            self.record = self.records[index - 1]
+        self.page = (self.page - 1) % len(self.records)
 
         await self.refresh_view()
 
@@ -92,24 +92,20 @@ class GroupPages(EsportsBaseView):
         p = await inputs.integer_input(self.ctx, delete_after=True, timeout=30)
         await self.ctx.safe_delete(m)
 
-        if p > len(self.records) + 1 or p <= 0:
+        if p > len(self.records) or p <= 0:
             return await self.ctx.error("Invalid page number.", 4)
 
-        if self.record == self.records[p - 1]:
+        if self.page == p - 1:
             return await self.ctx.error("We are already on that page, ya dumb dumb.", 4)
 
-        self.record = self.records[p - 1]
+        self.page = p - 1
         await self.refresh_view()
 
     @discord.ui.button(emoji="<:right:878668370331983913>")
     async def next_button(self, interaction: discord.Interaction, button: discord.Button):
         await interaction.response.defer()
 
-        index = self.records.index(self.record)
-        if index == len(self.records) - 1:
-            self.record = self.records[0]
-        else:
-            self.record = self.records[index + 1]
+        self.page = (self.page + 1) % len(self.records)
 
         await self.refresh_view()
 
@@ -118,7 +114,7 @@ class GroupPages(EsportsBaseView):
         await interaction.response.defer()
 
         m = await self.ctx.simple(
-            f"Mention the role you want to give to Group {self.records.index(self.record) + 1} members."
+            f"Mention the role you want to give to Group {self.page + 1} members."
         )
         role = await inputs.role_input(self.ctx, delete_after=True)
         await self.ctx.safe_delete(m)
@@ -137,13 +133,13 @@ class GroupPages(EsportsBaseView):
             await m.edit(
                 embed=discord.Embed(
                     color=self.ctx.bot.color,
-                    description=f"Done! Given {role.mention} to group {self.records.index(self.record) + 1}.",
+                    description=f"Done! Given {role.mention} to group {self.page + 1}.",
                 ),
                 delete_after=6,
             )
         except discord.HTTPException:
             await self.ctx.simple(
-                f"Done, Given {role.mention} to group {self.records.index(self.record) + 1}.", delete_after=6
+                f"Done, Given {role.mention} to group {self.page + 1}.", delete_after=6
             )
 
     @discord.ui.button(label="Send to", row=2, style=discord.ButtonStyle.blurple)
@@ -182,14 +178,15 @@ class GroupPages(EsportsBaseView):
 
             # I am 100% sure there is a better way to do this but as long as this works, i am good.
 
-            await TGroupList.filter(tourney_id=self.tourney.id, group_number=self.records.index(self.record) + 1).delete()
+            await TGroupList.filter(tourney_id=self.tourney.id, group_number=self.page + 1).delete()
 
             await TGroupList.create(
                 message_id=m.id,
                 channel_id=c.id,
                 tourney_id=self.tourney.id,
-                group_number=self.records.index(self.record) + 1,
+                group_number=self.page + 1,
             )
+            self.ctx.bot.cache.tourney_message_ids.add(m.id)
         except Exception as e:
             await self.ctx.error(e)
 
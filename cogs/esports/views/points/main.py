@@ -63,15 +63,14 @@ class PointsTable(QuotientView):
         if not all((kills, placepts)):
             return await self.ctx.error("Invalid input", 5)
 
-        self.teams.append(
-            Team(
-                name=modal.team_name.value,
-                matches=modal.matches.value,
-                kills=kills,
-                placepts=placepts,
-                totalpts=kills + placepts,
-            )
+        team = Team(
+            name=modal.team_name.value,
+            matches=modal.matches.value,
+            kills=kills,
+            placepts=placepts,
+            totalpts=kills + placepts,
         )
+        self.teams.append(team)
         await self.refresh_view()
 
     @discord.ui.button(label="Remove Team")
@@ -85,9 +84,9 @@ class PointsTable(QuotientView):
         v.message = await inter.followup.send("", view=v, ephemeral=True)
         await v.wait()
 
-        for _ in self.teams:
-            if str(_.id) in v.custom_id:
-                self.teams.remove(_)
+        # the selector sets custom_id to the selected team ids, it's unset if nothing was selected in time.
+        selected = set(getattr(v, "custom_id", None) or ())
+        self.teams = [_ for _ in self.teams if str(_.id) not in selected]
 
         await self.refresh_view()
 
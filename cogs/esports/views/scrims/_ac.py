@@ -6,7 +6,7 @@ import discord
 
 from constants import AutocleanType
 from core import Context
-from models import ArrayAppend, ArrayRemove, Scrim, Timer
+from models import ArrayAppend, ArrayRemove, Scrim
 from utils import keycap_digit as kd
 from utils import time_input
 
@@ -109,9 +109,7 @@ class OnThree(ScrimsButton):
         await self.view.ctx.safe_delete(m)
         self.view.record.autoclean_time = t
 
-        await Timer.filter(extra={"args": [], "kwargs": {"scrim_id": self.view.record.id}}, event="autoclean").delete()
-
-        await self.view.bot.reminders.create_timer(t, "autoclean", scrim_id=self.view.record.id)
+        await self.view.bot.reminders.create_timer(t, "autoclean", scrim_id=self.view.record.id, replace=True)
 
         await self.view.record.make_changes(autoclean_time=t)
         await self.view.refresh_view()
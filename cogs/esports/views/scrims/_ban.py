@@ -12,6 +12,7 @@ from core import Context, QuotientView
 from models import BanLog, BannedTeam, Scrim
 from utils import discord_timestamp, emote, get_chunks, plural, truncate_string
 
+from ..base import ask_export_format
 from ._base import ScrimsButton, ScrimsView
 from ._btns import Discard
 from ._pages import *
@@ -62,6 +63,7 @@ class ScrimBanManager(ScrimsView):
         self.add_item(Ban())
         self.add_item(UnBan())
         self.add_item(UnbanAll())
+        self.add_item(ExportBans())
 
         if await Scrim.filter(guild_id=self.ctx.guild.id).count() >= 2:
             self.add_item(Prev(self.ctx, 2))
@@ -112,27 +114,9 @@ class Ban(ScrimsButton):
                 while self.view.bot.current_time > expires:
                     expires = expires + timedelta(hours=24)
 
-        count = 0
-        for user_id in user_ids:
-            if await self.view.record.banned_teams.filter(user_id=user_id).exists():
-                continue
-
-            b = await BannedTeam.create(user_id=user_id, expires=expires, reason=modal.m_reason.value)
-            await self.view.record.banned_teams.add(b)
-
-            if banlog := await BanLog.get_or_none(guild_id=interaction.guild_id):
-                await banlog.log_ban(user_id, interaction.user, [self.view.record], modal.m_reason.value, expires)
-
-            if expires:
-                await self.view.bot.reminders.create_timer(
-                    expires,
-                    "scrim_ban",
-                    scrims=[self.view.record.id],
-                    user_id=user_id,
-                    mod=interaction.user.id,
-                    reason=modal.m_reason.value,
-                )
-            count += 1
+        count = await self.view.bot.scrim_bans.ban(
+            user_ids, [self.view.record], mod=interaction.user, reason=modal.m_reason.value, expires=expires
+        )
 
         await self.view.ctx.success(f"Successfuly banned `{plural(count):user|users}` from {self.view.record}.", 6)
         return await self.view.refresh_view()
@@ -154,19 +138,11 @@ class UnBan(ScrimsButton):
         v.message = await interaction.followup.send("", view=v, ephemeral=True)
         await v.wait()
         if v.custom_id:
-            banlog = await BanLog.get_or_none(guild_id=interaction.guild_id)
-
-            for b in v.custom_id:
-                slot = await BannedTeam.get_or_none(pk=b)
-                if not slot:
-                    continue
+            unbanned = await self.view.bot.scrim_bans.unban([self.view.record.pk], team_ids=map(int, v.custom_id))
 
-                await slot.delete()
-
-                if banlog:
-                    await banlog.log_unban(
-                        slot.user_id, self.view.ctx.author, [self.view.record], "```No reason given```"
-                    )
+            if banlog := await BanLog.get_or_none(guild_id=interaction.guild_id):
+                for user_id in unbanned:
+                    await banlog.log_unban(user_id, self.view.ctx.author, [self.view.record], "```No reason given```")
 
         await self.view.ctx.success(f"Successfully unbanned `{plural(v.custom_id):user|users}`.", 6)
         return await self.view.refresh_view()
@@ -187,16 +163,31 @@ class UnbanAll(ScrimsButton):
         if not prompt:
             return await self.view.ctx.error("OK! Aborting.", 4)
 
-        count = 0
-        for scrim in scrims:
-            bans = await scrim.banned_teams.all()
-            await BannedTeam.filter(pk__in=(_.pk for _ in bans)).delete()
-            count += len(bans)
+        unbanned = await self.view.bot.scrim_bans.unban([_.pk for _ in scrims])
+        count = len(unbanned)
 
         await self.view.ctx.success(f"Unbanned `{plural(count):user|users}` from `{plural(len(scrims)):scrim|scrims}`", 5)
         return await self.view.refresh_view()
 
 
+class ExportBans(ScrimsButton):
+    def __init__(self):
+        super().__init__(label="Export", emoji="📥", style=discord.ButtonStyle.grey)
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        if not await self.view.record.banned_teams.all().exists():
+            return await self.view.ctx.error("No banned user found.", 5)
+
+        if not (fmt := await ask_export_format(interaction)):
+            return
+
+        await interaction.followup.send(
+            f"Ban list of {self.view.record}:", file=await self.view.record.export_bans(fmt), ephemeral=True
+        )
+
+
 class MainInput(discord.ui.Modal, title="Ban Time & Reason"):
     m_time = discord.ui.TextInput(
         label="Ban Duration (Optional)",
@@ -45,6 +45,7 @@ class RegChannel(ScrimsButton):
             return await self.ctx.error("That channel is already in use for another scrim.", 5)
 
         self.view.record.registration_channel_id = channel.id
+        self.ctx.bot.cache.tracked_channel_ids.add(channel.id)
 
         if not self.view.record.slotlist_channel_id:
             self.view.record.slotlist_channel_id = channel.id
@@ -8,6 +8,7 @@ from core import Context
 from models import Scrim
 from utils import emote, inputs
 
+from ..base import ask_export_format
 from ._base import ScrimsView
 from ._formatter import show_slotlist_formatter
 
@@ -39,6 +40,12 @@ class ManageSlotlist(discord.ui.Select):
                     emoji=emote.edit,
                     value="edit",
                 ),
+                discord.SelectOption(
+                    label="Export Slots",
+                    description="Download registered teams as a file.",
+                    emoji="📥",
+                    value="export",
+                ),
                 discord.SelectOption(
                     label="Go Back",
                     description="Move back to Main Menu",
@@ -89,6 +96,14 @@ class ManageSlotlist(discord.ui.Select):
 
             return await self.ctx.success("Click `Edit` button under [slotlist message]({0}).".format(msg.jump_url), 6)
 
+        elif selected == "export":
+            if not await self.record.assigned_slots.all().exists():
+                return await self.ctx.error("No registrations found in {0}.".format(self.record), 5)
+
+            if fmt := await ask_export_format(interaction):
+                file = await self.record.export_slots(fmt)
+                await interaction.followup.send("Registrations of {0}:".format(self.record), file=file, ephemeral=True)
+
         elif selected == "back":
             from .main import ScrimsMain
 
@@ -32,7 +32,7 @@ class ScrimsMain(ScrimsView):
         _e = discord.Embed(color=0x00FFB3, title="Quotient's Smart Scrims Manager", url=self.ctx.config.SERVER_LINK)
 
         to_show = []
-        for idx, _r in enumerate(await Scrim.filter(guild_id=self.ctx.guild.id).order_by("open_time"), start=1):
+        for idx, _r in enumerate(await self.ctx.bot.scrim_dashboard.scrims(self.ctx.guild.id), start=1):
             to_show.append(
                 f"`{idx:02}.` {(emote.xmark,emote.check)[_r.stoggle]}: {str(_r)} - {discord_timestamp(_r.open_time,'t')}"
             )
@@ -2,9 +2,9 @@ from contextlib import suppress
 from typing import List, Union
 
 import discord
-from aiocache import cached
 
 from core.Context import Context
+from core.dashboard import ScrimSummary
 from core.views import QuotientView
 from models import Scrim
 from utils import emote, split_list
@@ -67,15 +67,17 @@ class ScrimSelectorView(discord.ui.View):
                 await self.message.delete()
 
 
-async def prompt_selector(ctx: Context, scrims: List[Scrim] = None, *, placeholder: str = None, multi: bool = True):
+async def prompt_selector(
+    ctx: Context, scrims: List[Union[Scrim, ScrimSummary]] = None, *, placeholder: str = None, multi: bool = True
+):
     placeholder = placeholder or "Choose {0} to continue...".format("Scrims" if multi else "a Scrim")
 
-    scrims = scrims or await Scrim.filter(guild_id=ctx.guild.id).order_by("open_time")
+    scrims = scrims or await ctx.bot.scrim_dashboard.scrims(ctx.guild.id)
     if not scrims:
         return None
 
     if len(scrims) == 1:
-        return scrims[0]
+        return scrims[0] if isinstance(scrims[0], Scrim) else await Scrim.get_or_none(pk=scrims[0].id)
 
     view = QuotientView(ctx)
     if len(scrims) <= 25:
@@ -102,7 +104,7 @@ async def prompt_selector(ctx: Context, scrims: List[Scrim] = None, *, placehold
 class Select(discord.ui.Select):
     view: QuotientView
 
-    def __init__(self, placeholder: str, scrims: List[Scrim], multi: bool):
+    def __init__(self, placeholder: str, scrims: List[Union[Scrim, ScrimSummary]], multi: bool):
         _options = []
         for scrim in scrims:
             _options.append(
@@ -123,10 +125,9 @@ class Select(discord.ui.Select):
         self.view.stop()
 
 
-@cached(ttl=10)
 async def scrim_position(scrim_id: int, guild_id: int):
     """
     returns the position of scrim in all scrims of a server
     """
-    scrims = await Scrim.filter(guild_id=guild_id).order_by("open_time")
-    return str(scrims.index(next(s for s in scrims if s.pk == scrim_id)) + 1), len(scrims).__str__()
+    position, total = await Scrim.bot.scrim_dashboard.position(guild_id, scrim_id)
+    return str(position), str(total)
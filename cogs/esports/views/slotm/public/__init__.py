@@ -12,12 +12,12 @@ __all__ = ("ScrimsSlotmPublicView",)
 class ScrimsSlotmPublicView(d.ui.View):
     children: T.List[d.ui.Button]
 
-    def __init__(self, record: ScrimsSlotManager):
+    def __init__(self, record: ScrimsSlotManager, *, claimable: T.Optional[T.List[Scrim]] = None):
         super().__init__(timeout=None)
 
         self.record = record
         self.bot = record.bot
-        self.claimable: T.List[Scrim] = []
+        self.claimable: T.List[Scrim] = claimable if claimable is not None else []
 
         from ._cancel import ScrimsCancel
         from ._claim import ScrimsClaim
@@ -31,7 +31,8 @@ class ScrimsSlotmPublicView(d.ui.View):
             IdpTransfer(label="Transfer IDP Role", custom_id="scrims_transfer_idp_role", style=d.ButtonStyle.green)
         )
 
-        self.bot.loop.create_task(self.__refresh_cache())
+        if claimable is None:
+            self.bot.loop.create_task(self.__refresh_cache())
 
     async def on_error(self, interaction: d.Interaction, error: Exception, item: d.ui.Item[T.Any]) -> None:
         if isinstance(error, d.NotFound):
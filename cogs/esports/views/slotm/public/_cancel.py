@@ -5,7 +5,7 @@ from contextlib import suppress
 
 import discord
 
-from models import ArrayAppend, AssignedSlot, Scrim
+from models import AssignedSlot, Scrim
 from utils import BaseSelector, Prompt, emote, plural
 
 from ..public import ScrimsSlotmPublicView
@@ -50,21 +50,25 @@ class ScrimsCancel(discord.ui.Button):
             if not scrim:
                 continue
 
-            if not await scrim.assigned_slots.filter(user_id=interaction.user.id, pk__not=slot_id).exists():
+            ledger = await self.view.bot.slot_ledgers.get(scrim)
+            slot_id = int(slot_id)
+            if not ledger.holds(interaction.user.id, slot_id):
+                continue
+
+            if len(ledger.user_slots(interaction.user.id)) == 1:
                 with suppress(discord.HTTPException):
                     if interaction.user._roles.has(scrim.role_id):
                         await interaction.user.remove_roles(discord.Object(id=scrim.role_id))
 
-            _slot = await AssignedSlot.filter(pk=slot_id).first()
-
             await AssignedSlot.filter(pk=slot_id).update(team_name="Cancelled Slot")
             await scrim.refresh_slotlist_message()
-            await _slot.delete()
 
-            await Scrim.filter(pk=scrim_id).update(available_slots=ArrayAppend("available_slots", _slot.num))
+            _slot = await ledger.cancel(interaction.user.id, slot_id)
+            if not _slot:
+                continue
 
             link = f"https://discord.com/channels/{scrim.guild_id}/{interaction.channel_id}/{self.view.record.message_id}"
-            await scrim.dispatch_reminders(interaction.channel, link)
+            self.view.bot.loop.create_task(scrim.dispatch_reminders(interaction.channel, link))
             with suppress(discord.HTTPException, AttributeError):
                 user = interaction.user
                 await scrim.logschan.send(
@@ -76,7 +80,7 @@ class ScrimsCancel(discord.ui.Button):
                 )
 
         await m.edit(content=f"Alright, Cancelled your `{p_str}`.")
-        await self.view.record.refresh_public_message()
+        await self.view.record.refresh_public_message(slots_only=True)
 
 
 class CancelSlotSelector(discord.ui.Select):
@@ -1,19 +1,16 @@
 from __future__ import annotations
 
-import asyncio
 import re
 import typing as T
 from contextlib import suppress
 
 import discord
 
-from models import ArrayRemove, AssignedSlot, Scrim, ScrimsSlotManager
+from models import AssignedSlot, Scrim, ScrimsSlotManager
 from utils import BaseSelector, emote
 
 from ..public import ScrimsSlotmPublicView
 
-claim_lock = asyncio.Lock()
-
 __all__ = ("ScrimsClaim",)
 #!TODO: do some processing on the team name
 
@@ -56,29 +53,22 @@ class ClaimSlotModal(discord.ui.Modal, title="Claim Scrims Slot"):
         if not scrim:
             return await interaction.followup.send("Scrim not found.", ephemeral=True)
 
-        if await scrim.banned_teams.filter(user_id=interaction.user.id).exists():
+        if interaction.user.id in await scrim.banned_user_ids():
             return await interaction.followup.send("You are banned from this scrim.", ephemeral=True)
 
-        if not self.multiple_slots:
-            if await scrim.assigned_slots.filter(user_id=interaction.user.id).exists():
-                return await interaction.followup.send("You already have a slot in this scrim.", ephemeral=True)
-
-        async with claim_lock:
-            await scrim.refresh_from_db(("available_slots",))
-
-            if num not in scrim.available_slots:
-                return await interaction.followup.send("Somebody claimed this slot before you.", ephemeral=True)
-
-            await Scrim.filter(pk=scrim_id).update(available_slots=ArrayRemove("available_slots", num))
+        ledger = await scrim.bot.slot_ledgers.get(scrim)
 
-            scrim.bot.loop.create_task(self.add_role(interaction.user, scrim.role_id))
+        if not self.multiple_slots and ledger.user_slots(interaction.user.id):
+            return await interaction.followup.send("You already have a slot in this scrim.", ephemeral=True)
 
-            user_id = interaction.user.id
-            _slot = await AssignedSlot.create(num=num, user_id=user_id, members=[user_id], team_name=team_name)
-            await scrim.assigned_slots.add(_slot)
+        user_id = interaction.user.id
+        _slot = await ledger.claim(scrim, user_id, num, team_name, multiple_slots=self.multiple_slots)
+        if not _slot:
+            return await interaction.followup.send("Somebody claimed this slot before you.", ephemeral=True)
 
-            scrim.bot.loop.create_task(self.proccess_claim(scrim, _slot))
-            await interaction.followup.send(f"{emote.check} Slot claimed successfully.", ephemeral=True)
+        scrim.bot.loop.create_task(self.add_role(interaction.user, scrim.role_id))
+        scrim.bot.loop.create_task(self.proccess_claim(scrim, _slot))
+        await interaction.followup.send(f"{emote.check} Slot claimed successfully.", ephemeral=True)
 
     async def add_role(self, user: discord.Member, role_id: int):
         with suppress(discord.HTTPException):
@@ -88,7 +78,7 @@ class ClaimSlotModal(discord.ui.Modal, title="Claim Scrims Slot"):
     async def proccess_claim(self, scrim: Scrim, slot: AssignedSlot):
         await scrim.refresh_slotlist_message()
 
-        await ScrimsSlotManager.refresh_guild_message(scrim.guild_id, scrim.id)
+        await ScrimsSlotManager.refresh_guild_message(scrim.guild_id, scrim.id, slots_only=True)
 
         with suppress(AttributeError, discord.HTTPException):
             await scrim.slotlist_channel.send(f"{slot.team_name} ({slot.owner.mention}) -> Claimed Slot {slot.num}")
@@ -73,6 +73,7 @@ class IdpTransfer(discord.ui.Button):
             user_id = int(users_view.custom_id)
 
         await AssignedSlot.filter(pk=_slot.pk).update(user_id=user_id)
+        self.view.bot.slot_ledgers.discard(scrim.pk)
         self.view.bot.loop.create_task(interaction.user.remove_roles(discord.Object(scrim.role_id)))
         self.view.bot.loop.create_task(interaction.guild.get_member(user_id).add_roles(discord.Object(scrim.role_id)))
         return await interaction.followup.send(
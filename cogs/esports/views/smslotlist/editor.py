@@ -89,6 +89,7 @@ class ScrimsSlotlistEditor(discord.ui.View):
                 return await interaction.followup.send("Team name cannot be empty.", ephemeral=True)
 
             await AssignedSlot.filter(pk=slot_id).update(team_name=team_name, user_id=user_id)
+            self.bot.slot_ledgers.discard(self.scrim.pk)
 
             if _slot and _slot.user_id:
                 if not await self.scrim.assigned_slots.filter(user_id=_slot.user_id).exists():
@@ -128,6 +129,7 @@ class ScrimsSlotlistEditor(discord.ui.View):
             await self.scrim.refresh_slotlist_message(self.slotlist_message)
 
             await AssignedSlot.filter(pk=slot_id).delete()
+            self.bot.slot_ledgers.discard(self.scrim.pk)
 
             _e = discord.Embed(color=0x00FFB3, description="Team Removed from slotlist.")
 
@@ -184,6 +186,7 @@ class ScrimsSlotlistEditor(discord.ui.View):
             _slot = await AssignedSlot.create(num=slot_id, team_name=team_name, user_id=user_id)
             await self.scrim.assigned_slots.add(_slot)
             await self.scrim.make_changes(available_slots=ArrayRemove("available_slots", slot_id))
+            self.bot.slot_ledgers.discard(self.scrim.pk)
 
             await self.scrim.refresh_slotlist_message(self.slotlist_message)
 
@@ -9,6 +9,7 @@ from utils import BaseSelector, Prompt, inputs
 from utils import keycap_digit as kd
 from utils import truncate_string
 
+from ..base import ask_export_format
 from ._type import SStypeSelector
 
 
@@ -51,6 +52,7 @@ class SetRole(discord.ui.Button):
 
         await self.ctx.safe_delete(_m)
         self.view.record.role_id = role.id
+        self.ctx.bot.cache.tracked_role_ids.add(role.id)
 
         await self.view.refresh_view()
 
@@ -206,6 +208,21 @@ class SuccessMessage(discord.ui.Button):
         await self.view.refresh_view()
 
 
+class ExportButton(discord.ui.Button):
+    def __init__(self, record: SSVerify):
+        super().__init__(label="Export", emoji="📥", style=discord.ButtonStyle.grey)
+        self.record = record
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        if not await self.record.data.all().exists():
+            return await interaction.followup.send("No screenshots were submitted yet.", ephemeral=True)
+
+        if fmt := await ask_export_format(interaction):
+            await interaction.followup.send(file=await self.record.export(fmt), ephemeral=True)
+
+
 class DeleteButton(discord.ui.Button):
     def __init__(self, ctx: Context, record: SSVerify):
         super().__init__(label="Delete ssverify", style=discord.ButtonStyle.red)
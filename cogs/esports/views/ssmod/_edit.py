@@ -94,6 +94,7 @@ class SSmodEditor(EsportsBaseView):
         self.add_item(PageName(ctx))
         self.add_item(PageLink(ctx))
         self.add_item(AllowSame())
+        self.add_item(ExportButton(self.record))
 
         self.add_item(SuccessMessage(ctx))
         self.add_item(DeleteButton(ctx, self.record))
@@ -51,6 +51,7 @@ class RegChannel(TourneyButton):
         self.view.record.registration_channel_id = channel.id
 
         self.ctx.bot.cache.tourney_channels.add(channel.id)
+        self.ctx.bot.cache.tracked_channel_ids.add(channel.id)
 
         if not self.view.record.confirm_channel_id:
             with suppress(StopIteration, AttributeError):
@@ -428,6 +429,8 @@ class SaveTourney(TourneyButton):
         self.view.record.slotm_message_id = message.id
 
         await self.view.record.save()
+        self.ctx.bot.cache.tourney_message_ids.add(message.id)
+        self.ctx.bot.cache.tracked_channel_ids.add(message.channel.id)
         self.ctx.bot.loop.create_task(self.view.record.setup_logs())
 
         self.view.stop()
@@ -57,6 +57,7 @@ class TourneyEditor(TourneyView):
         del _d["banned_users"]
 
         await Tourney.filter(pk=self.record.pk).update(**_d)
+        self.ctx.bot.cache.forget_tourney_reactions(self.record.pk)
 
         _e = await self.initial_message()
 
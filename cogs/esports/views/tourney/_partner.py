@@ -1,6 +1,7 @@
 import discord
 
 from core import Context
+from core.cache import PartnerChannel
 from models import MediaPartner, Tourney
 from utils import aenumerate, channel_input, integer_input
 
@@ -92,7 +93,7 @@ class MediaPartnerView(EsportsBaseView):
 
         partner = await MediaPartner.create(tourney_id=tourney.id, channel_id=channel.id)
         await self.tourney.media_partners.add(partner)
-        self.bot.cache.media_partner_channels.add(channel.id)
+        self.bot.cache.media_partner_channels[channel.id] = PartnerChannel(self.tourney.id, tourney.id)
         await self.__refresh_embed()
 
     @discord.ui.button(style=discord.ButtonStyle.red, label="Remove")
@@ -110,7 +111,7 @@ class MediaPartnerView(EsportsBaseView):
         if not await self.tourney.media_partners.filter(pk=_channel.id).exists():
             return await self.error_embed("This is not a media-partner channel of {0}".format(self.tourney))
 
-        self.bot.cache.media_partner_channels.discard(_channel.id)
+        self.bot.cache.media_partner_channels.pop(_channel.id, None)
         await MediaPartner.filter(pk=_channel.id).delete()
         await self.ctx.success(f"Removed {_channel.mention} from Media-Partner Channels.", 4)
         await self.__refresh_embed()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from functools import partial
+from typing import TYPE_CHECKING, Iterator, List
 
 from models import Guild, Tourney
 
@@ -17,8 +18,9 @@ from discord.ext import commands
 from humanize import precisedelta
 
 import config
+from constants import OutboundPriority
 from core import Context
-from utils import QuoRole, emote, get_chunks, inputs, truncate_string
+from utils import QuoRole, emote, inputs, truncate_string
 
 
 class TourneyGroupManager(EsportsBaseView):
@@ -159,8 +161,10 @@ class TourneyGroupManager(EsportsBaseView):
                     if member:
                         counter += 1
                         if not role in member.roles:
-                            self.bot.loop.create_task(
-                                member.add_roles(role, reason=f"Given by {self.ctx.author} for tourney grouping")
+                            self.bot.outbound.submit(
+                                OutboundPriority.role,
+                                self.ctx.guild.id,
+                                partial(member.add_roles, role, reason=f"Given by {self.ctx.author} for tourney grouping"),
                             )
 
                 _e.description += f"{emote.check} {counter} people are given {role.mention}\n"
@@ -198,6 +202,24 @@ class GroupListView(EsportsBaseView):
         self.channel = channel
         self.embeds = embeds
 
+    @property
+    def messages(self) -> Iterator[List[discord.Embed]]:
+        """
+        Group embeds packed into as few messages as discord allows (10 embeds, 6000 characters),
+        they have to go one after the other to keep the groups in order.
+        """
+        _chunk, _size = [], 0
+        for embed in self.embeds:
+            if _chunk and (len(_chunk) == 10 or _size + len(embed) > 6000):
+                yield _chunk
+                _chunk, _size = [], 0
+
+            _chunk.append(embed)
+            _size += len(embed)
+
+        if _chunk:
+            yield _chunk
+
     @staticmethod
     def initial_embed(tourney: Tourney) -> discord.Embed:
         _e = discord.Embed(
@@ -230,7 +252,7 @@ class GroupListView(EsportsBaseView):
             return await self.error_embed(e)
 
         m = await self.ctx.simple(f"Publishing, please wait {emote.loading}")
-        for _chunk in get_chunks(self.embeds, 2):
+        for _chunk in self.messages:
             await _webhook.send(
                 embeds=_chunk,
                 username=self.ctx.guild.name,
@@ -246,7 +268,7 @@ class GroupListView(EsportsBaseView):
         await interaction.response.defer(ephemeral=True)
 
         m = await self.ctx.simple(f"Publishing, please wait {emote.loading}")
-        for _chunk in get_chunks(self.embeds, 2):
+        for _chunk in self.messages:
             await self.channel.send(embeds=_chunk)
 
         await self.ctx.safe_delete(m)
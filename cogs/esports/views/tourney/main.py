@@ -15,11 +15,12 @@ import discord
 from discord import ButtonStyle
 from tortoise.expressions import Q
 
+from constants import ExportFormat
 from core import Context, QuotientView
 from models import Tourney
 from utils import emote, member_input, plural, truncate_string
 
-from ..base import EsportsBaseView
+from ..base import EsportsBaseView, ask_export_format
 from ..groupm import TourneyGroupManager
 from ._buttons import DiscardButton
 from ._editor import TourneyEditor
@@ -219,8 +220,8 @@ class TourneyManager(EsportsBaseView):
 
         tourney = await Tourney.prompt_selector(self.ctx, placeholder="Select a tournament to add slot.")
         if tourney:
-            last_slot = await tourney.assigned_slots.order_by("-num").first()
-            slot = TMSlot(leader_id=leader.id, team_name=team_name, num=last_slot.num + 1 if last_slot else 1)
+            ledger = await self.bot.tourney_ledgers.get(tourney)
+            slot = TMSlot(leader_id=leader.id, team_name=team_name, num=ledger.claim(leader.id, team_name))
 
             _e = discord.Embed(color=0x00FFB3)
             _e.description = f"**{slot.num}) NAME: {slot.team_name.upper()}**\n"
@@ -230,17 +231,23 @@ class TourneyManager(EsportsBaseView):
                 icon_url=getattr(self.ctx.author.display_avatar, "url", None),
             )
 
-            m = await tourney.confirm_channel.send(leader.mention, embed=_e)
-            slot.confirm_jump_url = m.jump_url
+            try:
+                m = await tourney.confirm_channel.send(leader.mention, embed=_e)
+                slot.confirm_jump_url = m.jump_url
+
+                await slot.save()
+            finally:
+                if slot.pk is None:  # claimed but not saved, give the count back.
+                    self.bot.tourney_ledgers.release(tourney.id, slot.leader_id, slot.team_name)
 
-            await slot.save()
             await tourney.assigned_slots.add(slot)
+            self.bot.tourney_groups.bump(tourney.id)
 
             await leader.add_roles(tourney.role)
 
             await self.ctx.success(f"Added slot successfully, [Click Here]({m.jump_url}) ", 4)
 
-            if tourney.total_slots <= await tourney.assigned_slots.all().count():
+            if ledger.is_full(tourney):
                 await tourney.end_process()
 
     @discord.ui.button(style=discord.ButtonStyle.blurple, label="Slot-Manager channel")
@@ -270,6 +277,8 @@ class TourneyManager(EsportsBaseView):
         slotm_message = await slotm_channel.send(embed=_e, view=_view)
 
         await Tourney.get(pk=tourney.id).update(slotm_channel_id=slotm_channel.id, slotm_message_id=slotm_message.id)
+        self.bot.cache.tourney_message_ids.add(slotm_message.id)
+        self.bot.cache.tracked_channel_ids.add(slotm_channel.id)
         await self.ctx.success(f"Slotmanager channel for {tourney} created successfully. ({slotm_channel.mention})", 7)
 
     @discord.ui.button(style=discord.ButtonStyle.green, label="Media-Partner")
@@ -294,21 +303,24 @@ class TourneyManager(EsportsBaseView):
         #     )
 
         tourney = await Tourney.prompt_selector(self.ctx, placeholder="Select a tournament to download data...")
-        if tourney:
+        if tourney and (fmt := await ask_export_format(interaction)):
             _m = await self.ctx.simple(f"Crunching the data for you.... {emote.loading}")
             await asyncio.sleep(1)
 
             _log_chan = await self.bot.getch(self.bot.get_channel, self.bot.fetch_channel, 899185364500099083)
-            m: discord.Message = await _log_chan.send(file=await tourney.get_csv())
+            m: discord.Message = await _log_chan.send(file=await tourney.export(fmt))
 
             e = discord.Embed(
                 color=self.bot.color,
                 description=(
-                    f"**[Click Here]({m.attachments[0].url})** to download `.csv` file "
-                    f"containing all the registration records of {tourney}\n\n"
-                    "*`To Open`: Use Microsoft Excel, Libre Office or any other softwares that is compatible with .csv files.*"
+                    f"**[Click Here]({m.attachments[0].url})** to download `.{fmt.value}` file "
+                    f"containing all the registration records of {tourney}"
                 ),
             )
+            if fmt == ExportFormat.csv:
+                e.description += (
+                    "\n\n*`To Open`: Use Microsoft Excel, Libre Office or any other softwares that is compatible with .csv files.*"
+                )
 
             with suppress(discord.HTTPException):
                 await _m.edit(embed=e, delete_after=10)
@@ -118,6 +118,8 @@ class TourneySlotManager(discord.ui.View):
                     self.bot.loop.create_task(member.remove_roles(self.tourney.role))
 
             await TMSlot.filter(pk=slot.id).delete()
+            self.bot.tourney_groups.bump(self.tourney.id)
+            self.bot.tourney_ledgers.release(self.tourney.id, slot.leader_id, slot.team_name, slot.message_id)
             return await interaction.followup.send(f"{emote.check} | Your slot was removed.", ephemeral=True)
 
     @discord.ui.button(style=discord.ButtonStyle.green, custom_id="tourney-slot-info", label="My Groups")
@@ -189,7 +191,16 @@ class TourneySlotManager(discord.ui.View):
 
                 await team_name.delete()
 
-                await TMSlot.filter(pk=_id).update(team_name=truncate_string(team_name.content, 30))
+                slot = await TMSlot.get_or_none(pk=_id)
+                if not slot:
+                    return await interaction.followup.send(
+                        embed=self.red_embed("Slot is already deleted."), ephemeral=True
+                    )
+
+                new_name = truncate_string(team_name.content, 30)
+                await TMSlot.filter(pk=slot.id).update(team_name=new_name)
+                self.bot.tourney_groups.bump(self.tourney.id)
+                self.bot.tourney_ledgers.rename(self.tourney.id, slot.team_name, new_name)
                 return await interaction.followup.send(f"{emote.check} | Your team name was changed.", ephemeral=True)
 
     @discord.ui.button(emoji="<:swap:954022423542509598>", label="Swap Groups", custom_id="tourney-swap-groups")
@@ -301,6 +312,7 @@ class TourneySlotManager(discord.ui.View):
 
         await TMSlot.get(pk=first_slot.id).update(num=second_slot.num)
         await TMSlot.get(pk=second_slot.id).update(num=first_slot.num)
+        self.bot.tourney_groups.bump(self.tourney.id)
 
         await inter.followup.send(
             f"{emote.check} | Groups were swapped. Press 'Refresh' button under grouplist.", ephemeral=True
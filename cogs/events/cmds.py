@@ -5,10 +5,7 @@ import typing
 if typing.TYPE_CHECKING:
     from core import Quotient
 
-import asyncio
-from collections import defaultdict
 from contextlib import suppress
-from datetime import timedelta
 
 import discord
 
@@ -16,22 +13,15 @@ from core import Cog, Context, cooldown
 from models import ArrayRemove, Autorole, Commands
 
 
-class UserCommandLimits(defaultdict):
-    def __missing__(self, key):
-        r = self[key] = cooldown.QuotientRatelimiter(2, 10)
-        return r
-
-
 class CmdEvents(Cog):
     def __init__(self, bot: Quotient):
         self.bot = bot
 
-        self.command_ratelimited_users = {}
-        self.command_ratelimiter = UserCommandLimits(cooldown.QuotientRatelimiter)
+        self.command_ratelimiter = cooldown.QuotientRatelimiter(2, 10, name="commands")
+        self.ratelimit_notices = cooldown.QuotientRatelimiter(1, 10, name="ratelimit_notices")  # tell a user once per window
 
     async def bot_check(self, ctx: Context):
         author = ctx.author
-        message = ctx.message
 
         if author.id in self.bot.config.DEVS:
             return True
@@ -42,16 +32,11 @@ class CmdEvents(Cog):
         if author.id in self.bot.cache.blocked_ids or ctx.guild.id in self.bot.cache.blocked_ids:
             return False
 
-        if retry_after := self.command_ratelimiter[message.author].is_ratelimited(message.author):
-            if author.id in self.command_ratelimited_users:
-                return
-
-            self.command_ratelimited_users[author.id] = self.bot.current_time + timedelta(seconds=retry_after)
-            self.bot.loop.create_task(self.remove_from_ratelimited_users(author.id, retry_after))
-
-            await ctx.error(
-                f"You are being ratelimited for using commands too fast. \n\n**Try again after `{retry_after:.2f} seconds`**."
-            )
+        if retry_after := self.command_ratelimiter.is_ratelimited(author):
+            if not self.ratelimit_notices.is_ratelimited(author):
+                await ctx.error(
+                    f"You are being ratelimited for using commands too fast. \n\n**Try again after `{retry_after:.2f} seconds`**."
+                )
             return False
 
         if self.bot.lockdown is True:
@@ -69,10 +54,6 @@ class CmdEvents(Cog):
 
         return True
 
-    async def remove_from_ratelimited_users(self, user_id: int, after: int):
-        await asyncio.sleep(after)
-        self.command_ratelimited_users.pop(user_id, None)
-
     @Cog.listener()
     async def on_command_completion(self, ctx: Context):
         if not ctx.command or not ctx.guild:
@@ -80,7 +61,7 @@ class CmdEvents(Cog):
 
         cmd = ctx.command.qualified_name
 
-        await Commands.create(
+        record = await Commands.create(
             guild_id=ctx.guild.id,
             channel_id=ctx.channel.id,
             user_id=ctx.author.id,
@@ -88,6 +69,7 @@ class CmdEvents(Cog):
             prefix=ctx.prefix,
             failed=ctx.command_failed,
         )
+        self.bot.stats.record_command(record.pk, ctx.guild.id, ctx.author.id)
 
     @Cog.listener(name="on_member_join")
     async def on_autorole(self, member: discord.Member):
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing
-from collections import defaultdict
 
 if typing.TYPE_CHECKING:
     from core import Quotient
@@ -17,16 +16,10 @@ from core import Cog, Context, cooldown
 from models import Guild
 
 
-class MentionLimits(defaultdict):
-    def __missing__(self, key):
-        r = self[key] = cooldown.QuotientRatelimiter(2, 12)
-        return r
-
-
 class MainEvents(Cog, name="Main Events"):
     def __init__(self, bot: Quotient) -> None:
         self.bot = bot
-        self.mentions_limiter = MentionLimits(cooldown.QuotientRatelimiter)
+        self.mentions_limiter = cooldown.QuotientRatelimiter(2, 12, name="mentions")
 
     # incomplete?, I know
     @Cog.listener()
@@ -40,13 +33,25 @@ class MainEvents(Cog, name="Main Events"):
             }
             self.bot.loop.create_task(guild.chunk())
 
+        await self.bot.guild_reconciler.joined(guild.id)
+
+    @Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        await self.bot.guild_reconciler.left(guild.id)
+
+    @Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.bot.fetches.member_joined(member)
+
     @Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
+        self.bot.fetches.message_created(message)
+
         if message.author.bot or message.guild is None:
             return
 
         if re.match(f"^<@!?{self.bot.user.id}>$", message.content):
-            if self.mentions_limiter[message.author].is_ratelimited(message.author):
+            if self.mentions_limiter.is_ratelimited(message.author):
                 return
 
             ctx: Context = await self.bot.get_context(message)
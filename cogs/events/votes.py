@@ -10,7 +10,7 @@ from discord import Webhook
 
 import constants
 from core import Cog
-from models import Timer, User, Votes
+from models import Timer, Votes
 
 
 class VotesCog(Cog):
@@ -30,7 +30,7 @@ class VotesCog(Cog):
         if await Votes.get(user_id=member.id, is_voter=True).exists():
             await member.add_roles(discord.Object(id=self.bot.config.VOTER_ROLE))
 
-        if await User.get(pk=member.id, is_premium=True).exists() and self.bot.config.PREMIUM_ROLE:
+        if self.bot.premium.is_premium_user(member.id) and self.bot.config.PREMIUM_ROLE:
             try:
                 await member.add_roles(discord.Object(id=self.bot.config.PREMIUM_ROLE))
             except discord.HTTPException:
@@ -47,9 +47,6 @@ class VotesCog(Cog):
         if member is not None:
             await member.remove_roles(discord.Object(id=self.bot.config.VOTER_ROLE), reason="Their vote expired.")
 
-        else:
-            member = await self.bot.getch(self.bot.get_user, self.bot.fetch_user, user_id)
-
         if vote.reminder:
             embed = discord.Embed(
                 color=self.bot.color,
@@ -57,7 +54,4 @@ class VotesCog(Cog):
                 title="Vote Expired!",
                 url="https://quotientbot.xyz/vote",
             )
-            try:
-                await member.send(embed=embed)
-            except discord.Forbidden:
-                pass
+            await self.bot.dms.send(user_id, embed=embed)
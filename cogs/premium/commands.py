@@ -5,7 +5,7 @@ import os
 import tempfile
 import asyncio
 from typing import Union, Optional, Literal
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import discord 
 from discord.ext import commands, tasks
@@ -102,33 +102,15 @@ class Premium(Cog):
 
     async def check_premium_end(self):
         """Check and update expired premium subscriptions"""
-        # Get expired users and guilds
-        expired_users = await User.filter(is_premium=True, premium_expire_time__lte=datetime.now())
-        expired_guilds = await Guild.filter(is_premium=True, premium_end_time__lte=datetime.now())
+        # Deactivate expired users and guilds in bulk
+        expired_users, expired_guilds = await self.bot.premium.expire()
 
-        # Deactivate expired user premium
-        for user in expired_users:
-            user.is_premium = False
-            user.premium_expire_time = None
-            await user.save()
-
-            # Try to notify user
-            discord_user = self.bot.get_user(user.id)
-            if discord_user:
-                try:
-                    await discord_user.send("Your premium subscription has expired.")
-                except:
-                    pass
-
-        # Deactivate expired guild premium
-        for guild in expired_guilds:
-            guild.is_premium = False
-            guild.premium_end_time = None
-            guild.made_premium_by = None
-            await guild.save()
+        # Try to notify users
+        self.bot.loop.create_task(self.bot.dms.send_many(expired_users, content="Your premium subscription has expired."))
 
+        for guild_id in expired_guilds:
             # Try to notify guild
-            discord_guild = self.bot.get_guild(guild.id)
+            discord_guild = self.bot.get_guild(guild_id)
             if discord_guild and discord_guild.system_channel:
                 try:
                     await discord_guild.system_channel.send("This server's premium subscription has expired.")
@@ -342,6 +324,7 @@ class Premium(Cog):
             user_data.is_premium = False
             user_data.premium_end_time = None
             await user_data.save()
+            self.bot.premium.revoke_user(user.id)
 
             # Remove premium from user's guilds
             premium_guilds = await Guild.filter(made_premium_by=user.id)
@@ -350,6 +333,7 @@ class Premium(Cog):
                 guild.premium_end_time = None
                 guild.made_premium_by = None
                 await guild.save()
+                self.bot.premium.revoke_guild(guild.pk)
 
             await ctx.send(f"Successfully revoked premium from {user.mention}", ephemeral=True)
 
@@ -419,6 +403,7 @@ class Premium(Cog):
             guild_data.premium_end_time = None
             guild_data.made_premium_by = None
             await guild_data.save()
+            self.bot.premium.revoke_guild(guild_data.pk)
 
             success_msg = f"Successfully revoked premium from server: {guild_name}"
             await ctx.send(success_msg, ephemeral=True)
@@ -616,25 +601,30 @@ class Premium(Cog):
 
         try:
             # Deactivate premium in source guild
+            end_time = source_guild.premium_end_time
+
             source_guild.is_premium = False
             source_guild.premium_end_time = None
             source_guild.made_premium_by = None
             await source_guild.save()
+            self.bot.premium.revoke_guild(source_guild.pk)
 
             # Activate premium in target guild
             if not target_guild_data:
                 target_guild_data = await Guild.create(
                     guild_id=guild_id,
                     is_premium=True,
-                    premium_end_time=source_guild.premium_end_time,
+                    premium_end_time=end_time,
                     made_premium_by=user_id
                 )
             else:
                 target_guild_data.is_premium = True
-                target_guild_data.premium_end_time = source_guild.premium_end_time
+                target_guild_data.premium_end_time = end_time
                 target_guild_data.made_premium_by = user_id
                 await target_guild_data.save()
 
+            self.bot.premium.set_guild(target_guild_data.pk, end_time)
+
             success_msg = f"Successfully transferred premium from **{current_guild.name}** to **{target_guild.name}**"
             if isinstance(ctx_or_interaction, Context):
                 await ctx_or_interaction.send(success_msg, ephemeral=True)
@@ -719,6 +709,7 @@ class Premium(Cog):
             guild_data.premium_end_time = user.premium_expire_time
             guild_data.made_premium_by = user_id
             await guild_data.save()
+            self.bot.premium.set_guild(guild_data.pk, guild_data.premium_end_time)
 
             success_msg = (
                 f"Successfully activated premium for **{guild.name}**!\n"
@@ -787,6 +778,7 @@ class Premium(Cog):
             guild_data.premium_end_time = None
             guild_data.made_premium_by = None
             await guild_data.save()
+            self.bot.premium.revoke_guild(guild_data.pk)
 
             success_msg = f"Successfully deactivated premium for **{guild.name}**"
             await followup_send(success_msg, ephemeral=True)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import typing
-from contextlib import suppress
+import asyncio
 
 import discord
 
@@ -13,29 +12,31 @@ from .views import PremiumView
 
 
 async def deactivate_premium(guild_id: int):
+    bot = Guild.bot
+
     await Guild.filter(guild_id=guild_id).update(embed_color=config.COLOR, embed_footer=config.FOOTER, is_premium=False)
+    bot.premium.revoke_guild(guild_id)
 
-    _s: typing.List[Scrim] = (await Scrim.filter(guild_id=guild_id).order_by("id"))[3:]
-    await Scrim.filter(id__in=(s.pk for s in _s)).delete()
+    _s = (await Scrim.filter(guild_id=guild_id).order_by("id").values_list("id", flat=True))[3:]
+    await bot.cascade.scrims(_s)
 
-    _t: typing.List[Tourney] = (await Tourney.filter(guild_id=guild_id).order_by("id"))[1:]
-    await Tourney.filter(id__in=(t.pk for t in _t)).delete()
+    _t = (await Tourney.filter(guild_id=guild_id).order_by("id").values_list("id", flat=True))[1:]
+    await bot.cascade.tourneys(_t)
 
-    _tc: typing.List[TagCheck] = (await TagCheck.filter(guild_id=guild_id).order_by("id"))[1:]
-    await TagCheck.filter(id__in=(t.pk for t in _tc)).delete()
+    _tc = (await TagCheck.filter(guild_id=guild_id).order_by("id").values_list("id", flat=True))[1:]
+    await TagCheck.filter(id__in=_tc).delete()
 
-    _ez: typing.List[EasyTag] = (await EasyTag.filter(guild_id=guild_id).order_by("id"))[1:]
-    await EasyTag.filter(id__in=(e.pk for e in _ez)).delete()
+    _ez = (await EasyTag.filter(guild_id=guild_id).order_by("id").values_list("id", flat=True))[1:]
+    await EasyTag.filter(id__in=_ez).delete()
 
     await Tourney.filter(guild_id=guild_id).update(emojis={})
+    bot.cache.forget_tourney_reactions(*await Tourney.filter(guild_id=guild_id).values_list("id", flat=True))
 
-    ssverify = await SSVerify.filter(guild_id=guild_id)
-    for _ in ssverify:
-        await _.full_delete()
+    await bot.cascade.ssverify(await SSVerify.filter(guild_id=guild_id).values_list("id", flat=True))
 
     _slotm = (await ScrimsSlotManager.filter(guild_id=guild_id).order_by("id"))[1:]
-    for _ in _slotm:
-        await _.full_delete()
+    await asyncio.gather(*(_.disable_message() for _ in _slotm), return_exceptions=True)
+    await bot.cascade.slot_managers(_.pk for _ in _slotm)
 
     return
 
@@ -109,5 +110,4 @@ async def remind_user_to_pay(user: discord.User, model: User):
         f"This is to remind you that your subscription of **Quotient Pro** is ending {discord_timestamp(model.premium_expire_time)}"
         f"\n[*Click Me To Continue Enjoying Quotient Pro*](https://quotientbot.xyz/premium)"
     )
-    with suppress(discord.HTTPException):
-        await user.send(embed=_e)
+    await model.bot.dms.send(user.id, embed=_e)
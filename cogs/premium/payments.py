@@ -71,9 +71,10 @@ class PremiumPayments(commands.Cog):
                                     return
                                 
                                 # Add premium
-                                user = await User.get_or_create(user_id=interaction.user.id)
+                                user, _ = await User.get_or_create(user_id=interaction.user.id)
                                 user.is_premium = True
                                 await user.save()
+                                i.client.premium.set_user(interaction.user.id, user.premium_expire_time)
                                 
                                 await interaction.user.send("Your premium purchase has been approved! You now have access to all premium features.")
                                 await i.message.edit(content="Payment Verified ✅", view=None)
@@ -120,9 +121,10 @@ class PremiumPayments(commands.Cog):
     @commands.is_owner()
     async def givepremium(self, ctx, user: discord.User):
         """Give premium access to a user (Bot owner only)"""
-        user_model = await User.get_or_create(user_id=user.id)
+        user_model, _ = await User.get_or_create(user_id=user.id)
         user_model.is_premium = True
         await user_model.save()
+        self.bot.premium.set_user(user.id, user_model.premium_expire_time)
         
         await ctx.send(f"✅ Given premium access to {user.mention}")
         try:
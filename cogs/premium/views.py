@@ -271,6 +271,7 @@ class VerifyPaymentView(discord.ui.View):
             is_premium=True,
             premium_end_time=expires_at
         )
+        interaction.client.premium.set_guild(self.txn.guild_id, expires_at)
         
         # Notify user
         user = interaction.client.get_user(self.txn.user_id)
@@ -6,21 +6,19 @@ if typing.TYPE_CHECKING:
     from core import Quotient
 
 import inspect
-import itertools
 import os
-from collections import Counter
 from datetime import datetime, timedelta, timezone
 
 import discord
 from importlib.metadata import version, distributions
-import psutil
-import pygit2
 from discord.ext import commands
 
 from cogs.quomisc.helper import format_relative
 from core import Cog, Context, QuotientView
-from models import Commands, Guild, User, Votes
-from utils import LinkButton, LinkType, QuoColor, checks, get_ipm, human_timedelta, truncate_string
+from core.cooldown import QuotientRatelimiter
+from core.stats import Commit
+from models import Guild, User, Votes
+from utils import LinkButton, LinkType, QuoColor, checks, emote, get_ipm, human_timedelta, truncate_string
 
 from .alerts import *
 from .dev import *
@@ -140,26 +138,25 @@ class Quomisc(Cog, name="quomisc"):
         return human_timedelta(self.bot.start_time, accuracy=None, brief=brief, suffix=False)
 
     @staticmethod
-    def format_commit(commit):  # source: R danny
+    def format_commit(commit: Commit):  # source: R danny
         short, _, _ = commit.message.partition("\n")
-        short_sha2 = str(commit.id)[:6]
-        commit_tz = timezone(timedelta(minutes=commit.commit_time_offset))
-        commit_time = datetime.fromtimestamp(commit.commit_time).astimezone(commit_tz)
+        short_sha2 = commit.id[:6]
+        commit_tz = timezone(timedelta(minutes=commit.offset))
+        commit_time = datetime.fromtimestamp(commit.time).astimezone(commit_tz)
 
         # [`hash`](url) message (offset)
         offset = format_relative(commit_time.astimezone(timezone.utc))
         return f"[`{short_sha2}`](https://github.com/quotientbot/Quotient-Bot/commit/{commit.id}) {truncate_string(short,40)} ({offset})"
 
     def get_last_commits(self, count=3):
-        repo = pygit2.Repository(".git")
-        commits = list(itertools.islice(repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL), count))
-        return "\n".join(self.format_commit(c) for c in commits)
+        return "\n".join(self.format_commit(c) for c in self.bot.stats.commits[:count])
 
     @commands.command(aliases=("stats",))
     @commands.cooldown(1, 10, commands.BucketType.guild)
     async def about(self, ctx: Context):
         """Statistics of Quotient."""
-        db_latency = await self.bot.db_latency
+        stats = self.bot.stats
+        snapshot = await stats.snapshot()
 
         from importlib.metadata import version
         try:
@@ -167,20 +164,21 @@ class Quomisc(Cog, name="quomisc"):
         except:
             discord_version = "Unknown"
             
-        revision = self.get_last_commits()
+        revision = self.get_last_commits() if stats.loaded else f"Loading {emote.loading}"
 
-        total_memory = psutil.virtual_memory().total >> 20
-        used_memory = psutil.virtual_memory().used >> 20
-        cpu_used = str(psutil.cpu_percent())
+        total_memory = snapshot.memory_total >> 20
+        used_memory = snapshot.memory_used >> 20
+        cpu_used = str(snapshot.system_cpu)
 
-        total_members = sum(g.member_count for g in self.bot.guilds)
+        total_members = snapshot.members
         cached_members = len(self.bot.users)
 
-        total_command_uses = await Commands.all().count()
-        user_invokes = await Commands.filter(user_id=ctx.author.id, guild_id=ctx.guild.id).count() or 0
-        server_invokes = await Commands.filter(guild_id=ctx.guild.id).count() or 0
+        total_command_uses = stats.total_commands
+        user_invokes = await stats.user_commands(ctx.guild.id, ctx.author.id)
+        server_invokes = stats.guild_commands(ctx.guild.id)
 
-        chnl_count = Counter(map(lambda ch: ch.type, self.bot.get_all_channels()))
+        text_channels, voice_channels = snapshot.text_channels, snapshot.voice_channels
+        db_latency = f"{round(snapshot.db_latency, 2)} ms" if snapshot.db_latency is not None else "Error"
 
         owner = await self.bot.getch(self.bot.get_user, self.bot.fetch_user, 548163406537162782)
 
@@ -192,24 +190,35 @@ class Quomisc(Cog, name="quomisc"):
         embed.colour = self.bot.color
         embed.set_author(name=str(owner), icon_url=owner.display_avatar.url)
 
-        guild_value = len(self.bot.guilds)
+        guild_value = snapshot.guilds
+        guild_trend = stats.trend("guilds")
 
-        embed.add_field(name="Servers", value=f"{guild_value:,} total\n{len(self.bot.shards)} shards")
+        embed.add_field(
+            name="Servers",
+            value=f"{guild_value:,} total ({guild_trend:+,} in {len(stats.history) * stats.interval // 60}m)\n{len(self.bot.shards)} shards",
+        )
         embed.add_field(name="Uptime", value=f"{self.get_bot_uptime(brief=True)}\n{msges:,} messages seen")
         embed.add_field(name="Members", value=f"{total_members:,} Total\n{cached_members:,} cached")
         embed.add_field(
             name="Channels",
-            value=f"{chnl_count[discord.ChannelType.text] + chnl_count[discord.ChannelType.voice]:,} total\n{chnl_count[discord.ChannelType.text]:,} text\n{chnl_count[discord.ChannelType.voice]:,} voice",
+            value=f"{text_channels + voice_channels:,} total\n{text_channels:,} text\n{voice_channels:,} voice",
         )
         embed.add_field(
             name="Total Commands Used",
-            value=f"{total_command_uses:,} globally\n{server_invokes:,} in this server\n{user_invokes:,} by you.",
+            value=(
+                f"{total_command_uses:,} globally\n{server_invokes:,} in this server\n{user_invokes:,} by you."
+                if stats.loaded
+                else f"Still counting {emote.loading}\n{user_invokes:,} by you."
+            ),
         )
         embed.add_field(
             name="Stats",
             value=f"Ping: {round(self.bot.latency * 1000, 2)}ms\nDatabase: {db_latency}\nIPM: {round(get_ipm(ctx.bot), 2)}",
         )
-        embed.add_field(name="System", value=f"**RAM**: {used_memory}/{total_memory} MB\n**CPU:** {cpu_used}% used."),
+        embed.add_field(
+            name="System",
+            value=f"**RAM**: {used_memory}/{total_memory} MB\n**CPU:** {cpu_used}% used.\n**Process:** {snapshot.rss >> 20} MB",
+        ),
         embed.set_footer(text=f"Made with discord.py v{version}", icon_url="http://i.imgur.com/5BFecvA.png")
 
         links = [LinkType("Support Server", ctx.config.SERVER_LINK), LinkType("Invite Me", ctx.config.BOT_INVITE)]
@@ -222,8 +231,11 @@ class Quomisc(Cog, name="quomisc"):
         msg = await ctx.send("🔍 Checking latency...")
         
         # Get all latencies
-        bot_latency = round(self.bot.latency * 1000, 2)
-        db_latency = await self.bot.db_latency
+        snapshot = await self.bot.stats.snapshot()
+        shard_id = ctx.guild.shard_id if ctx.guild else 0
+
+        bot_latency = round(snapshot.shard_latencies.get(shard_id, self.bot.latency * 1000), 2)
+        db_latency = f"{round(snapshot.db_latency, 2)} ms" if snapshot.db_latency is not None else "Error"
         api_latency = round((msg.created_at - ctx.message.created_at).total_seconds() * 1000, 2)
 
         # Get status indicators based on latency
@@ -246,8 +258,25 @@ class Quomisc(Cog, name="quomisc"):
                        f"API       : {api_latency:>4} ms {get_status(api_latency)}\n"
                        "```"
         )
-        
-        embed.set_footer(text=f"Shard ID: {ctx.guild.shard_id if ctx.guild else 0}")
+
+        if (avg_db := self.bot.stats.average("db_latency")) is not None:
+            embed.description += f"\n*Database averaged {round(avg_db, 2)} ms over the last {len(self.bot.stats.history) * self.bot.stats.interval // 60} minutes.*"
+
+        if await self.bot.is_owner(ctx.author):
+            embed.add_field(
+                name="Fetches", value=", ".join(f"{k}: {v:,}" for k, v in self.bot.fetches.stats().items()) or "None"
+            )
+            embed.add_field(
+                name="Ratelimiters",
+                value="\n".join(
+                    f"{name}: {_['live']:,}/{_['capacity']:,} live, {_['evicted']:,} evicted"
+                    for name, _ in sorted(QuotientRatelimiter.all_stats().items())
+                )
+                or "None",
+                inline=False,
+            )
+
+        embed.set_footer(text=f"Shard ID: {shard_id}")
         await msg.edit(content=None, embed=embed)
 
     @commands.command()
@@ -88,6 +88,7 @@ class MoneyButton(BaseView):
             money=_u.money - 120,
             premiums=_u.premiums + 1,
         )
+        self.bot.premium.set_user(self.ctx.author.id, end_time)
 
         member = self.bot.server.get_member(self.ctx.author.id)
         if member is not None:
@@ -78,6 +78,10 @@ class Reminders(commands.Cog):
         self.bot.dispatch(event_name, timer)
 
     async def create_timer(self, *args, **kwargs):
+        """
+        Create a timer, or return the existing one if the same event for the same entity already expires at `when`.
+        Pass `replace=True` to also drop every other pending timer of that event & entity.
+        """
         when, event, *args = args
 
         try:
@@ -85,14 +89,26 @@ class Reminders(commands.Cog):
         except KeyError:
             now = datetime.now(tz=IST)
 
+        replace = kwargs.pop("replace", False)
+
         delta = (when - now).total_seconds()
 
-        timer = await Timer.create(
-            expires=when,
-            created=now,
-            event=event,
-            extra={"kwargs": kwargs, "args": args},
+        key, entity = Timer.make_key(event, when, args, kwargs), Timer.entity_prefix(event, args, kwargs)
+        if replace:
+            await Timer.filter(entity=entity).exclude(key=key).delete()
+
+        timer, created = await Timer.get_or_create(
+            {
+                "expires": when,
+                "created": now,
+                "event": event,
+                "extra": {"kwargs": kwargs, "args": args},
+                "entity": entity,
+            },
+            key=key,
         )
+        if not created:
+            return timer
 
         # only set the data check if it can be waited on
         if delta <= (86400 * 40):  # 40 days
@@ -24,6 +24,7 @@ TORTOISE = {
                 "models.misc.alerts",
                 "models.misc.block",
                 "models.misc.premium",
+                "models.misc.state",
                 "aerich.models"
             ],
             "default_connection": "default",
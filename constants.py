@@ -1,7 +1,7 @@
 import random
 from contextlib import suppress
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 
 import discord
 import pytz
@@ -62,6 +62,21 @@ class EsportsLog(Enum):
     success = "reg_success"
 
 
+class OutboundPriority(IntEnum):
+    """Lower runs first, see core.outbound.OutboundScheduler"""
+
+    feedback = 0  # registration ticks, confirm-channel posts
+    role = 1
+    slotlist = 2
+    log = 3
+    dm = 4
+
+
+class ExportFormat(Enum):
+    csv = "csv"
+    jsonl = "jsonl"
+
+
 class EsportsRole(Enum):
     ping = "ping_role"
     open = "open_role"
@@ -190,21 +205,18 @@ async def remind_premium(ctx):
         return
 
     from cogs.premium.views import PremiumPurchaseBtn
-    from models import Guild
     from utils import discord_timestamp
 
-    guild = await Guild.get_or_none(
-        pk=ctx.guild.id, is_premium=True, premium_end_time__lte=ctx.bot.current_time + timedelta(days=5)
-    )
-    if not guild:
+    if not ctx.bot.premium.is_premium_guild(ctx.guild.id):
         return
 
-    if guild.premium_end_time < ctx.bot.current_time:
+    end_time = ctx.bot.premium.guild_end_time(ctx.guild.id)
+    if not end_time or end_time > ctx.bot.current_time + timedelta(days=5):
         return
 
     _e = discord.Embed(color=discord.Color.red(), title="Premium Ending Soon....")
     _e.description = (
-        f"Your Quotient Premium subscription is ending {discord_timestamp(guild.premium_end_time)}\n\n"
+        f"Your Quotient Premium subscription is ending {discord_timestamp(end_time)}\n\n"
         "*Click the button to renew your subscription.*"
     )
     v = discord.ui.View(timeout=None)
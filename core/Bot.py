@@ -7,9 +7,12 @@ if TYPE_CHECKING:
     from ..cogs.reminder import Reminders
 
 import asyncio
+import hashlib
 import itertools
+import json
 import os
 import time
+import traceback
 from datetime import datetime, timedelta
 
 import aiohttp
@@ -18,15 +21,29 @@ from models import Timer
 from aiocache import cached
 from discord import AllowedMentions, Intents, app_commands
 from discord.ext import commands
-from lru import LRU
 from tortoise import Tortoise
 
 import config as cfg
 import constants as csts
 
 from .cache import CacheManager
+from .cascade import CascadeDeleter
+from .dashboard import ScrimDashboard
+from .exports import DataExporter
+from .fetch import FetchCoordinator, TTLCache
+from .groups import TourneyGroups
+from .guilds import GuildReconciler
+from .images import ImageRenderer
+from .stats import StatsCollector
+from .dms import DMDelivery
 from .Context import Context
+from .bans import ScrimBans
 from .Help import HelpCommand
+from .ledger import SlotLedgers, TourneyLedgers
+from .outbound import OutboundScheduler
+from .partners import PartnerSlotWriter
+from .premium import PremiumEntitlements
+from .refresher import SlotmRefresher
 from cogs.reminder import Reminders
 
 intents = Intents.default()
@@ -67,13 +84,15 @@ class Quotient(commands.AutoShardedBot):
         self.seen_messages = 0
 
         self.persistent_views_added = False
+        self.failed_extensions: List[str] = []
         self.sio = None
 
         self.lockdown: bool = False
         self.lockdown_msg: Optional[str] = None
         self._BotBase__cogs = commands.core._CaseInsensitiveDict()
 
-        self.message_cache: Dict[int, Any] = LRU(1024)  # type: ignore
+        self.fetches = FetchCoordinator(self)
+        self.message_cache: TTLCache = self.fetches.messages
 
         # Add global check for support server
         self.add_check(self.support_server_check)
@@ -122,63 +141,100 @@ class Quotient(commands.AutoShardedBot):
 
     @on_startup.append
     async def __load_extensions(self):
-        for ext in self.config.EXTENSIONS:
+        async def _load(ext: str):
             await self.load_extension(ext)
             print(f"Loaded extension: {ext}")
 
+        # extensions don't need each other while loading, so their setup() calls can overlap.
+        results = await asyncio.gather(*(_load(ext) for ext in self.config.EXTENSIONS), return_exceptions=True)
+
+        self.failed_extensions = [
+            ext for ext, result in zip(self.config.EXTENSIONS, results) if isinstance(result, BaseException)
+        ]
+        for ext, result in zip(self.config.EXTENSIONS, results):
+            if isinstance(result, BaseException):
+                print(f"Failed to load extension: {ext}")
+                traceback.print_exception(type(result), result, result.__traceback__)
+
     @on_startup.append
     async def __setup_views(self):
         from cogs.esports import GroupRefresh, TGroupList
 
-        async for record in TGroupList.all():
-            self.add_view(GroupRefresh(), message_id=record.message_id)
+        for message_id in await TGroupList.all().values_list("message_id", flat=True):
+            self.add_view(GroupRefresh(), message_id=message_id)
+
+    @on_startup.append
+    async def __sync_commands(self):
+        from models import BotState
+
+        if self.failed_extensions:
+            # syncing a partial tree would drop the commands of the broken cogs everywhere.
+            return print(f"Skipping slash command sync, {len(self.failed_extensions)} extension(s) failed to load.")
+
+        guild = discord.Object(id=self.config.SERVER_ID)
+        self.tree.copy_global_to(guild=guild)
+
+        payload = {
+            "global": [cmd.to_dict(self.tree) for cmd in self.tree.get_commands()],
+            "guild": [cmd.to_dict(self.tree) for cmd in self.tree.get_commands(guild=guild)],
+        }
+        _hash = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+        if await BotState.get_value("app_commands_hash") == _hash:
+            return print("Slash commands unchanged, skipping sync.")
 
-        # Sync slash commands with verification
-        print("Syncing slash commands...")
         try:
-            # Clear existing commands first
-            self.tree.clear_commands(guild=None)
-            self.tree.clear_commands(guild=discord.Object(id=self.config.SERVER_ID))
-            
-            # Copy and sync guild-specific commands
-            guild = discord.Object(id=self.config.SERVER_ID)
-            self.tree.copy_global_to(guild=guild)
             commands_guild = await self.tree.sync(guild=guild)
             print(f"Synced {len(commands_guild)} commands to main guild")
-            
-            # Sync globally
+
             commands_global = await self.tree.sync()
             print(f"Synced {len(commands_global)} commands globally")
-            
-            # Verify important commands exist
-            found_commands = set()
-            for cmd in itertools.chain(commands_guild, commands_global):
-                if isinstance(cmd, app_commands.Group):
-                    found_commands.update(f"{cmd.name} {subcmd.name}" for subcmd in cmd.commands)
-                else:
-                    found_commands.add(cmd.name)
-                    
-            required_commands = {"premium info", "premium status"}
-            missing_commands = required_commands - found_commands
-            
-            if missing_commands:
-                print(f"WARNING: Missing required commands: {', '.join(missing_commands)}")
-            else:
-                print("All required commands synced successfully!")
-                    
+
         except Exception as e:
-            print(f"Error syncing commands: {e}")
-        
-        print("Persistent views loaded successfully")
+            return print(f"Error syncing commands: {e}")
+
+        await BotState.set_value("app_commands_hash", _hash)
+
+        # Verify important commands exist
+        found_commands = set()
+        for cmd in itertools.chain(commands_guild, commands_global):
+            if isinstance(cmd, app_commands.Group):
+                found_commands.update(f"{cmd.name} {subcmd.name}" for subcmd in cmd.commands)
+            else:
+                found_commands.add(cmd.name)
+
+        required_commands = {"premium info", "premium status"}
+        if missing_commands := required_commands - found_commands:
+            print(f"WARNING: Missing required commands: {', '.join(missing_commands)}")
 
     @on_startup.append
     async def __chunk_prime_guilds(self):
         from models import Guild
 
-        async for g in Guild.filter(is_premium=True):
-            if (_guild := self.get_guild(g.pk)) and not _guild.chunked:
+        await self.wait_until_ready()
+
+        for guild_id in await Guild.filter(is_premium=True).values_list("guild_id", flat=True):
+            if (_guild := self.get_guild(guild_id)) and not _guild.chunked:
                 self.loop.create_task(_guild.chunk())
 
+    async def __startup(self, timings: Dict[str, float]):
+        """
+        Runs every `on_startup` phase in order and prints how long each of them took.
+        A phase that fails is logged and the rest still run.
+        """
+        for coro_func in on_startup:
+            phase, started = coro_func.__name__.strip("_"), time.perf_counter()
+            try:
+                await coro_func(self)
+            except Exception:
+                print(f"[Quotient] Startup phase {phase} failed:")
+                traceback.print_exc()
+            finally:
+                timings[phase] = time.perf_counter() - started
+
+        _timings = ", ".join(f"{phase}: {secs:.2f}s" for phase, secs in timings.items())
+        print(f"[Quotient] Startup finished in {sum(timings.values()):.2f}s ({_timings})")
+
     @property
     def config(self) -> cfg:
         """import and return config.py"""
@@ -225,25 +281,40 @@ class Quotient(commands.AutoShardedBot):
         self.session = aiohttp.ClientSession(loop=self.loop)
         await Tortoise.init(cfg.TORTOISE)
         await Tortoise.generate_schemas(safe=True)
+        await Timer.migrate_key()
 
         self.cache = CacheManager(self)
         await self.cache.fill_temp_cache()
 
+        self.premium = PremiumEntitlements(self)
+        await self.premium.load()
+
+        self.slotm_refresher = SlotmRefresher(self)
+        self.slot_ledgers = SlotLedgers(self)
+        self.tourney_ledgers = TourneyLedgers(self)
+        self.scrim_bans = ScrimBans(self)
+        self.scrim_dashboard = ScrimDashboard(self)
+        self.cascade = CascadeDeleter(self)
+        self.guild_reconciler = GuildReconciler(self)
+        self.exports = DataExporter(self)
+        self.images = ImageRenderer(self)
+        self.tourney_groups = TourneyGroups(self)
+        self.partner_slots = PartnerSlotWriter(self)
+        self.outbound = OutboundScheduler(self, concurrency={csts.OutboundPriority.dm: 4})
+        self.dms = DMDelivery(self)
+        await self.dms.load()
+        self.stats = StatsCollector(self)
+        self.stats.start()
+
         # Initializing Models (Assigning Bot attribute to all models)
         for mname, model in Tortoise.apps.get("models").items():
             model.bot = self
 
     async def setup_hook(self) -> None:
+        started = time.perf_counter()
         await self.init_quo()
-        
-        # Sync commands
-        print("Syncing commands...")
-        self.tree.copy_global_to(guild=discord.Object(id=self.config.SERVER_ID))
-        await self.tree.sync()
-        await self.tree.sync(guild=discord.Object(id=self.config.SERVER_ID))
-        
-        for coro_func in on_startup:
-            self.loop.create_task(coro_func(self))
+
+        self.loop.create_task(self.__startup({"init_quo": time.perf_counter() - started}))
 
     async def get_prefix(self, message: discord.Message) -> Union[str, Callable, List[str]]:
         """Get a guild's prefix"""
@@ -271,6 +342,15 @@ class Quotient(commands.AutoShardedBot):
     async def close(self) -> None:
         await super().close()
 
+        if hasattr(self, "images"):
+            self.images.close()
+
+        if hasattr(self, "outbound"):
+            self.outbound.close()
+
+        if hasattr(self, "partner_slots"):
+            await self.partner_slots.flush()
+
         if hasattr(self, "session"):
             await self.session.close()
 
@@ -309,7 +389,8 @@ class Quotient(commands.AutoShardedBot):
             premium_notified, public_profile, money
         ) 
         VALUES (?, ?, ?, ?, ?, ?, ?) 
-        ON CONFLICT DO NOTHING;
+        ON CONFLICT DO NOTHING
+        RETURNING user_id;
         """
         params = [
             ctx.author.id,
@@ -320,7 +401,9 @@ class Quotient(commands.AutoShardedBot):
             True,  # public_profile default
             0,     # money default
         ]
-        await self.db.execute_query(query, params)
+        _, rows = await self.db.execute_query(query, params)
+        if rows:  # RETURNING gave a row, the user is new and premium by default
+            self.premium.set_user(ctx.author.id)
 
     async def on_ready(self):
         print(f"[Quotient] Logged in as {self.user.name}({self.user.id})")
@@ -366,24 +449,17 @@ class Quotient(commands.AutoShardedBot):
         """Looks up a member in cache or fetches if not found."""
         member = guild.get_member(member_id)
         if member is not None:
+            self.fetches.hit()
             return member
 
-        shard = self.get_shard(guild.shard_id)
+        async def fetch():
+            if self.get_shard(guild.shard_id).is_ws_ratelimited():
+                return await guild.fetch_member(member_id)
 
-        if shard.is_ws_ratelimited():
-            try:
-                member = await guild.fetch_member(member_id)
-            except discord.HTTPException:
-                return None
-            else:
-                return member
-
-        members = await guild.query_members(limit=1, user_ids=[member_id], cache=True)
-
-        if len(members) > 0:
-            return members[0]
+            members = await guild.query_members(limit=1, user_ids=[member_id], cache=True)
+            return members[0] if members else None
 
-        return None
+        return await self.fetches.fetch(("member", guild.id, member_id), fetch)
 
     async def resolve_member_ids(
         self, guild: discord.Guild, member_ids: Iterable[int]
@@ -430,9 +506,7 @@ class Quotient(commands.AutoShardedBot):
 
     async def is_premium_guild(self, guild_id: int) -> bool:
         """Check if a guild has premium features"""
-        from models import Guild
-        guild = await Guild.get_or_none(pk=guild_id)
-        return guild and guild.is_premium
+        return self.premium.is_premium_guild(guild_id)
 
     @property
     def server(self) -> Optional[discord.Guild]:
@@ -470,15 +544,14 @@ class Quotient(commands.AutoShardedBot):
         t2 = time.perf_counter() - t1
         return f"{t2*1000:.2f} ms"
 
-    @staticmethod
-    async def getch(get_method: Callable, fetch_method: Callable, _id: int) -> Any:  # why does c have all the fun?
-        try:
-            _result = get_method(_id) or await fetch_method(_id)
-        except (discord.HTTPException, discord.NotFound):
-            return None
-        else:
+    async def getch(self, get_method: Callable, fetch_method: Callable, _id: int) -> Any:  # why does c have all the fun?
+        if _result := get_method(_id):
+            self.fetches.hit()
             return _result
 
+        key = (fetch_method.__qualname__, getattr(getattr(fetch_method, "__self__", None), "id", None), _id)
+        return await self.fetches.fetch(key, lambda: fetch_method(_id))
+
     async def get_or_fetch_message(
         self,
         channel: discord.TextChannel,
@@ -488,21 +561,21 @@ class Quotient(commands.AutoShardedBot):
         fetch: bool = True,
     ) -> Optional[discord.Message]:
         # caching cause, due to rate limiting 50/1
-        if cache and (msg := self.get_message(message_id)):
+        if cache and (msg := self.get_message(message_id)) or (msg := self.message_cache.get(message_id)):
+            self.fetches.hit()
             return msg
-        try:
-            return self.message_cache[message_id]
-            # scripting is always faster than `.get()`
-        except KeyError:
-            pass
-        before = discord.Object(message_id + 1)
-        after = discord.Object(message_id - 1)
-        if fetch:
+
+        if not fetch:
+            return None
+
+        async def fetch_message():
+            before = discord.Object(message_id + 1)
+            after = discord.Object(message_id - 1)
             async for msg in channel.history(limit=1, before=before, after=after):
                 self.message_cache[msg.id] = msg
                 return msg
 
-        return None
+        return await self.fetches.fetch(("message", message_id), fetch_message)
 
     async def send_message(self, channel_id: discord.abc.Snowflake, content, **kwargs: Any):
         await self.http.send_message(channel_id, content, **kwargs)
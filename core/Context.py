@@ -41,6 +41,9 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
     def config(self) -> cfg:
         return self.bot.config
 
+    async def is_premium_guild(self) -> bool:
+        return self.bot.premium.is_premium_guild(self.guild.id)
+
     @property
     async def banlog_channel(self):
         from models import BanLog
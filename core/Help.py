@@ -7,7 +7,6 @@ import discord
 from discord.ext import commands
 
 import config
-from models import Guild
 from utils import LinkButton, LinkType, QuoPaginator, discord_timestamp, truncate_string
 
 from .Cog import Cog
@@ -54,14 +53,13 @@ class HelpCommand(commands.HelpCommand):
         )
 
         # Add premium status if applicable
-        guild = await Guild.get_or_none(pk=ctx.guild.id)
-        if guild and guild.is_premium and guild.premium_end_time:
+        if ctx.bot.premium.is_premium_guild(ctx.guild.id) and (end_time := ctx.bot.premium.guild_end_time(ctx.guild.id)):
             home_embed.add_field(
                 name="✨ Premium Status",
                 value=(
                     f"```yaml\n"
                     f"Status: Active\n"
-                    f"Expires: {discord_timestamp(guild.premium_end_time)}\n"
+                    f"Expires: {discord_timestamp(end_time)}\n"
                     f"```"
                 ),
                 inline=False
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import typing as T
+from collections import defaultdict
+from datetime import datetime
+
+import discord
+from tortoise.transactions import in_transaction
+
+if T.TYPE_CHECKING:
+    from models import Scrim
+
+    from .Bot import Quotient
+
+__all__ = ("ScrimBans",)
+
+
+class ScrimBans:
+    """
+    Set-based bans of users from scrims.
+
+    A ban batch creates one `BannedTeam` per user, linked to every scrim the user
+    wasn't banned from yet, and one `scrim_ban` timer to lift the whole batch.
+    Banned user ids of every scrim are kept in memory for the registration checks.
+    """
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+        # frozen, so that callers can't change the cache through what banned_user_ids returns.
+        self._banned: T.Dict[int, T.FrozenSet[int]] = {}
+
+    @staticmethod
+    def _m2m():
+        from models import M2MTable, Scrim
+
+        return M2MTable(Scrim, "banned_teams")
+
+    async def banned_user_ids(self, scrim_id: int) -> T.FrozenSet[int]:
+        if (_ids := self._banned.get(scrim_id)) is None:
+            rows = await self._m2m().pairs_by("user_id", owner_ids=[scrim_id])
+            _ids = self._banned[scrim_id] = frozenset(user_id for _, _, user_id in rows)
+
+        return _ids
+
+    def discard(self, scrim_id: int) -> None:
+        self._banned.pop(scrim_id, None)
+
+    async def ban(
+        self,
+        user_ids: T.Iterable[int],
+        scrims: T.List[Scrim],
+        *,
+        mod: discord.Member,
+        reason: T.Optional[str] = None,
+        expires: T.Optional[datetime] = None,
+    ) -> int:
+        """
+        Ban users from scrims, users already banned from a scrim are skipped.
+        Returns the number of (user, scrim) bans created.
+        """
+        from models import BanLog, BannedTeam
+
+        user_ids = list(dict.fromkeys(user_ids))
+        if not scrims or not user_ids:
+            return 0
+
+        m2m = self._m2m()
+
+        rows = await m2m.pairs_by("user_id", user_ids, [_.pk for _ in scrims])
+        existing = {(scrim_id, user_id) for scrim_id, _, user_id in rows}
+
+        missing: T.Dict[int, T.List[Scrim]] = {}
+        for user_id in user_ids:
+            if _scrims := [_ for _ in scrims if (_.pk, user_id) not in existing]:
+                missing[user_id] = _scrims
+
+        if not missing:
+            return 0
+
+        async with in_transaction():
+            teams = [await BannedTeam.create(user_id=_, expires=expires, reason=reason) for _ in missing]
+            await m2m.link((scrim.pk, team.pk) for team in teams for scrim in missing[team.user_id])
+
+        for user_id, _scrims in missing.items():
+            for scrim in _scrims:
+                if (_ids := self._banned.get(scrim.pk)) is not None:
+                    self._banned[scrim.pk] = _ids | {user_id}
+
+        if expires:
+            await self.bot.reminders.create_timer(
+                expires,
+                "scrim_ban",
+                scrims=[_.pk for _ in scrims],
+                user_ids=list(missing),
+                team_ids=[_.pk for _ in teams],
+                mod=mod.id,
+                reason=reason,
+            )
+
+        if banlog := await BanLog.get_or_none(guild_id=scrims[0].guild_id):
+            for user_id, _scrims in missing.items():
+                await banlog.log_ban(user_id, mod, _scrims, reason, expires)
+
+        return sum(len(_) for _ in missing.values())
+
+    async def unban(
+        self,
+        scrim_ids: T.Iterable[int],
+        *,
+        user_ids: T.Optional[T.Iterable[int]] = None,
+        team_ids: T.Optional[T.Iterable[int]] = None,
+    ) -> T.Dict[int, T.Set[int]]:
+        """
+        Unban users (all of them if neither `user_ids` nor `team_ids` is given) from scrims.
+        Returns the scrim ids each user got unbanned from.
+        """
+        if not (scrim_ids := list(scrim_ids)):
+            return {}
+
+        m2m = self._m2m()
+        rows = await m2m.pairs_by("user_id", user_ids, scrim_ids, team_ids)
+        if not rows:
+            return {}
+
+        _team_ids = {team_id for _, team_id, _ in rows}
+        async with in_transaction():
+            await m2m.unlink(scrim_ids, _team_ids)
+            await self.__purge_unlinked(_team_ids)
+
+        return self.__forget(rows)
+
+    async def expire(self, team_ids: T.Iterable[int]) -> T.Dict[int, T.Set[int]]:
+        """
+        Lift a whole ban batch.
+        Returns the scrim ids each user got unbanned from.
+        """
+        from models import BannedTeam
+
+        if not (team_ids := list(team_ids)):
+            return {}
+
+        m2m = self._m2m()
+        rows = await m2m.pairs_by("user_id", related_ids=team_ids)
+
+        async with in_transaction():
+            await m2m.unlink(related_ids=team_ids)
+            await BannedTeam.filter(pk__in=team_ids).delete()
+
+        return self.__forget(rows)
+
+    async def drop_scrims(self, scrim_ids: T.Collection[int]) -> None:
+        """
+        Unlink every ban of scrims that are being deleted.
+        A ban batch is shared by all its scrims, so only the bans no other scrim is linked to are deleted.
+        """
+        m2m = self._m2m()
+        team_ids = {team_id for _, team_id in await m2m.pairs(owner_ids=scrim_ids)}
+
+        await m2m.unlink(owner_ids=scrim_ids)
+        if team_ids:
+            await self.__purge_unlinked(team_ids)
+
+        for scrim_id in scrim_ids:
+            self.discard(scrim_id)
+
+    async def __purge_unlinked(self, team_ids: T.Set[int]):
+        from models import BannedTeam
+
+        linked = {team_id for _, team_id in await self._m2m().pairs(related_ids=team_ids)}
+        if unlinked := team_ids - linked:
+            await BannedTeam.filter(pk__in=unlinked).delete()
+
+    def __forget(self, rows: T.List[T.Tuple[int, int, int]]) -> T.Dict[int, T.Set[int]]:
+        unbanned = defaultdict(set)
+        for scrim_id, _, user_id in rows:
+            unbanned[user_id].add(scrim_id)
+            # a user can still be banned through another record, let it reload.
+            self._banned.pop(scrim_id, None)
+
+        return dict(unbanned)
@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 import config
 from constants import IST
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, NamedTuple
 from models.misc.guild import Guild
 from models.misc.Tag import Tag
-from models.esports.tagcheck import TagCheck
+from models.esports.tagcheck import EasyTag, TagCheck
 from models.esports.scrims import Scrim
-from models.esports.tourney import Tourney
+from models.esports.tourney import TGroupList, Tourney
+from models.esports.slotm import ScrimsSlotManager
 from models.misc.AutoPurge import AutoPurge
 from models.esports.ssverify import SSVerify
 from models.misc.block import BlockList
+from models.helpers import M2MTable
+
+from .fetch import TTLCache
 
 if TYPE_CHECKING:
     from .Bot import Quotient
 
 
+class PartnerChannel(NamedTuple):
+    tourney_id: int  # tourney taking registrations through the channel
+    partner_tourney_id: int  # tourney its registrants must be in
+
+
 class CacheManager:
     def __init__(self, bot):
         self.bot: Quotient = bot
@@ -27,43 +39,97 @@ class CacheManager:
         self.scrim_channels = set()
         self.tourney_channels = set()
         self.autopurge_channels = set()
-        self.media_partner_channels = set()
+        self.media_partner_channels: Dict[int, PartnerChannel] = {}
         self.ssverify_channels = set()
 
+        # registration channel id: (tourney id, tick emoji) for tourney-mod reactions,
+        # dropped with forget_tourney_reactions whenever a tourney is deleted or edited.
+        self.tourney_reaction_targets = TTLCache(ttl=60, maxsize=1024)
+
+        # ids the delete listeners care about, so that unrelated deletes never reach the database.
+        # tracked_channel_ids may keep ids of deleted records, that only costs a query on the channel's deletion.
+        self.slotm_message_ids = set()
+        self.tourney_message_ids = set()
+        self.tracked_role_ids = set()
+        self.tracked_channel_ids = set()
+
         self.blocked_ids = set()
 
     async def fill_temp_cache(self):
-        
-        async for record in Guild.all():
-            self.guild_data[record.guild_id] = {
-                "color": record.embed_color or config.COLOR,
-                "footer": record.embed_footer or config.FOOTER,
-            }
-
-        async for record in Tag.all():
-            self.eztagchannels.add(record.channel_id)
+        """
+        Warm up every startup cache concurrently, fetching only the columns we keep.
+        Prints how long each table took.
+        """
+        async def _guild_data():
+            for guild_id, color, footer in await Guild.all().values_list("guild_id", "embed_color", "embed_footer"):
+                self.guild_data[guild_id] = {"color": color or config.COLOR, "footer": footer or config.FOOTER}
+
+        async def _media_partners():
+            # one query on the tourney <-> partner through table instead of one per tourney.
+            rows = await M2MTable(Tourney, "media_partners").pairs_by("tourney_id")
+            self.media_partner_channels.update(
+                (channel_id, PartnerChannel(tourney_id, partner_tourney_id))
+                for tourney_id, channel_id, partner_tourney_id in rows
+            )
 
-        async for record in TagCheck.all():
-            self.tagcheck.add(record.channel_id)
+        async def _tourney_messages():
+            self.tourney_message_ids.update(
+                *await asyncio.gather(
+                    Tourney.filter(slotm_message_id__not_isnull=True).values_list("slotm_message_id", flat=True),
+                    TGroupList.all().values_list("message_id", flat=True),
+                )
+            )
 
-        async for record in Scrim.filter(opened_at__lte=datetime.now(tz=IST)).all():
-            self.scrim_channels.add(record.registration_channel_id)
+        async def _tracked_channels():
+            for query, column in (
+                (Scrim.all(), "registration_channel_id"),
+                (Tourney.all(), "registration_channel_id"),
+                (Tourney.filter(slotm_channel_id__not_isnull=True), "slotm_channel_id"),
+                (ScrimsSlotManager.all(), "main_channel_id"),
+                (TagCheck.all(), "channel_id"),
+                (EasyTag.all(), "channel_id"),
+            ):
+                self.tracked_channel_ids.update(await query.values_list(column, flat=True))
+
+        loaders = {
+            "guild_data": _guild_data(),
+            "eztag": self.__fill(self.eztagchannels, Tag.all(), "channel_id"),
+            "tagcheck": self.__fill(self.tagcheck, TagCheck.all(), "channel_id"),
+            "scrims": self.__fill(
+                self.scrim_channels, Scrim.filter(opened_at__lte=datetime.now(tz=IST)), "registration_channel_id"
+            ),
+            "tourneys": self.__fill(
+                self.tourney_channels, Tourney.filter(started_at__not_isnull=True), "registration_channel_id"
+            ),
+            "autopurge": self.__fill(self.autopurge_channels, AutoPurge.all(), "channel_id"),
+            "media_partners": _media_partners(),
+            "ssverify": self.__fill(self.ssverify_channels, SSVerify.all(), "channel_id"),
+            "blocklist": self.__fill(self.blocked_ids, BlockList.all(), "block_id"),
+            "slotm_messages": self.__fill(self.slotm_message_ids, ScrimsSlotManager.all(), "message_id"),
+            "tourney_messages": _tourney_messages(),
+            "ssverify_roles": self.__fill(self.tracked_role_ids, SSVerify.all(), "role_id"),
+            "tracked_channels": _tracked_channels(),
+        }
 
-        async for record in Tourney.filter(started_at__not_isnull=True):
-            self.tourney_channels.add(record.registration_channel_id)
+        started = time.perf_counter()
+        timings = await asyncio.gather(*(self.__timed(_) for _ in loaders.values()))
 
-        async for record in AutoPurge.all():
-            self.autopurge_channels.add(record.channel_id)
+        _timings = ", ".join(f"{name}: {ms:.1f}ms" for name, ms in zip(loaders, timings))
+        print(f"Cache warmed up in {(time.perf_counter() - started) * 1000:.1f}ms ({_timings})")
 
-        async for record in Tourney.all():
-            async for partner in record.media_partners.all():
-                self.media_partner_channels.add(partner.channel_id)
+    @staticmethod
+    async def __fill(_set: set, query, column: str):
+        _set.update(await query.values_list(column, flat=True))
 
-        async for record in SSVerify.all():
-            self.ssverify_channels.add(record.channel_id)
+    @staticmethod
+    async def __timed(coro) -> float:
+        started = time.perf_counter()
+        await coro
+        return (time.perf_counter() - started) * 1000
 
-        async for record in BlockList.all():
-            self.blocked_ids.add(record.block_id)
+    def forget_tourney_reactions(self, *tourney_ids: int) -> None:
+        ids = set(tourney_ids)
+        self.tourney_reaction_targets.discard_where(lambda _, target: target[0] in ids)
 
     def guild_color(self, guild_id: int):
         return self.guild_data.get(guild_id, {}).get("color", config.COLOR)
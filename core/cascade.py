@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import typing as T
+
+from tortoise.transactions import in_transaction
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("CascadeDeleter",)
+
+
+class CascadeDeleter:
+    """
+    Deletes scrims, tourneys, ssverify & slot-manager setups along with everything that hangs off them.
+
+    Takes any number of ids at once: the children of every relation go with one `DELETE ... WHERE id IN (subquery)`,
+    then the link rows and the records themselves, all in a single transaction.
+    Caches of every deleted record are dropped once it has committed.
+    """
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+
+    @staticmethod
+    async def __delete_related(model, field: str, owner_ids: T.Collection[int]):
+        from models import M2MTable
+
+        m2m = M2MTable(model, field)
+        await m2m.delete_related(owner_ids)
+        await m2m.unlink(owner_ids=owner_ids)
+
+    async def scrims(self, ids: T.Iterable[int]) -> int:
+        """Delete scrims with their slots, reminders & bans, returns how many were deleted."""
+        from models import Scrim, ScrimsSlotManager
+
+        records = await Scrim.filter(pk__in=list(ids)).values_list("id", "guild_id", "registration_channel_id")
+        if not records:
+            return 0
+
+        ids = {_id for _id, _, _ in records}
+        guild_ids = {guild_id for _, guild_id, _ in records}
+
+        slotms = [
+            (pk, scrim_ids)
+            for pk, scrim_ids in await ScrimsSlotManager.filter(guild_id__in=guild_ids).values_list("id", "scrim_ids")
+            if ids.intersection(scrim_ids)
+        ]
+
+        async with in_transaction():
+            for field in ("assigned_slots", "reserved_slots", "slot_reminders"):
+                await self.__delete_related(Scrim, field, ids)
+
+            # ban batches are shared between scrims, they can't go with the subquery delete.
+            await self.bot.scrim_bans.drop_scrims(ids)
+
+            for pk, scrim_ids in slotms:
+                await ScrimsSlotManager.filter(pk=pk).update(scrim_ids=[_ for _ in scrim_ids if _ not in ids])
+
+            await Scrim.filter(pk__in=ids).delete()
+
+        for _id, _, channel_id in records:
+            self.bot.cache.scrim_channels.discard(channel_id)
+            self.bot.slot_ledgers.discard(_id)
+
+        for guild_id in guild_ids:
+            self.bot.scrim_dashboard.invalidate(guild_id)
+
+        return len(ids)
+
+    async def tourneys(self, ids: T.Iterable[int]) -> int:
+        """Delete tourneys with their slots, media partners & group lists, returns how many were deleted."""
+        from models import M2MTable, MediaPartner, TGroupList, Tourney
+
+        records = await Tourney.filter(pk__in=list(ids)).values_list("id", "registration_channel_id")
+        if not records:
+            return 0
+
+        ids = {_id for _id, _ in records}
+        partner_channel_ids = [
+            channel_id for _, channel_id in await M2MTable(Tourney, "media_partners").pairs(owner_ids=ids)
+        ]
+
+        async with in_transaction():
+            await self.__delete_related(Tourney, "assigned_slots", ids)
+
+            if partner_channel_ids:
+                await self.__delete_related(MediaPartner, "slots", partner_channel_ids)
+
+            await self.__delete_related(Tourney, "media_partners", ids)
+            await TGroupList.filter(tourney_id__in=ids).delete()
+            await Tourney.filter(pk__in=ids).delete()
+
+        for _id, channel_id in records:
+            self.bot.cache.tourney_channels.discard(channel_id)
+            self.bot.tourney_groups.bump(_id)
+            self.bot.tourney_ledgers.discard(_id)
+
+        self.bot.cache.forget_tourney_reactions(*ids)
+
+        for channel_id in partner_channel_ids:
+            self.bot.cache.media_partner_channels.pop(channel_id, None)
+
+        return len(ids)
+
+    async def ssverify(self, ids: T.Iterable[int]) -> int:
+        """Delete ssverify setups with their screenshot data, returns how many were deleted."""
+        from models import SSVerify
+
+        records = await SSVerify.filter(pk__in=list(ids)).values_list("id", "channel_id")
+        if not records:
+            return 0
+
+        ids = {_id for _id, _ in records}
+
+        async with in_transaction():
+            await self.__delete_related(SSVerify, "data", ids)
+            await SSVerify.filter(pk__in=ids).delete()
+
+        for _, channel_id in records:
+            self.bot.cache.ssverify_channels.discard(channel_id)
+
+        return len(ids)
+
+    async def slot_managers(self, ids: T.Iterable[int]) -> int:
+        """Delete slot-manager setups, their public messages are left for the caller to disable."""
+        from models import ScrimsSlotManager
+
+        ids = set(ids)
+        if not ids:
+            return 0
+
+        deleted = await ScrimsSlotManager.filter(pk__in=ids).delete()
+
+        for _id in ids:
+            self.bot.slotm_refresher.forget(_id)
+
+        return deleted
@@ -1,31 +1,122 @@
 from __future__ import annotations
 
+import time
 import typing as T
-from collections import defaultdict
+import weakref
+from array import array
 
 import discord
-from discord.ext import commands
 
 __all__ = ("QuotientRatelimiter",)
 
 
-class CooldownByMember(commands.CooldownMapping):
-    def _bucket_key(self, member: discord.Member):
-        return member.id
+class QuotientRatelimiter:
+    """
+    Token buckets of `rate` uses per `per` seconds, keyed by member/guild id, in a fixed size table.
 
+    Buckets live in flat arrays (open addressing, a few probes per key), a bucket untouched for `per`
+    seconds is full again and its slot is free for reuse, so nothing ever has to be scheduled to forget it.
+    Every check also sweeps a few slots, keeping the live bucket count close to the truth.
+    If all probed slots are in use the least recently used one is given up.
 
-class CooldownByGuild(commands.CooldownMapping):
-    def _bucket_key(self, member: discord.Guild):
-        return member.id
+    Every ratelimiter is registered under its `name`, `all_stats` reports the gauges of all of them.
+    """
 
+    PROBES = 8
+    SWEEP = 4
 
-class QuotientRatelimiter:
-    def __init__(self, rate: float, per: float):
-        self.by_member = CooldownByMember.from_cooldown(rate, per, commands.BucketType.member)
-        self.by_guild = CooldownByGuild.from_cooldown(rate, per, commands.BucketType.guild)
+    _instances: "weakref.WeakSet[QuotientRatelimiter]" = weakref.WeakSet()
+
+    def __init__(self, rate: float, per: float, *, capacity: int = 1 << 15, name: T.Optional[str] = None):
+        self.rate = rate
+        self.per = per
+        self.name = name or f"{rate}/{per}s"
+        self._instances.add(self)
+
+        self._bits = max(capacity - 1, 1).bit_length()
+        self.capacity = 1 << self._bits
+
+        self._keys = array("q", bytes(8 * self.capacity))  # 0 means the slot is empty
+        self._tokens = array("d", bytes(8 * self.capacity))
+        self._stamps = array("d", bytes(8 * self.capacity))
+
+        self._cursor = 0
+        self.live = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return self.live
+
+    def _slot(self, key: int) -> int:
+        # fibonacci hashing, snowflakes' low bits are far from random.
+        return ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - self._bits)
+
+    def _expired(self, idx: int, now: float) -> bool:
+        return now - self._stamps[idx] >= self.per
+
+    def _clear(self, idx: int):
+        self._keys[idx] = 0
+        self.live -= 1
+
+    def _sweep(self, now: float):
+        for _ in range(self.SWEEP):
+            if self._keys[self._cursor] and self._expired(self._cursor, now):
+                self._clear(self._cursor)
+
+            self._cursor = (self._cursor + 1) & (self.capacity - 1)
+
+    def _find(self, key: int, now: float) -> int:
+        start, free, oldest = self._slot(key), -1, -1
+
+        for probe in range(self.PROBES):
+            idx = (start + probe) & (self.capacity - 1)
+            _key = self._keys[idx]
+
+            if _key == key:
+                return idx
+
+            if free == -1 and (not _key or self._expired(idx, now)):
+                free = idx
+
+            elif oldest == -1 or self._stamps[idx] < self._stamps[oldest]:
+                oldest = idx
+
+        if free == -1:
+            free = oldest
+            self._clear(free)
+            self.evicted += 1
+
+        elif self._keys[free]:
+            self._clear(free)
+
+        self._keys[free] = key
+        self._tokens[free] = self.rate
+        self._stamps[free] = now
+        self.live += 1
+        return free
+
+    def hit(self, key: int) -> float:
+        """Use a token of `key`'s bucket, returns 0 or the seconds to wait for one if the bucket is empty."""
+        now = time.monotonic()
+        self._sweep(now)
+
+        idx = self._find(key, now)
+        tokens = min(self.rate, self._tokens[idx] + (now - self._stamps[idx]) * self.rate / self.per)
+        self._stamps[idx] = now
+
+        if tokens >= 1:
+            self._tokens[idx] = tokens - 1
+            return 0.0
+
+        self._tokens[idx] = tokens
+        return (1 - tokens) * self.per / self.rate
+
+    def is_ratelimited(self, obj: T.Union[discord.Guild, discord.Member, discord.User]) -> float:
+        return self.hit(obj.id)
 
-    def is_ratelimited(self, obj: T.Union[discord.Guild, discord.Member]) -> bool:
-        if isinstance(obj, discord.Guild):
-            return self.by_guild.get_bucket(obj).update_rate_limit()
+    def stats(self) -> T.Dict[str, int]:
+        return {"live": self.live, "capacity": self.capacity, "evicted": self.evicted}
 
-        return self.by_member.get_bucket(obj).update_rate_limit()
+    @classmethod
+    def all_stats(cls) -> T.Dict[str, T.Dict[str, int]]:
+        return {_.name: _.stats() for _ in cls._instances}
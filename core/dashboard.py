@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import typing as T
+from datetime import datetime
+
+import discord
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("ScrimSummary", "ScrimDashboard")
+
+
+class ScrimSummary(T.NamedTuple):
+    id: int
+    guild_id: int
+    name: str
+    registration_channel_id: int
+    stoggle: bool
+    open_time: datetime
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    @property
+    def registration_channel(self) -> T.Optional[discord.TextChannel]:
+        from models import Scrim
+
+        return Scrim.bot.get_channel(self.registration_channel_id)
+
+    def __str__(self):
+        return f"{getattr(self.registration_channel,'mention','deleted-channel')} (ID: {self.id})"
+
+
+class ScrimDashboard:
+    """
+    Per-guild read model of scrims, ordered by open time, for dashboards and selectors.
+
+    A guild's list is loaded with one projected query the first time it's needed
+    and dropped whenever a scrim of the guild is created, deleted or one of the summarized fields changes.
+    """
+
+    FIELDS = ("id", "guild_id", "name", "registration_channel_id", "stoggle", "open_time")
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+        self._guilds: T.Dict[int, T.List[ScrimSummary]] = {}
+
+    async def scrims(self, guild_id: int) -> T.List[ScrimSummary]:
+        from models import Scrim
+
+        if (summaries := self._guilds.get(guild_id)) is None:
+            records = await Scrim.filter(guild_id=guild_id).order_by("open_time").values_list(*self.FIELDS)
+            summaries = self._guilds[guild_id] = [ScrimSummary(*_) for _ in records]
+
+        return summaries
+
+    async def position(self, guild_id: int, scrim_id: int) -> T.Tuple[int, int]:
+        """(position of scrim among the guild's scrims starting at 1 or 0 if it's gone, total scrims)"""
+        summaries = await self.scrims(guild_id)
+
+        if (idx := self.__index(summaries, scrim_id)) is None:
+            # created somewhere that didn't invalidate, the guild is loaded once more.
+            self.invalidate(guild_id)
+            summaries = await self.scrims(guild_id)
+            idx = self.__index(summaries, scrim_id)
+
+        return idx or 0, len(summaries)
+
+    @staticmethod
+    def __index(summaries: T.List[ScrimSummary], scrim_id: int) -> T.Optional[int]:
+        return next((idx for idx, _ in enumerate(summaries, start=1) if _.id == scrim_id), None)
+
+    def invalidate(self, guild_id: int, changed: T.Iterable[str] = None) -> None:
+        """Forget a guild's scrims, if `changed` fields are given only when one of them is summarized."""
+        if changed is None or not set(changed).isdisjoint(self.FIELDS):
+            self._guilds.pop(guild_id, None)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+from datetime import datetime, timedelta, timezone
+
+import discord
+
+from constants import OutboundPriority
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("DMDelivery",)
+
+
+class DMDelivery:
+    """
+    Sends DMs through the outbound scheduler, which caps how many run at once.
+
+    DM channel ids are cached so a user's DM channel is opened only once, and users whose DMs refused
+    a message are recorded and skipped until `retry_after` has passed.
+    """
+
+    def __init__(self, bot: Quotient, *, retry_after: timedelta = timedelta(days=7)):
+        self.bot = bot
+        self.retry_after = retry_after
+
+        self._channels: T.Dict[int, int] = {}  # user_id: dm channel_id
+        self._closed: T.Dict[int, datetime] = {}  # user_id: failed at
+
+    async def load(self):
+        from models import ClosedDM
+
+        records = await ClosedDM.filter(failed_at__gte=self.bot.current_time - self.retry_after).values_list(
+            "user_id", "failed_at"
+        )
+        self._closed = {
+            user_id: failed_at if failed_at.tzinfo else failed_at.replace(tzinfo=timezone.utc)
+            for user_id, failed_at in records
+        }
+
+    def is_closed(self, user_id: int) -> bool:
+        if (failed_at := self._closed.get(user_id)) is None:
+            return False
+
+        if failed_at + self.retry_after > self.bot.current_time:
+            return True
+
+        del self._closed[user_id]
+        return False
+
+    async def send(self, user_id: int, **kwargs) -> bool:
+        """DM a user, returns whether the message was delivered."""
+        if self.is_closed(user_id):
+            return False
+
+        return bool(await self.bot.outbound.submit(OutboundPriority.dm, user_id, lambda: self.__send(user_id, **kwargs)))
+
+    async def send_many(self, user_ids: T.Iterable[int], **kwargs) -> T.Set[int]:
+        """DM the same message to many users, returns the ids it was delivered to."""
+        user_ids = list(dict.fromkeys(user_ids))
+        results = await asyncio.gather(*(self.send(_, **kwargs) for _ in user_ids))
+        return {user_id for user_id, delivered in zip(user_ids, results) if delivered}
+
+    async def __send(self, user_id: int, **kwargs) -> bool:
+        try:
+            if (channel_id := self._channels.get(user_id)) is None:
+                channel_id = self._channels[user_id] = (await self.bot.create_dm(discord.Object(id=user_id))).id
+
+            await self.bot.get_partial_messageable(channel_id, type=discord.ChannelType.private).send(**kwargs)
+
+        except discord.Forbidden:
+            await self.__closed(user_id)
+            return False
+
+        except discord.NotFound:  # unknown user
+            self._channels.pop(user_id, None)
+            return False
+
+        return True
+
+    async def __closed(self, user_id: int):
+        from models import ClosedDM
+
+        self._closed[user_id] = self.bot.current_time
+        await ClosedDM.update_or_create({"failed_at": self.bot.current_time}, user_id=user_id)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import tempfile
+import typing as T
+
+import discord
+
+from constants import ExportFormat
+from utils import split_list
+
+if T.TYPE_CHECKING:
+    from models import Scrim, SSVerify, Tourney
+
+    from .Bot import Quotient
+
+__all__ = ("DataExporter",)
+
+
+Columns = T.Sequence[T.Tuple[str, str]]  # (csv header, jsonl key)
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return " | ".join(map(str, value))
+
+    # excel shows discord ids in scientific notation unless they are text.
+    if isinstance(value, int) and value > 10**15:
+        return f"'{value}"
+
+    return value
+
+
+class DataExporter:
+    """
+    Exports registration data of tourneys & scrims, ssverify submissions and scrim bans as CSV or JSONL.
+
+    Rows are read from the database `page_size` at a time and encoded & written to a spooled
+    temporary file in the default executor, so neither the whole table nor the whole file
+    is ever built up on the event loop.
+    """
+
+    def __init__(self, bot: Quotient, *, page_size: int = 500, spool_size: int = 4 * 1024 * 1024):
+        self.bot = bot
+        self.page_size = page_size
+        self.spool_size = spool_size
+
+    async def tourney(self, tourney: Tourney, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        guild = tourney.guild
+
+        columns = (
+            ("Reg Posi", "num"),
+            ("Team Name", "team_name"),
+            ("Leader", "leader"),
+            ("Leader ID", "leader_id"),
+            ("Teammates", "teammates"),
+            ("Teammates in Server", "teammates_in_server"),
+            ("Jump URL", "jump_url"),
+        )
+
+        async def pages():
+            async for page in self.__related_pages(
+                tourney, "assigned_slots", "num", ("num", "team_name", "leader_id", "members", "jump_url")
+            ):
+                yield [
+                    (
+                        num,
+                        team_name,
+                        str(guild.get_member(leader_id)),
+                        leader_id,
+                        [f"{str(guild.get_member(m))} ({m})" for m in members],
+                        sum(1 for m in members if guild.get_member(m)),
+                        jump_url,
+                    )
+                    for num, team_name, leader_id, members, jump_url in page
+                ]
+
+        return await self.__export(f"tourney_data_{tourney.id}", fmt, columns, pages())
+
+    async def scrim(self, scrim: Scrim, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        guild = scrim.guild
+
+        columns = (
+            ("Slot", "num"),
+            ("Team Name", "team_name"),
+            ("Leader", "leader"),
+            ("Leader ID", "leader_id"),
+            ("Teammates", "teammates"),
+            ("Jump URL", "jump_url"),
+        )
+
+        async def pages():
+            async for page in self.__related_pages(
+                scrim, "assigned_slots", "num", ("num", "team_name", "user_id", "members", "jump_url")
+            ):
+                yield [
+                    (
+                        num,
+                        team_name,
+                        str(guild.get_member(user_id)),
+                        user_id,
+                        [f"{str(guild.get_member(m))} ({m})" for m in members],
+                        jump_url,
+                    )
+                    for num, team_name, user_id, members, jump_url in page
+                ]
+
+        return await self.__export(f"scrim_data_{scrim.id}", fmt, columns, pages())
+
+    async def bans(self, scrim: Scrim, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        columns = (
+            ("User", "user"),
+            ("User ID", "user_id"),
+            ("Reason", "reason"),
+            ("Expires", "expires"),
+        )
+
+        async def pages():
+            async for page in self.__related_pages(scrim, "banned_teams", "id", ("user_id", "reason", "expires")):
+                yield [
+                    (str(self.bot.get_user(user_id)), user_id, reason, expires or "Lifetime")
+                    for user_id, reason, expires in page
+                ]
+
+        return await self.__export(f"scrim_bans_{scrim.id}", fmt, columns, pages())
+
+    async def ssverify(self, record: SSVerify, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        columns = (
+            ("User", "user"),
+            ("User ID", "user_id"),
+            ("Submitted At", "submitted_at"),
+            ("Jump URL", "jump_url"),
+        )
+
+        async def pages():
+            async for page in self.__related_pages(
+                record, "data", "submitted_at", ("author_id", "channel_id", "message_id", "submitted_at")
+            ):
+                yield [
+                    (
+                        str(self.bot.get_user(author_id)),
+                        author_id,
+                        submitted_at,
+                        f"https://discord.com/channels/{record.guild_id}/{channel_id}/{message_id}",
+                    )
+                    for author_id, channel_id, message_id, submitted_at in page
+                ]
+
+        return await self.__export(f"ssverify_data_{record.id}", fmt, columns, pages())
+
+    async def __related_pages(
+        self, owner, field: str, order_by: str, fields: T.Sequence[str]
+    ) -> T.AsyncIterator[T.List[tuple]]:
+        """
+        Pages of `fields` of the rows related to `owner` through a ManyToMany `field`, ordered by `order_by`.
+
+        The relations are read once (ids & sort key only), the rows themselves a page at a time.
+        """
+        from models.helpers import M2MTable
+
+        related = await M2MTable(owner.__class__, field).pairs_by(order_by, owner_ids=(owner.pk,))
+        related.sort(key=lambda _: (_[2] is None, _[2], _[1]))
+
+        model = owner._meta.fields_map[field].related_model
+        for ids in split_list((_[1] for _ in related), self.page_size):
+            rows = {row[0]: row[1:] for row in await model.filter(pk__in=ids).values_list("id", *fields)}
+            yield [rows[_] for _ in ids if _ in rows]
+
+    async def __export(
+        self, name: str, fmt: ExportFormat, columns: Columns, pages: T.AsyncIterator[T.List[tuple]]
+    ) -> discord.File:
+        fp = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+
+        if fmt == ExportFormat.csv:
+            await self.bot.loop.run_in_executor(None, self.__write_csv, fp, [[_[0] for _ in columns]])
+
+        async for rows in pages:
+            if fmt == ExportFormat.csv:
+                await self.bot.loop.run_in_executor(None, self.__write_csv, fp, rows)
+            else:
+                await self.bot.loop.run_in_executor(None, self.__write_jsonl, fp, [_[1] for _ in columns], rows)
+
+        fp.seek(0)
+        return discord.File(fp, filename=f"{name}_{self.bot.current_time.timestamp()}.{fmt.value}")
+
+    @staticmethod
+    def __write_csv(fp: T.IO[bytes], rows: T.Iterable[T.Sequence]):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+
+        fp.write(buffer.getvalue().encode())
+
+    @staticmethod
+    def __write_jsonl(fp: T.IO[bytes], keys: T.Sequence[str], rows: T.Iterable[T.Sequence]):
+        fp.write(
+            "".join(json.dumps(dict(zip(keys, row)), default=str, ensure_ascii=False) + "\n" for row in rows).encode()
+        )
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing as T
+from collections import Counter
+
+import discord
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("TTLCache", "FetchCoordinator")
+
+
+class TTLCache:
+    """
+    A dict whose entries expire `ttl` seconds after they were set, holding at most `maxsize` of them.
+
+    Every entry lives equally long, so insertion order is expiry order and expired entries
+    are dropped from the front whenever something is set.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: T.Dict[T.Hashable, T.Tuple[float, T.Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key):
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._expire()
+
+    def get(self, key, default=None):
+        if (item := self._data.get(key)) is None:
+            return default
+
+        if item[0] <= time.monotonic():
+            del self._data[key]
+            return default
+
+        return item[1]
+
+    def pop(self, key, default=None):
+        item = self._data.pop(key, None)
+        return default if item is None or item[0] <= time.monotonic() else item[1]
+
+    def discard_where(self, predicate: T.Callable[[T.Hashable, T.Any], bool]):
+        """Drop every entry for which `predicate(key, value)` is true."""
+        for key in [k for k, (_, v) in self._data.items() if predicate(k, v)]:
+            del self._data[key]
+
+    def _expire(self):
+        now = time.monotonic()
+        while self._data:
+            key = next(iter(self._data))
+            if self._data[key][0] > now and len(self._data) <= self.maxsize:
+                break
+
+            del self._data[key]
+
+
+class FetchCoordinator:
+    """
+    Fetches of discord objects that aren't cached.
+
+    Concurrent fetches of the same object share one request, and objects that turned out
+    to not exist are remembered for `negative_ttl` seconds instead of being asked for again.
+    """
+
+    def __init__(self, bot: Quotient, *, negative_ttl: float = 60, message_ttl: float = 300):
+        self.bot = bot
+
+        self.messages = TTLCache(message_ttl)
+        self._missing = TTLCache(negative_ttl, maxsize=8192)
+        self._inflight: T.Dict[T.Hashable, asyncio.Future] = {}
+
+        self.counts: T.Counter[str] = Counter()
+
+    async def fetch(self, key: T.Hashable, factory: T.Callable[[], T.Awaitable[T.Any]]) -> T.Any:
+        """Result of `factory()`, or None if the object doesn't exist or couldn't be fetched."""
+        if key in self._missing:
+            self.counts["negative_hit"] += 1
+            return None
+
+        if (future := self._inflight.get(key)) is not None:
+            self.counts["joined"] += 1
+            return await asyncio.shield(future)
+
+        self.counts["miss"] += 1
+        future = self._inflight[key] = self.bot.loop.create_future()
+
+        result = None
+        try:
+            result = await factory()
+        except discord.NotFound:
+            pass
+        except discord.HTTPException:
+            future.set_result(None)
+            return None
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(result)
+
+        if result is None:
+            self._missing[key] = True
+
+        return result
+
+    def hit(self):
+        self.counts["hit"] += 1
+
+    def forget(self, key: T.Hashable):
+        """Drop a negative result, for when the object is known to exist now."""
+        self._missing.pop(key)
+
+    def member_joined(self, member: discord.Member):
+        # both the keys of get_or_fetch_member and of getch(guild.get_member, guild.fetch_member, ...)
+        self.forget(("member", member.guild.id, member.id))
+        self.forget((discord.Guild.fetch_member.__qualname__, member.guild.id, member.id))
+
+    def message_created(self, message: discord.Message):
+        self.forget(("message", message.id))
+
+    def stats(self) -> T.Dict[str, int]:
+        return {
+            **self.counts,
+            "inflight": len(self._inflight),
+            "negative": len(self._missing),
+            "messages": len(self.messages),
+        }
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import typing as T
+from collections import defaultdict
+
+from utils import split_list
+
+if T.TYPE_CHECKING:
+    from models import TMSlot, Tourney
+
+    from .Bot import Quotient
+
+__all__ = ("TourneyGroups",)
+
+
+class TourneyGroups:
+    """
+    Groups of every tourney, split once per (tourney, group size) from a single ordered query.
+
+    Every tourney has a slot version, anything that adds, removes, renames or renumbers an
+    assigned slot bumps it and groups made from an older version are split again when next needed.
+    """
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+
+        self._versions: T.DefaultDict[int, int] = defaultdict(int)
+        self._groups: T.Dict[T.Tuple[int, int], T.Tuple[int, T.List[T.List[TMSlot]]]] = {}
+
+    def bump(self, tourney_id: int) -> None:
+        self._versions[tourney_id] += 1
+
+        for key in [_ for _ in self._groups if _[0] == tourney_id]:
+            del self._groups[key]
+
+    async def groups(self, tourney: Tourney, size: int = None) -> T.List[T.List[TMSlot]]:
+        size = size or tourney.group_size
+        version = self._versions[tourney.id]
+
+        cached = self._groups.get((tourney.id, size))
+        if cached and cached[0] == version:
+            return cached[1]
+
+        groups = split_list(await tourney.assigned_slots.all().order_by("num"), size)
+
+        # slots may have changed while they were being fetched, then these groups are stale already.
+        if self._versions[tourney.id] == version:
+            self._groups[(tourney.id, size)] = (version, groups)
+
+        return groups
+
+    async def group(self, tourney: Tourney, num: int, size: int = None) -> T.Optional[T.List[TMSlot]]:
+        groups = await self.groups(tourney, size)
+        if 0 < num <= len(groups):
+            return groups[num - 1]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import traceback
+import typing as T
+from datetime import timedelta
+
+import config
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("GuildReconciler",)
+
+
+class GuildReconciler:
+    """
+    Keeps guild_data in line with the guilds the bot is actually in.
+
+    Once ready, the gateway guild set is diffed against the cached guild_data ids: missing rows are inserted
+    `chunk_size` at a time with one executemany each, guilds that are gone are recorded as departed.
+    Data of guilds departed for longer than `retention` is purged in the background, `purge_batch` guilds at a time.
+    """
+
+    INSERT = """
+    INSERT INTO guild_data (
+        guild_id, prefix, embed_color, embed_footer, tag_enabled_for_everyone,
+        is_premium, premium_notified, public_profile, dashboard_access
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id) DO NOTHING
+    """
+
+    def __init__(
+        self,
+        bot: Quotient,
+        *,
+        chunk_size: int = 1000,
+        retention: timedelta = timedelta(days=30),
+        purge_batch: int = 50,
+        purge_pause: float = 5,
+    ):
+        self.bot = bot
+        self.chunk_size = chunk_size
+        self.retention = retention
+        self.purge_batch = purge_batch
+        self.purge_pause = purge_pause
+
+        self._purge_task: T.Optional[asyncio.Task] = None
+
+    @staticmethod
+    def __row(guild_id: int) -> list:
+        return [
+            guild_id,
+            config.PREFIX,
+            config.COLOR,
+            config.FOOTER,
+            True,  # tag_enabled_for_everyone
+            True,  # is_premium, new guilds are premium by default
+            False,  # premium_notified
+            True,  # public_profile
+            '{"embed": [], "scrims": [], "tourney": [], "slotm": []}',  # dashboard_access
+        ]
+
+    def __chunks(self, ids: T.List[int]) -> T.Iterator[T.List[int]]:
+        for idx in range(0, len(ids), self.chunk_size):
+            yield ids[idx : idx + self.chunk_size]
+
+    async def reconcile(self):
+        from models import DepartedGuild
+
+        started = time.perf_counter()
+
+        current = {g.id for g in self.bot.guilds}
+        known = set(self.bot.cache.guild_data)
+
+        missing, departed = sorted(current - known), sorted(known - current)
+
+        for chunk in self.__chunks(missing):
+            await self.bot.db.execute_many(self.INSERT, [self.__row(_) for _ in chunk])
+
+            for guild_id in chunk:
+                self.bot.premium.set_guild(guild_id)
+                self.bot.cache.guild_data[guild_id] = {"color": config.COLOR, "footer": config.FOOTER}
+
+        recorded = set(await DepartedGuild.all().values_list("guild_id", flat=True))
+
+        if rejoined := recorded & current:
+            await DepartedGuild.filter(guild_id__in=rejoined).delete()
+
+        for chunk in self.__chunks([_ for _ in departed if _ not in recorded]):
+            await DepartedGuild.bulk_create([DepartedGuild(guild_id=_) for _ in chunk], ignore_conflicts=True)
+
+        print(
+            f"Guilds reconciled in {(time.perf_counter() - started) * 1000:.1f}ms "
+            f"({len(missing)} added, {len(departed)} departed, {len(rejoined)} rejoined)"
+        )
+
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = self.bot.loop.create_task(self.__purge_expired())
+
+    async def joined(self, guild_id: int):
+        from models import DepartedGuild
+
+        await DepartedGuild.filter(guild_id=guild_id).delete()
+
+    async def left(self, guild_id: int):
+        from models import DepartedGuild
+
+        await DepartedGuild.get_or_create(guild_id=guild_id)
+
+    async def __purge_expired(self):
+        from models import DepartedGuild
+
+        started, purged = time.perf_counter(), 0
+
+        while not self.bot.is_closed():
+            ids = await (
+                DepartedGuild.filter(left_at__lte=self.bot.current_time - self.retention)
+                .order_by("left_at")
+                .limit(self.purge_batch)
+                .values_list("guild_id", flat=True)
+            )
+            if not ids:
+                break
+
+            try:
+                await self.purge(ids)
+            except Exception:
+                traceback.print_exc()
+                break
+
+            purged += len(ids)
+            await asyncio.sleep(self.purge_pause)
+
+        if purged:
+            print(f"Purged data of {purged} departed guilds in {time.perf_counter() - started:.1f}s")
+
+    async def purge(self, guild_ids: T.List[int]):
+        """
+        Delete the data of guilds the bot isn't in.
+
+        guild_data of a guild with paid premium time left is kept, so that premium isn't lost if the bot is
+        added back. Its departure stays recorded, dated to the premium end, so the row is purged once
+        `retention` has passed after that. Guilds premium without an end time only have the premium every
+        new guild gets, which they get again on rejoin.
+        """
+        from models import (
+            AutoPurge,
+            Autorole,
+            DepartedGuild,
+            EasyTag,
+            Guild,
+            Lockdown,
+            Scrim,
+            ScrimsSlotManager,
+            SSVerify,
+            TagCheck,
+            Tourney,
+        )
+
+        gone = [_ for _ in guild_ids if self.bot.get_guild(_) is None]
+        kept: T.Dict[int, T.Any] = {}
+
+        if gone:
+            cascade = self.bot.cascade
+            await cascade.scrims(await Scrim.filter(guild_id__in=gone).values_list("id", flat=True))
+            await cascade.tourneys(await Tourney.filter(guild_id__in=gone).values_list("id", flat=True))
+            await cascade.ssverify(await SSVerify.filter(guild_id__in=gone).values_list("id", flat=True))
+            await cascade.slot_managers(
+                await ScrimsSlotManager.filter(guild_id__in=gone).values_list("id", flat=True)
+            )
+
+            for model in (TagCheck, EasyTag, AutoPurge, Autorole, Lockdown):
+                await model.filter(guild_id__in=gone).delete()
+
+            kept = dict(
+                await Guild.filter(
+                    guild_id__in=gone, is_premium=True, premium_end_time__gt=self.bot.current_time
+                ).values_list("guild_id", "premium_end_time")
+            )
+            await Guild.filter(guild_id__in=[_ for _ in gone if _ not in kept]).delete()
+
+            for guild_id in gone:
+                if guild_id not in kept:
+                    self.bot.cache.guild_data.pop(guild_id, None)
+                    self.bot.premium.revoke_guild(guild_id)
+
+        for guild_id, end_time in kept.items():
+            await DepartedGuild.filter(guild_id=guild_id).update(left_at=end_time)
+
+        await DepartedGuild.filter(guild_id__in=[_ for _ in guild_ids if _ not in kept]).delete()
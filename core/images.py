@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+import typing as T
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import discord
+
+from utils.render_worker import init_worker, render_rows
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("ImageRenderer",)
+
+
+class ImageRenderer:
+    """
+    Renders images in a dedicated process pool, so that pillow never holds the event loop or the
+    default executor. At most `workers` images are rendered at a time, fonts are loaded once per worker.
+
+    Workers are spawned rather than forked (the bot process already runs threads), the functions
+    they run live in `utils.render_worker` so that a worker never imports the bot.
+    """
+
+    FONTS = (("Ubuntu-Regular", 16),)
+
+    def __init__(self, bot: Quotient, *, workers: int = 2):
+        self.bot = bot
+        self.workers = workers
+
+        self._pool: T.Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.FONTS,),
+            )
+
+        return self._pool
+
+    async def run(self, func: T.Callable, *args, **kwargs):
+        """Runs a picklable, module level `func` in the pool."""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(func, *args, **kwargs))
+
+    async def rows(
+        self,
+        rows: T.Sequence[str],
+        filename: str,
+        *,
+        per_image: int = 10,
+        width: int = 290,
+        row_height: int = 30,
+        gap: int = 10,
+        font: T.Tuple[str, int] = FONTS[0],
+        fill: str = "#2e2e2e",
+        color: str = "white",
+        template: T.Optional[str] = None,
+    ) -> T.List[discord.File]:
+        """A list of text rows (slotlists, group lists, tables) as images of `per_image` rows each."""
+        images = await self.run(
+            render_rows,
+            list(rows),
+            per_image=per_image,
+            width=width,
+            row_height=row_height,
+            gap=gap,
+            font=font,
+            fill=fill,
+            color=color,
+            template=template,
+        )
+        return [discord.File(io.BytesIO(_), filename) for _ in images]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import typing as T
+from collections import Counter, defaultdict
+
+from tortoise.transactions import in_transaction
+
+if T.TYPE_CHECKING:
+    from models import AssignedSlot, Scrim, Tourney
+
+    from .Bot import Quotient
+
+__all__ = ("SlotLedger", "SlotLedgers", "TourneyLedger", "TourneyLedgers")
+
+
+class LedgerSlot(T.NamedTuple):
+    id: int
+    num: int
+    user_id: T.Optional[int]
+    team_name: str
+
+
+class SlotLedger:
+    """
+    In-memory view of one scrim's available and assigned slots.
+
+    Claims and cancels of a scrim are serialized through `lock`, and every operation
+    is persisted in a single transaction before the in-memory state is updated.
+    """
+
+    def __init__(self, scrim_id: int):
+        self.scrim_id = scrim_id
+        self.lock = asyncio.Lock()
+
+        self.loaded = False
+        self.available: T.Set[int] = set()
+        self.slots: T.Dict[int, LedgerSlot] = {}
+        self.by_user: T.DefaultDict[int, T.Set[int]] = defaultdict(set)
+
+    async def load(self):
+        """(Re)build the ledger from the database, must be called with `lock` held."""
+        from models import Scrim
+
+        self.available.clear()
+        self.slots.clear()
+        self.by_user.clear()
+
+        if scrim := await Scrim.get_or_none(pk=self.scrim_id):
+            self.available.update(scrim.available_slots)
+
+            for slot in await scrim.assigned_slots.all():
+                self._add(slot)
+
+        self.loaded = True
+
+    def _add(self, slot: AssignedSlot):
+        self.slots[slot.pk] = LedgerSlot(slot.pk, slot.num, slot.user_id, slot.team_name)
+        if slot.user_id:
+            self.by_user[slot.user_id].add(slot.pk)
+
+    def _remove(self, slot_id: int) -> T.Optional[LedgerSlot]:
+        slot = self.slots.pop(slot_id, None)
+        if slot and slot.user_id and (_ids := self.by_user.get(slot.user_id)):
+            _ids.discard(slot_id)
+            if not _ids:
+                del self.by_user[slot.user_id]
+
+        return slot
+
+    def user_slots(self, user_id: int) -> T.List[LedgerSlot]:
+        return sorted((self.slots[_] for _ in self.by_user.get(user_id, ())), key=lambda x: x.num)
+
+    def holds(self, user_id: int, slot_id: int) -> bool:
+        return slot_id in self.by_user.get(user_id, ())
+
+    async def claim(
+        self, scrim: Scrim, user_id: int, num: int, team_name: str, *, multiple_slots: bool = False
+    ) -> T.Optional[AssignedSlot]:
+        """
+        Assign slot `num` to `user_id`.
+        Returns None if the slot is already taken or the user already has a slot and `multiple_slots` is off.
+        """
+        from models import ArrayRemove, AssignedSlot, Scrim
+
+        async with self.lock:
+            if not self.loaded:
+                await self.load()
+
+            if num not in self.available:
+                return None
+
+            if not multiple_slots and user_id in self.by_user:
+                return None
+
+            async with in_transaction():
+                await Scrim.filter(pk=self.scrim_id).update(available_slots=ArrayRemove("available_slots", num))
+                slot = await AssignedSlot.create(num=num, user_id=user_id, members=[user_id], team_name=team_name)
+                await scrim.assigned_slots.add(slot)
+
+            self.available.discard(num)
+            self._add(slot)
+            return slot
+
+    async def cancel(self, user_id: int, slot_id: int) -> T.Optional[LedgerSlot]:
+        """
+        Remove slot `slot_id` of `user_id` and make its number claimable again.
+        Returns None if the user doesn't hold that slot (anymore).
+        """
+        from models import ArrayAppend, AssignedSlot, Scrim
+
+        async with self.lock:
+            if not self.loaded:
+                await self.load()
+
+            if not self.holds(user_id, slot_id):
+                return None
+
+            slot = self.slots[slot_id]
+            async with in_transaction():
+                await AssignedSlot.filter(pk=slot_id).delete()
+                await Scrim.filter(pk=self.scrim_id).update(available_slots=ArrayAppend("available_slots", slot.num))
+
+            self._remove(slot_id)
+            self.available.add(slot.num)
+            return slot
+
+
+class SlotLedgers:
+    """Keeps a `SlotLedger` for every scrim whose slots are being claimed/cancelled through slot-manager."""
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+        self._ledgers: T.Dict[int, SlotLedger] = {}
+
+    async def get(self, scrim: Scrim) -> SlotLedger:
+        if not (ledger := self._ledgers.get(scrim.pk)):
+            ledger = self._ledgers[scrim.pk] = SlotLedger(scrim.pk)
+
+        if not ledger.loaded:
+            async with ledger.lock:
+                if not ledger.loaded:
+                    await ledger.load()
+
+        return ledger
+
+    def peek(self, scrim_id: int) -> T.Optional[SlotLedger]:
+        """The ledger of a scrim if it's loaded, without loading it."""
+        if (ledger := self._ledgers.get(scrim_id)) and ledger.loaded:
+            return ledger
+
+    def discard(self, scrim_id: int) -> None:
+        """
+        Mark the ledger of a scrim stale, it will be rebuilt from the database on next use.
+        Must be called whenever slots of a scrim are changed outside the ledger.
+
+        The ledger (and its lock) is kept, so the rebuild waits for a claim or cancel that is still in flight.
+        """
+        if ledger := self._ledgers.get(scrim_id):
+            ledger.loaded = False
+
+
+class TourneyLedger:
+    """
+    In-memory slot counters of one tourney: next slot number, filled count, leaders, team names
+    and the registration message ids slots were made from.
+
+    Checks and `claim` never await, so two registrations can't get the same number
+    or both take the last slot, no matter how they interleave.
+    """
+
+    def __init__(self, tourney_id: int):
+        self.tourney_id = tourney_id
+        self.lock = asyncio.Lock()
+
+        self.loaded = False
+        self.next_num = 1
+        self.filled = 0
+        self.leaders: T.Counter[int] = Counter()
+        self.team_names: T.Counter[str] = Counter()
+        self.message_ids: T.Set[int] = set()
+
+    async def load(self, tourney: Tourney):
+        slots = await tourney.assigned_slots.all().values_list("num", "leader_id", "team_name", "message_id")
+        for num, leader_id, team_name, message_id in slots:
+            self.next_num = max(self.next_num, num + 1)
+            self._add(leader_id, team_name, message_id)
+
+        self.loaded = True
+
+    def _add(self, leader_id: int, team_name: str, message_id: T.Optional[int]):
+        self.filled += 1
+        self.leaders[leader_id] += 1
+        self.team_names[team_name] += 1
+        if message_id:
+            self.message_ids.add(message_id)
+
+    @staticmethod
+    def _uncount(counter: Counter, key):
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def has_leader(self, leader_id: int) -> bool:
+        return self.leaders[leader_id] > 0
+
+    def has_team(self, team_name: str) -> bool:
+        return self.team_names[team_name] > 0
+
+    def is_full(self, tourney: Tourney) -> bool:
+        return self.filled >= tourney.total_slots
+
+    def claim(self, leader_id: int, team_name: str, message_id: int = None) -> int:
+        """Count a new slot of `leader_id`, returns its number."""
+        num, self.next_num = self.next_num, self.next_num + 1
+        self._add(leader_id, team_name, message_id)
+        return num
+
+    def release(self, leader_id: int, team_name: str, message_id: int = None):
+        """Uncount a deleted (or claimed but never saved) slot, its number isn't handed out again."""
+        self.filled = max(self.filled - 1, 0)
+        self._uncount(self.leaders, leader_id)
+        self._uncount(self.team_names, team_name)
+        self.message_ids.discard(message_id)
+
+    def rename(self, old: str, new: str):
+        self._uncount(self.team_names, old)
+        self.team_names[new] += 1
+
+
+class TourneyLedgers:
+    """
+    Keeps a `TourneyLedger` for every tourney taking registrations.
+
+    Slots added outside of registration should be claimed through the ledger as well,
+    deleted & renamed slots are reflected with `release` / `rename`.
+    `discard` is only for tourneys that are deleted altogether.
+    """
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+        self._ledgers: T.Dict[int, TourneyLedger] = {}
+
+    async def get(self, tourney: Tourney) -> TourneyLedger:
+        if not (ledger := self._ledgers.get(tourney.pk)):
+            ledger = self._ledgers[tourney.pk] = TourneyLedger(tourney.pk)
+
+        if not ledger.loaded:
+            async with ledger.lock:
+                if not ledger.loaded:
+                    await ledger.load(tourney)
+
+        return ledger
+
+    def peek(self, tourney_id: int) -> T.Optional[TourneyLedger]:
+        """The ledger of a tourney if it's loaded, without loading it."""
+        if (ledger := self._ledgers.get(tourney_id)) and ledger.loaded:
+            return ledger
+
+    def release(self, tourney_id: int, leader_id: int, team_name: str, message_id: int = None) -> None:
+        if ledger := self.peek(tourney_id):
+            ledger.release(leader_id, team_name, message_id)
+
+    def rename(self, tourney_id: int, old: str, new: str) -> None:
+        if ledger := self.peek(tourney_id):
+            ledger.rename(old, new)
+
+    def discard(self, tourney_id: int) -> None:
+        self._ledgers.pop(tourney_id, None)
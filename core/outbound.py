@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import traceback
+import typing as T
+from collections import Counter, defaultdict, deque
+
+import discord
+
+from constants import OutboundPriority
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("OutboundScheduler",)
+
+
+class _Job:
+    __slots__ = ("priority", "seq", "bucket", "key", "factory", "futures", "queued_at")
+
+    def __init__(self, priority: OutboundPriority, seq: int, bucket: int, key, factory, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.bucket = bucket
+        self.key = key
+        self.factory = factory
+        self.futures = [future]
+        self.queued_at = time.perf_counter()
+
+    def __lt__(self, other: "_Job"):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class OutboundScheduler:
+    """
+    Runs outbound Discord calls (reactions, role grants, edits, logs, DMs) by priority.
+
+    Every job belongs to a bucket, the channel/guild/user id it hits. A bucket runs one job at a time,
+    so jobs never race each other for the same route, and of all buckets with work the one holding
+    the most urgent job goes first. A job submitted with a `key` replaces the pending job with the same
+    key (edits of the same message), and low priority classes are shed once too many of them are pending.
+    A class with a `concurrency` cap never has more jobs than that running, buckets that would exceed it
+    are parked until one of its jobs finishes, so the workers are free for the other classes meanwhile.
+
+    `submit` returns a future resolving to the result of the call, or None if it failed or was shed.
+    """
+
+    def __init__(
+        self,
+        bot: Quotient,
+        *,
+        workers: int = 8,
+        limits: T.Optional[T.Dict[OutboundPriority, int]] = None,
+        concurrency: T.Optional[T.Dict[OutboundPriority, int]] = None,
+    ):
+        self.bot = bot
+        self.workers = workers
+        self.limits = limits or {OutboundPriority.slotlist: 500, OutboundPriority.log: 1000, OutboundPriority.dm: 5000}
+        self.concurrency = concurrency or {}
+
+        self._seq = itertools.count()
+        self._buckets: T.Dict[int, T.List[_Job]] = {}
+        self._busy: T.Set[int] = set()
+        self._keyed: T.Dict[T.Hashable, _Job] = {}
+        self._ready: T.Optional[asyncio.PriorityQueue] = None
+        self._running: T.Counter[OutboundPriority] = Counter()
+        self._parked: T.DefaultDict[OutboundPriority, T.Deque[int]] = defaultdict(deque)
+        self._tasks: T.List[asyncio.Task] = []
+
+        # metrics
+        self.pending: T.Counter[OutboundPriority] = Counter()
+        self.executed: T.Counter[OutboundPriority] = Counter()
+        self.coalesced: T.Counter[OutboundPriority] = Counter()
+        self.dropped: T.Counter[OutboundPriority] = Counter()
+        self.queue_waits: T.DefaultDict[OutboundPriority, T.Deque[float]] = defaultdict(lambda: deque(maxlen=512))
+        self.run_times: T.DefaultDict[OutboundPriority, T.Deque[float]] = defaultdict(lambda: deque(maxlen=512))
+
+    def submit(
+        self,
+        priority: OutboundPriority,
+        bucket: int,
+        factory: T.Callable[[], T.Awaitable[T.Any]],
+        *,
+        key: T.Optional[T.Hashable] = None,
+    ) -> asyncio.Future:
+        future = self.bot.loop.create_future()
+
+        if key is not None and (job := self._keyed.get(key)):
+            job.factory = factory
+            job.futures.append(future)
+            self.coalesced[priority] += 1
+            return future
+
+        if (limit := self.limits.get(priority)) is not None and self.pending[priority] >= limit:
+            self.dropped[priority] += 1
+            future.set_result(None)
+            return future
+
+        self.__start()
+
+        job = _Job(priority, next(self._seq), bucket, key, factory, future)
+        heapq.heappush(self._buckets.setdefault(bucket, []), job)
+        self.pending[priority] += 1
+        if key is not None:
+            self._keyed[key] = job
+
+        if bucket not in self._busy:
+            self._ready.put_nowait((job.priority, job.seq, bucket))
+
+        return future
+
+    def stats(self) -> T.Dict[str, T.Dict[str, float]]:
+        """Queue depth, throughput, time spent queued and time spent running (ms) of every priority class."""
+        _stats = {}
+        for priority in OutboundPriority:
+            waits, runs = self.queue_waits[priority], self.run_times[priority]
+            _stats[priority.name] = {
+                "pending": self.pending[priority],
+                "executed": self.executed[priority],
+                "coalesced": self.coalesced[priority],
+                "dropped": self.dropped[priority],
+                "avg_wait": sum(waits) / len(waits) * 1000 if waits else 0,
+                "max_wait": max(waits) * 1000 if waits else 0,
+                "avg_run": sum(runs) / len(runs) * 1000 if runs else 0,
+                "max_run": max(runs) * 1000 if runs else 0,
+            }
+
+        return _stats
+
+    def close(self):
+        """Stop the workers, pending jobs are dropped and their futures resolve to None."""
+        for task in self._tasks:
+            task.cancel()
+
+        self._tasks = []
+
+        for heap in self._buckets.values():
+            for job in heap:
+                for future in job.futures:
+                    if not future.done():
+                        future.set_result(None)
+
+        self._buckets.clear()
+        self._keyed.clear()
+        self._busy.clear()
+        self._parked.clear()
+        self._running.clear()
+        self.pending.clear()
+
+    def __start(self):
+        if self._tasks:
+            return
+
+        self._ready = asyncio.PriorityQueue()
+        self._tasks = [self.bot.loop.create_task(self.__worker()) for _ in range(self.workers)]
+
+    async def __worker(self):
+        while True:
+            _, _, bucket = await self._ready.get()
+
+            # a bucket can be queued more than once, only one worker may pick it up.
+            if bucket in self._busy or not (heap := self._buckets.get(bucket)):
+                continue
+
+            priority = heap[0].priority
+            if (cap := self.concurrency.get(priority)) is not None and self._running[priority] >= cap:
+                self._parked[priority].append(bucket)
+                continue
+
+            job = heapq.heappop(heap)
+            if not heap:
+                del self._buckets[bucket]
+
+            if job.key is not None:
+                self._keyed.pop(job.key, None)
+
+            self.pending[job.priority] -= 1
+            started = time.perf_counter()
+            self.queue_waits[job.priority].append(started - job.queued_at)
+            self._busy.add(bucket)
+            self._running[job.priority] += 1
+
+            result = None
+            try:
+                result = await job.factory()
+            except discord.HTTPException:
+                pass
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.run_times[job.priority].append(time.perf_counter() - started)
+                self._busy.discard(bucket)
+                self._running[job.priority] -= 1
+                self.executed[job.priority] += 1
+
+                for future in job.futures:
+                    if not future.done():
+                        future.set_result(result)
+
+                self.__requeue(bucket)
+
+                # a slot of the class is free, wake a parked bucket. entries can be stale, they are skipped.
+                parked = self._parked[job.priority]
+                while parked and not self.__requeue(parked.popleft()):
+                    pass
+
+    def __requeue(self, bucket: int) -> bool:
+        if bucket in self._busy or not (heap := self._buckets.get(bucket)):
+            return False
+
+        self._ready.put_nowait((heap[0].priority, heap[0].seq, bucket))
+        return True
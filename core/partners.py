@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import traceback
+import typing as T
+
+from tortoise.transactions import in_transaction
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("PartnerSlotWriter",)
+
+
+class PendingPartnerSlot(T.NamedTuple):
+    channel_id: int
+    user_id: int
+    message_id: int
+    jump_url: str
+    members: T.List[int]
+    attempts: int = 0
+
+
+class PartnerSlotWriter:
+    """
+    Media-partner slots, written in batches.
+
+    Nothing reads partner slots while registrations are running, so they are queued and
+    written `delay` seconds later (or once `batch_size` are waiting), a whole batch in one transaction:
+    one insert of the slots, one select of their ids & one insert into the partner <-> slot table.
+
+    If a batch fails its slots are written one by one, so one bad row can't take the rest down with it.
+    Slots that fail on their own go back to the front of the queue, up to `max_attempts` times.
+    """
+
+    def __init__(self, bot: Quotient, *, delay: float = 2, batch_size: int = 200, max_attempts: int = 3):
+        self.bot = bot
+        self.delay = delay
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+        self._pending: T.List[PendingPartnerSlot] = []
+        self._task: T.Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, channel_id: int, user_id: int, message_id: int, jump_url: str, members: T.Iterable[int]):
+        self._pending.append(PendingPartnerSlot(channel_id, user_id, message_id, jump_url, list(members)))
+
+        if len(self._pending) >= self.batch_size:
+            self.bot.loop.create_task(self.flush())
+
+        elif self._task is None:
+            self._task = self.bot.loop.create_task(self.__flush_later())
+
+    async def __flush_later(self):
+        await asyncio.sleep(self.delay)
+        self._task = None
+        await self.flush()
+
+    async def flush(self):
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        try:
+            await self.__write(pending)
+        except Exception:
+            traceback.print_exc()
+            if len(pending) > 1:
+                await self.__write_each(pending)
+            else:
+                self.__retry(pending)
+
+    async def __write_each(self, pending: T.List[PendingPartnerSlot]):
+        failed = []
+        for slot in pending:
+            try:
+                await self.__write([slot])
+            except Exception:
+                failed.append(slot)
+
+        self.__retry(failed)
+
+    def __retry(self, failed: T.List[PendingPartnerSlot]):
+        retry = []
+        for slot in failed:
+            if slot.attempts + 1 < self.max_attempts:
+                retry.append(slot._replace(attempts=slot.attempts + 1))
+            else:
+                print(f"Dropped media-partner slot of message {slot.message_id} after {self.max_attempts} attempts")
+
+        if retry:
+            self._pending[:0] = retry
+            if self._task is None:
+                self._task = self.bot.loop.create_task(self.__flush_later())
+
+    @staticmethod
+    async def __write(pending: T.List[PendingPartnerSlot]):
+        from models import M2MTable, MediaPartner, PartnerSlot
+
+        async with in_transaction():
+            await PartnerSlot.bulk_create(
+                [
+                    PartnerSlot(user_id=_.user_id, message_id=_.message_id, jump_url=_.jump_url, members=_.members)
+                    for _ in pending
+                ]
+            )
+
+            # bulk_create doesn't give ids back, message ids tell the new rows apart.
+            ids = dict(
+                await PartnerSlot.filter(message_id__in=[_.message_id for _ in pending])
+                .order_by("id")
+                .values_list("message_id", "id")
+            )
+            await M2MTable(MediaPartner, "slots").link({(_.channel_id, ids[_.message_id]) for _ in pending})
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import typing as T
+from datetime import datetime, timezone
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("PremiumEntitlements",)
+
+
+class PremiumEntitlements:
+    """
+    In-memory premium state of guilds and users.
+
+    Maps every premium guild/user id to its premium end time (None means it never ends).
+    Loaded in bulk at startup and updated by whatever grants, transfers or revokes premium,
+    so that premium checks never touch the database.
+    """
+
+    def __init__(self, bot: Quotient):
+        self.bot = bot
+
+        self._guilds: T.Dict[int, T.Optional[datetime]] = {}
+        self._users: T.Dict[int, T.Optional[datetime]] = {}
+
+    async def load(self):
+        from models import Guild, User
+
+        self._guilds = dict(await Guild.filter(is_premium=True).values_list("guild_id", "premium_end_time"))
+        self._users = dict(await User.filter(is_premium=True).values_list("user_id", "premium_expire_time"))
+
+    @staticmethod
+    def _active(end_time: T.Optional[datetime], now: datetime) -> bool:
+        if end_time is None:
+            return True
+
+        if end_time.tzinfo is None:
+            end_time = end_time.replace(tzinfo=timezone.utc)
+
+        return end_time > now
+
+    def is_premium_guild(self, guild_id: int) -> bool:
+        return guild_id in self._guilds and self._active(self._guilds[guild_id], self.bot.current_time)
+
+    def is_premium_user(self, user_id: int) -> bool:
+        return user_id in self._users and self._active(self._users[user_id], self.bot.current_time)
+
+    def guild_end_time(self, guild_id: int) -> T.Optional[datetime]:
+        return self._guilds.get(guild_id)
+
+    def user_end_time(self, user_id: int) -> T.Optional[datetime]:
+        return self._users.get(user_id)
+
+    def set_guild(self, guild_id: int, end_time: T.Optional[datetime] = None) -> None:
+        self._guilds[guild_id] = end_time
+
+    def set_user(self, user_id: int, end_time: T.Optional[datetime] = None) -> None:
+        self._users[user_id] = end_time
+
+    def revoke_guild(self, *guild_ids: int) -> None:
+        for guild_id in guild_ids:
+            self._guilds.pop(guild_id, None)
+
+    def revoke_user(self, *user_ids: int) -> None:
+        for user_id in user_ids:
+            self._users.pop(user_id, None)
+
+    async def expire(self) -> T.Tuple[T.List[int], T.List[int]]:
+        """
+        Turn off premium of every user & guild whose premium has ended, with one update per table.
+        Returns the (user_ids, guild_ids) that just expired.
+        """
+        from models import Guild, User
+
+        now = self.bot.current_time
+
+        user_ids = await User.filter(is_premium=True, premium_expire_time__lte=now).values_list("user_id", flat=True)
+        if user_ids:
+            await User.filter(user_id__in=user_ids).update(is_premium=False, premium_expire_time=None)
+
+        guild_ids = await Guild.filter(is_premium=True, premium_end_time__lte=now).values_list("guild_id", flat=True)
+        if guild_ids:
+            await Guild.filter(guild_id__in=guild_ids).update(
+                is_premium=False, premium_end_time=None, made_premium_by=None
+            )
+
+        self.revoke_user(*user_ids)
+        self.revoke_guild(*guild_ids)
+        return user_ids, guild_ids
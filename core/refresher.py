@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import typing as T
+from collections import defaultdict
+from contextlib import suppress
+from datetime import datetime, timezone
+
+import discord
+
+if T.TYPE_CHECKING:
+    from models import Scrim
+
+    from .Bot import Quotient
+
+__all__ = ("SlotmRefresher",)
+
+
+class SlotmRefresher:
+    """
+    Debounces edits of slot-manager public messages.
+
+    Every refresh request for a slot-manager within `delay` seconds is merged into a single edit,
+    and the edit is skipped entirely if the rendered embed/view didn't change since the last one.
+
+    The scrims a slot-manager could offer are queried once and kept, refreshes requested with `slots_only`
+    (claims & cancels through the slot ledger) reuse them with the available slots of their loaded ledgers.
+    Any other refresh, or one coming more than `candidates_ttl` seconds after the query, queries them again.
+    The message is only fetched when there is something to edit.
+    """
+
+    def __init__(self, bot: Quotient, *, delay: float = 3.0, candidates_ttl: float = 60.0):
+        self.bot = bot
+        self.delay = delay
+        self.candidates_ttl = candidates_ttl
+
+        self._pending: T.Dict[int, asyncio.Task] = {}
+        self._locks: T.Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._hashes: T.Dict[int, int] = {}
+        self._candidates: T.Dict[int, T.Tuple[float, T.List[Scrim]]] = {}  # slotm_id: (queried at, scrims)
+
+    def schedule(self, slotm_id: int, *, slots_only: bool = False) -> None:
+        """Request a refresh of slot-manager `slotm_id`, merged with any refresh already pending."""
+        if not slots_only:
+            self._candidates.pop(slotm_id, None)
+
+        if slotm_id in self._pending:
+            return
+
+        self._pending[slotm_id] = self.bot.loop.create_task(self.__flush(slotm_id))
+
+    def forget(self, slotm_id: int) -> None:
+        """Drop pending work and the last rendered hash of a deleted slot-manager."""
+        if task := self._pending.pop(slotm_id, None):
+            task.cancel()
+
+        self._hashes.pop(slotm_id, None)
+        self._locks.pop(slotm_id, None)
+        self._candidates.pop(slotm_id, None)
+
+    @staticmethod
+    def render_hash(embed: discord.Embed, view: discord.ui.View) -> int:
+        _buttons = [(getattr(_, "custom_id", None), getattr(_, "disabled", None)) for _ in view.children]
+        return hash(json.dumps([embed.to_dict(), _buttons], sort_keys=True, default=str))
+
+    async def __flush(self, slotm_id: int):
+        await asyncio.sleep(self.delay)
+        self._pending.pop(slotm_id, None)
+
+        async with self._locks[slotm_id]:
+            await self.__refresh(slotm_id)
+
+    async def __refresh(self, slotm_id: int):
+        from models import ScrimsSlotManager
+
+        record = await ScrimsSlotManager.get_or_none(pk=slotm_id)
+        if not record:
+            return self.forget(slotm_id)
+
+        queried_at, candidates = self._candidates.get(slotm_id, (0.0, None))
+        if candidates is None or time.monotonic() - queried_at > self.candidates_ttl:
+            candidates = await record.claimable_candidates()
+            self._candidates[slotm_id] = (time.monotonic(), candidates)
+
+        _embed, _view = await record.public_message(self.__claimable(candidates))
+
+        _hash = self.render_hash(_embed, _view)
+        if self._hashes.get(slotm_id) == _hash:
+            return
+
+        message = await record.message()
+        if not message:
+            return await record.full_delete()
+
+        with suppress(discord.HTTPException):
+            await message.edit(embed=_embed, view=_view)
+            self._hashes[slotm_id] = _hash
+
+    def __claimable(self, candidates: T.List[Scrim]) -> T.List[Scrim]:
+        """What `ScrimsSlotManager.claimable_slots` would query, from the kept scrims & their slot ledgers."""
+        now = self.bot.current_time
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        claimable = []
+        for scrim in candidates:
+            if not (scrim.closed_at and self.__aware(scrim.closed_at) > today):
+                continue
+
+            if not (scrim.match_time and self.__aware(scrim.match_time) > now):
+                continue
+
+            if ledger := self.bot.slot_ledgers.peek(scrim.pk):
+                scrim.available_slots = sorted(ledger.available)
+
+            if scrim.available_slots:
+                claimable.append(scrim)
+
+        return claimable[:25]
+
+    @staticmethod
+    def __aware(dt: datetime) -> datetime:
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+import traceback
+import typing as T
+from collections import Counter, deque
+from datetime import datetime
+
+import discord
+import psutil
+
+if T.TYPE_CHECKING:
+    from .Bot import Quotient
+
+__all__ = ("Commit", "Snapshot", "StatsCollector")
+
+
+class Commit(T.NamedTuple):
+    id: str
+    message: str
+    time: int
+    offset: int  # minutes
+
+
+class Snapshot(T.NamedTuple):
+    taken_at: datetime
+    rss: int  # bytes
+    cpu: float  # process, percent of one core
+    system_cpu: float
+    memory_used: int  # bytes
+    memory_total: int
+    guilds: int
+    members: int
+    text_channels: int
+    voice_channels: int
+    commands: int
+    db_latency: T.Optional[float]  # ms, None if the query failed
+    shard_latencies: T.Dict[int, float]  # shard_id: ms
+
+
+class StatsCollector:
+    """
+    Samples process, discord and database stats every `interval` seconds in the background and keeps
+    the last `history` samples, so stats commands render from a snapshot instead of collecting anything.
+
+    Command usage is counted in memory as commands complete, the database is counted only once, in the background
+    after startup (retried every minute if it fails). Until that is done `loaded` is False and the command counts
+    only cover this session.
+    """
+
+    def __init__(self, bot: Quotient, *, interval: int = 60, history: int = 60):
+        self.bot = bot
+        self.interval = interval
+
+        self.history: T.Deque[Snapshot] = deque(maxlen=history)
+        self.commits: T.List[Commit] = []
+
+        self.loaded = False
+        self.total_commands = 0
+        self._guild_commands: T.Counter[int] = Counter()
+        self._user_commands: T.Dict[T.Tuple[int, int], int] = {}  # (guild_id, user_id): count, filled on demand
+        self._unloaded: T.List[T.Tuple[int, int]] = []  # (command_id, guild_id) recorded before `load` finished
+
+        self._process = psutil.Process()
+        self._task: T.Optional[asyncio.Task] = None
+        self._load_task: T.Optional[asyncio.Task] = None
+
+    async def load(self):
+        from tortoise.functions import Count
+
+        from models import Commands
+
+        self.commits = await self.bot.loop.run_in_executor(None, self.__read_commits)
+
+        # only rows up to `max_id` are counted from the table, so those recorded in memory meanwhile
+        # can be told apart by their id and aren't counted twice.
+        max_id = await Commands.all().order_by("-id").first().values_list("id", flat=True) or 0
+
+        total = await Commands.filter(id__lte=max_id).count()
+        per_guild = (
+            await Commands.filter(id__lte=max_id)
+            .annotate(count=Count("id"))
+            .group_by("guild_id")
+            .values_list("guild_id", "count")
+        )
+
+        counted = [guild_id for command_id, guild_id in self._unloaded if command_id <= max_id]
+
+        self.total_commands += total - len(counted)
+        self._guild_commands.update(dict(per_guild))
+        self._guild_commands.subtract(counted)
+        self._unloaded.clear()
+        self.loaded = True
+
+    def start(self):
+        if self._load_task is None:
+            self._load_task = self.bot.loop.create_task(self.__load())
+
+        if self._task is None:
+            self._task = self.bot.loop.create_task(self.__run())
+
+    async def __load(self, retry_after: int = 60):
+        started = time.perf_counter()
+
+        while not self.loaded and not self.bot.is_closed():
+            try:
+                await self.load()
+            except Exception:
+                traceback.print_exc()
+                await asyncio.sleep(retry_after)
+
+        if self.loaded:
+            print(f"Command stats loaded in {time.perf_counter() - started:.2f}s")
+
+    @property
+    def latest(self) -> T.Optional[Snapshot]:
+        return self.history[-1] if self.history else None
+
+    async def snapshot(self) -> Snapshot:
+        """The latest sample, taken right away if there is none yet."""
+        return self.latest or await self.sample()
+
+    def trend(self, field: str) -> T.Union[int, float]:
+        """Change of a numeric field between the oldest & the latest sample."""
+        if len(self.history) < 2:
+            return 0
+
+        return getattr(self.history[-1], field) - getattr(self.history[0], field)
+
+    def average(self, field: str) -> T.Optional[float]:
+        values = [_ for _ in (getattr(s, field) for s in self.history) if _ is not None]
+        return sum(values) / len(values) if values else None
+
+    def record_command(self, command_id: int, guild_id: int, user_id: int):
+        self.total_commands += 1
+        self._guild_commands[guild_id] += 1
+
+        if not self.loaded:
+            self._unloaded.append((command_id, guild_id))
+
+        if (guild_id, user_id) in self._user_commands:
+            self._user_commands[(guild_id, user_id)] += 1
+
+    def guild_commands(self, guild_id: int) -> int:
+        return self._guild_commands[guild_id]
+
+    async def user_commands(self, guild_id: int, user_id: int) -> int:
+        from models import Commands
+
+        if (count := self._user_commands.get((guild_id, user_id))) is None:
+            count = self._user_commands[(guild_id, user_id)] = await Commands.filter(
+                guild_id=guild_id, user_id=user_id
+            ).count()
+
+        return count
+
+    async def sample(self) -> Snapshot:
+        memory = psutil.virtual_memory()
+        channels = Counter(ch.type for ch in self.bot.get_all_channels())
+
+        snapshot = Snapshot(
+            taken_at=self.bot.current_time,
+            rss=self._process.memory_info().rss,
+            cpu=self._process.cpu_percent(None),
+            system_cpu=psutil.cpu_percent(None),
+            memory_used=memory.used,
+            memory_total=memory.total,
+            guilds=len(self.bot.guilds),
+            members=sum(g.member_count or 0 for g in self.bot.guilds),
+            text_channels=channels[discord.ChannelType.text],
+            voice_channels=channels[discord.ChannelType.voice],
+            commands=self.total_commands,
+            db_latency=await self.__db_latency(),
+            shard_latencies={shard_id: shard.latency * 1000 for shard_id, shard in self.bot.shards.items()},
+        )
+
+        self.history.append(snapshot)
+        return snapshot
+
+    async def __db_latency(self) -> T.Optional[float]:
+        t1 = time.perf_counter()
+        try:
+            await self.bot.db.execute_query("SELECT 1")
+        except Exception:
+            return None
+
+        return (time.perf_counter() - t1) * 1000
+
+    async def __run(self):
+        await self.bot.wait_until_ready()
+
+        while not self.bot.is_closed():
+            try:
+                await self.sample()
+            except Exception:
+                traceback.print_exc()
+
+            await asyncio.sleep(self.interval)
+
+    @staticmethod
+    def __read_commits(count: int = 3) -> T.List[Commit]:
+        import pygit2
+
+        try:
+            repo = pygit2.Repository(".git")
+            walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL)
+        except Exception:
+            return []
+
+        return [
+            Commit(str(c.id), c.message, c.commit_time, c.commit_time_offset) for c in itertools.islice(walker, count)
+        ]
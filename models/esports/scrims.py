@@ -1,19 +1,16 @@
 import asyncio
-import io
 from ast import literal_eval as leval
 from contextlib import suppress
 from datetime import timedelta
-from pathlib import Path
 from typing import List, Optional
 
 import discord
 import humanize
 from aiocache import cached
-from PIL import Image, ImageDraw, ImageFont
 from tortoise import fields, models
 
 import utils
-from constants import AutocleanType, Day, EsportsLog, EsportsRole
+from constants import AutocleanType, Day, EsportsLog, EsportsRole, ExportFormat, OutboundPriority
 from core import Context
 from models import BaseDbModel
 from models.helpers import *
@@ -178,7 +175,7 @@ class Scrim(BaseDbModel):
         return (i.user_id for i in await self.reserved_slots.all())
 
     async def banned_user_ids(self):
-        return (i.user_id for i in await self.banned_teams.all())
+        return await self.bot.scrim_bans.banned_user_ids(self.pk)
 
     async def cleaned_slots(self) -> List["AssignedSlot"]:
         slots = await self.assigned_slots.order_by("num")
@@ -189,10 +186,9 @@ class Scrim(BaseDbModel):
 
         return _list
 
-    async def add_tick(self, msg: discord.Message):
-        with suppress(discord.HTTPException):
-            await msg.add_reaction(self.check_emoji)
-            await msg.author.add_roles(self.role)
+    def add_tick(self, msg: discord.Message):
+        self.bot.outbound.submit(OutboundPriority.feedback, msg.channel.id, lambda: msg.add_reaction(self.check_emoji))
+        self.bot.outbound.submit(OutboundPriority.role, msg.guild.id, lambda: msg.author.add_roles(self.role))
 
     @staticmethod
     def default_slotlist_format():
@@ -228,6 +224,18 @@ class Scrim(BaseDbModel):
         return embed, self.slotlist_channel
 
     async def refresh_slotlist_message(self, msg: discord.Message = None):
+        """Edits of the same slotlist that pile up while one is waiting to run are merged into one."""
+        if not self.slotlist_channel_id:
+            return
+
+        return await self.bot.outbound.submit(
+            OutboundPriority.slotlist,
+            self.slotlist_channel_id,
+            lambda: self.__refresh_slotlist_message(msg),
+            key=("slotlist", self.pk),
+        )
+
+    async def __refresh_slotlist_message(self, msg: discord.Message = None):
         embed, channel = await self.create_slotlist()
 
         with suppress(discord.HTTPException, AttributeError):
@@ -260,15 +268,13 @@ class Scrim(BaseDbModel):
         _e = discord.Embed(color=0x00FFB3, title=f"Slot Available to Claim - {channel.guild.name}", url=link)
         _e.description = f"A slot of {self} is available to claim in {channel.mention}!\nClaim it before anyone else do."
 
-        async for user in self.bot.resolve_member_ids(self.guild, [i.user_id for i in reminders]):
-            with suppress(discord.HTTPException):
-                await user.send(embed=_e)
+        delivered = await self.bot.dms.send_many((i.user_id for i in reminders), embed=_e)
 
-        await ScrimsSlotReminder.filter(pk__in=(i.pk for i in reminders)).delete()
+        # users with closed DMs won't get it next time either.
+        done = [i.pk for i in reminders if i.user_id in delivered or self.bot.dms.is_closed(i.user_id)]
+        await ScrimsSlotReminder.filter(pk__in=done).delete()
 
     async def ensure_match_timer(self):
-        from models import Timer
-
         from .slotm import ScrimsSlotManager
 
         if not self.match_time:
@@ -281,14 +287,18 @@ class Scrim(BaseDbModel):
         if self.match_time != _time:
             await Scrim.filter(pk=self.pk).update(match_time=_time)
 
-        check = await Timer.filter(event="scrim_match", expires=_time, extra={"args": [], "kwargs": {"scrim_id": self.pk}}).exists()
-        if not check:
-            await self.bot.reminders.create_timer(_time, "scrim_match", scrim_id=self.pk)
+        # no-op if this exact timer exists already, any timer left from an older match time is dropped.
+        await self.bot.reminders.create_timer(_time, "scrim_match", scrim_id=self.pk, replace=True)
 
         await ScrimsSlotManager.refresh_guild_message(self.guild_id, self.pk)
 
+    async def save(self, *args, **kwargs):
+        await super().save(*args, **kwargs)
+        self.bot.scrim_dashboard.invalidate(self.guild_id)
+
     async def make_changes(self, **kwargs):
         await Scrim.filter(pk=self.pk).update(**kwargs)
+        self.bot.scrim_dashboard.invalidate(self.guild_id, kwargs)
         return await self.refresh_from_db()
 
     async def get_text_slotlist(self):
@@ -313,70 +323,16 @@ class Scrim(BaseDbModel):
             to_ban = [_ for _ in slot.members]
             scrims = await Scrim.filter(guild_id=self.guild_id).order_by("open_time")
 
-        for _ in to_ban:
-            for scrim in scrims:
-                if _ in await scrim.banned_user_ids():
-                    continue
-
-                b = await BannedTeam.create(user_id=_, expires=reason.dt, reason=reason.arg)
-                await scrim.banned_teams.add(b)
-
-            if banlog := await BanLog.get_or_none(guild_id=self.guild_id):
-                await banlog.log_ban(_, mod, scrims, reason.arg, reason.dt)
-
-            if reason.dt:
-                await self.bot.reminders.create_timer(
-                    reason.dt,
-                    "scrim_ban",
-                    scrims=[scrim.id for scrim in scrims],
-                    user_id=_,
-                    mod=mod.id,
-                    reason=reason.arg,
-                )
+        await self.bot.scrim_bans.ban(to_ban, scrims, mod=mod, reason=reason.arg, expires=reason.dt)
 
         return f"Banned {utils.plural(to_ban):player|players} from {utils.plural(scrims):scrim|scrims}."
 
     async def create_slotlist_img(self):
         """
-        This is done! Now do whatever you can : )
+        Slotlist as images of 10 slots each, rendered in the image pool.
         """
         slots = await self.teams_registered
-
-        def wrapper():
-            font = ImageFont.truetype(str(Path.cwd() / "src" / "data" / "font" / "Ubuntu-Regular.ttf"), 16)
-            rects = []
-
-            for slot in slots:
-                image = Image.new("RGBA", (290, 30), "#2e2e2e")
-                draw = ImageDraw.Draw(image)
-                draw.text((10, 5), f"Slot {slot.num:02}  |  {slot.team_name}", font=font, fill="white")
-                rects.append(image)
-
-            # We will add 10 slots in a image.
-            images = []
-            for group in utils.split_list(rects, 10):
-                size = (
-                    290,
-                    len(group) * 40,
-                )
-                image = Image.new("RGBA", size)
-                x = 0
-                y = 0
-
-                for rect in group:
-                    image.paste(rect, (x, y))
-                    y += rect.size[1] + 10
-
-                img_bytes = io.BytesIO()
-                image.save(img_bytes, "PNG")
-                img_bytes.seek(0)
-                images.append(discord.File(img_bytes, "slotlist.png"))
-
-            return images
-
-        return await asyncio.get_event_loop().run_in_executor(
-            None, wrapper
-        )  # As pillow is blocking, we will process image in executor
+        return await self.bot.images.rows((f"Slot {slot.num:02}  |  {slot.team_name}" for slot in slots), "slotlist.png")
 
     async def reg_open_msg(self):
         reserved_count = await self.reserved_slots.all().count()
@@ -472,22 +428,14 @@ class Scrim(BaseDbModel):
             )
             await note.pin()
 
-    async def full_delete(self):
-        from .slotm import ScrimsSlotManager
-
-        _id = self.pk
-        self.bot.cache.scrim_channels.discard(self.registration_channel_id)
+    async def export_slots(self, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        return await self.bot.exports.scrim(self, fmt)
 
-        slotm = await ScrimsSlotManager.filter(guild_id=self.guild_id, scrim_ids__contains=self.pk)
-        await ScrimsSlotManager.filter(pk__in=[_.pk for _ in slotm]).update(scrim_ids=ArrayRemove("scrim_ids", _id))
+    async def export_bans(self, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        return await self.bot.exports.bans(self, fmt)
 
-        _d = await self.assigned_slots.all()
-        await AssignedSlot.filter(pk__in=[_.pk for _ in _d]).delete()
-        _r = await self.slot_reminders.all()
-        await ScrimsSlotReminder.filter(pk__in=[_.pk for _ in _r]).delete()
-        _re = await self.reserved_slots.all()
-        await ReservedSlot.filter(pk__in=[_.pk for _ in _re]).delete()
-        await self.delete()
+    async def full_delete(self):
+        await self.bot.cascade.scrims([self.pk])
 
     async def confirm_all_scrims(self, ctx: Context, **kwargs):
         if not await Scrim.scrim_count(ctx.guild.id) > 1:
@@ -498,6 +446,7 @@ class Scrim(BaseDbModel):
             return await ctx.simple("Alright, this scrim only.", 4)
 
         await Scrim.filter(guild_id=ctx.guild.id).update(**kwargs)
+        self.bot.scrim_dashboard.invalidate(ctx.guild.id, kwargs)
         await ctx.simple("This change was applied to all your scrims.", 4)
 
     async def close_registration(self):
@@ -511,6 +460,7 @@ class Scrim(BaseDbModel):
 
         self.time_elapsed = humanize.precisedelta(closed_at - self.opened_at)
         await self.make_changes(opened_at=None, time_elapsed=self.time_elapsed, closed_at=closed_at)
+        self.bot.slot_ledgers.discard(self.pk)
 
         channel_update = await toggle_channel(registration_channel, open_role, False)
         _e = self.reg_close_msg()
@@ -553,6 +503,7 @@ class Scrim(BaseDbModel):
         oldslots = await self.assigned_slots
         await AssignedSlot.filter(id__in=(slot.id for slot in oldslots)).delete()
         await self.assigned_slots.clear()
+        self.bot.slot_ledgers.discard(self.pk)
 
         # here we insert a list of slots we can give for the registration.
         await self.bot.db.execute(
@@ -621,9 +572,8 @@ class Scrim(BaseDbModel):
         return await prompt_selector(*args, **kwargs)
 
     async def scrim_posi(self):
-        from cogs.esports.views.scrims.selector import scrim_position
-
-        return await scrim_position(self.pk, self.guild_id)
+        position, total = await self.bot.scrim_dashboard.position(self.guild_id, self.pk)
+        return str(position), str(total)
 
     @staticmethod
     @cached(ttl=60 * 2)
@@ -658,7 +608,7 @@ class AssignedSlot(BaseSlot):
     class Meta:
         table = "sm.assigned_slots"
 
-    message_id = fields.BigIntField(null=True)
+    message_id = fields.BigIntField(null=True, index=True)
     jump_url = fields.TextField(null=True)
 
     @property
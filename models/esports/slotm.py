@@ -1,12 +1,12 @@
 from contextlib import suppress
-from typing import Any, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import discord
 from tortoise import fields
 
 from models import BaseDbModel
 from models.helpers import ArrayField
-from utils import aenumerate, plural
+from utils import plural
 
 from .scrims import Scrim
 
@@ -21,7 +21,7 @@ class ScrimsSlotManager(BaseDbModel):
     guild_id = fields.BigIntField()
     main_channel_id = fields.BigIntField()
 
-    message_id = fields.BigIntField()
+    message_id = fields.BigIntField(index=True)
 
     toggle = fields.BooleanField(default=True)
     allow_reminders = fields.BooleanField(default=True)
@@ -73,6 +73,13 @@ class ScrimsSlotManager(BaseDbModel):
         """
         Delete a slotm record.
         """
+        await self.disable_message()
+        await self.bot.cascade.slot_managers([self.pk])
+
+    async def disable_message(self):
+        """
+        Disable the buttons of the public slot-manager message.
+        """
         message = await self.message()
 
         if message:
@@ -83,43 +90,40 @@ class ScrimsSlotManager(BaseDbModel):
 
             await message.edit(embed=_embed, view=_view)
 
-        await self.delete()
-
     @property
     def claimable_slots(self):
-        return (
-            Scrim.filter(
-                pk__in=self.scrim_ids,
-                closed_at__gt=self.bot.current_time.replace(hour=0, minute=0, second=0, microsecond=0),
-                available_slots__not=[],
-                match_time__gt=self.bot.current_time,
-                opened_at__isnull=True,
-            )
-            .order_by("open_time")
-            .limit(25)
-        )
+        return self.claimable_candidates().filter(available_slots__not=[]).limit(25)
+
+    def claimable_candidates(self):
+        """Scrims of this slot-manager whose slots can be claimed right now, whether any slot is left or not."""
+        return Scrim.filter(
+            pk__in=self.scrim_ids,
+            closed_at__gt=self.bot.current_time.replace(hour=0, minute=0, second=0, microsecond=0),
+            match_time__gt=self.bot.current_time,
+            opened_at__isnull=True,
+        ).order_by("open_time")
 
-    async def _formatted_claimable(self) -> List[str]:
+    @staticmethod
+    def _formatted_claimable(claimable: List[Scrim]) -> List[str]:
         """
         Returns a list of slots that can be claimed
         """
-        _list = []
-
-        async for idx, _ in aenumerate(self.claimable_slots, start=1):
-            _list.append(
-                f"`{idx}` {getattr(_.registration_channel,'mention','deleted-channel')}  ─  {plural(_.available_slots):Slot|Slots}"
-            )
-
-        return _list
+        return [
+            f"`{idx}` {getattr(_.registration_channel,'mention','deleted-channel')}  ─  {plural(_.available_slots):Slot|Slots}"
+            for idx, _ in enumerate(claimable, start=1)
+        ]
 
-    async def public_message(self) -> Tuple[discord.Embed, discord.ui.View]:
+    async def public_message(self, claimable: Optional[List[Scrim]] = None) -> Tuple[discord.Embed, discord.ui.View]:
         """
         Generate public message & view for slot manager.
+        Pass `claimable` scrims to skip querying them.
         """
 
         from cogs.esports.views.slotm import ScrimsSlotmPublicView
 
-        _claimable = await self._formatted_claimable()
+        if claimable is None:
+            claimable = await self.claimable_slots
+        _claimable = self._formatted_claimable(claimable)
 
         _claimable_slots = (
             ("\n" + "\n".join(_claimable))
@@ -134,7 +138,7 @@ class ScrimsSlotManager(BaseDbModel):
             f"● Available Slots: {_claimable_slots}"
         )
 
-        view = ScrimsSlotmPublicView(self)
+        view = ScrimsSlotmPublicView(self, claimable=claimable)
 
         if not _claimable:
             view.children[1].disabled = True
@@ -148,24 +152,20 @@ class ScrimsSlotManager(BaseDbModel):
 
         return _e, view
 
-    async def refresh_public_message(self) -> Optional[discord.Message]:
+    async def refresh_public_message(self, *, slots_only: bool = False) -> None:
         """
-        Edit public slotm message to reflect current state.
-        """
-        m = await self.message()
-        if not m:
-            return await self.full_delete()
-
-        _embed, _view = await self.public_message()
+        Schedule an edit of public slotm message to reflect current state.
+        Refreshes requested in quick succession are merged into one edit.
 
-        with suppress(discord.HTTPException):
-            return await m.edit(embed=_embed, view=_view)
+        :param slots_only: Only slots were claimed/cancelled through the slot ledger, the scrims are unchanged.
+        """
+        self.bot.slotm_refresher.schedule(self.pk, slots_only=slots_only)
 
     @staticmethod
-    async def refresh_guild_message(guild_id: int, scrim_id: int) -> Optional[discord.Message]:
+    async def refresh_guild_message(guild_id: int, scrim_id: int, *, slots_only: bool = False) -> None:
         slotm = await ScrimsSlotManager.get_or_none(guild_id=guild_id, scrim_ids__contains=scrim_id)
         if slotm:
-            return await slotm.refresh_public_message()
+            return await slotm.refresh_public_message(slots_only=slots_only)
 
     async def setup(self, guild: discord.Guild, user: discord.Member):
         """
@@ -197,26 +197,35 @@ class ScrimsSlotManager(BaseDbModel):
 
         self.message_id = m.id
         await self.save()
+
+        self.bot.cache.slotm_message_ids.add(m.id)
+        self.bot.cache.tracked_channel_ids.add(__channel.id)
         return self
 
-    async def user_slots(self, user_id: int) -> List[Any]:
-        query = """
-        (SELECT *
-		    FROM
-			(SELECT SCRIMS.ID AS SCRIM_ID,
-					*
-				FROM PUBLIC."sm.scrims" AS SCRIMS
-				FULL OUTER JOIN
-					(SELECT ID AS ASSIGNED_SLOT_ID,
-							*
-						FROM PUBLIC."sm.scrims_sm.assigned_slots" AS SCRIM_SLOT
-						INNER JOIN PUBLIC."sm.assigned_slots" AS SLOTS ON SLOTS.ID = SCRIM_SLOT.ASSIGNEDSLOT_ID) AS SCRIM_SLOT ON SCRIMS.ID = SCRIM_SLOT."sm.scrims_id"
-				WHERE (SCRIMS.ID = ANY ($1)
-											AND MATCH_TIME > NOW()
-											AND OPENED_AT IS NULL = TRUE
-											AND CLOSED_AT > CURRENT_DATE + interval '1 minute'
-											AND SCRIM_SLOT."sm.scrims_id" IS NOT NULL)) AS SM
-		WHERE USER_ID = $2)        
+    async def user_slots(self, user_id: int) -> List[dict]:
         """
+        Slots held by a user in the scrims of this slot-m that can still be cancelled.
+        """
+        scrims = await Scrim.filter(
+            pk__in=self.scrim_ids,
+            closed_at__gt=self.bot.current_time.replace(hour=0, minute=0, second=0, microsecond=0),
+            match_time__gt=self.bot.current_time,
+            opened_at__isnull=True,
+        )
 
-        return await self.bot.db.fetch(query, self.scrim_ids, user_id)
+        _list = []
+        for scrim in scrims:
+            ledger = await self.bot.slot_ledgers.get(scrim)
+            for slot in ledger.user_slots(user_id):
+                _list.append(
+                    {
+                        "scrim_id": scrim.pk,
+                        "registration_channel_id": scrim.registration_channel_id,
+                        "assigned_slot_id": slot.id,
+                        "num": slot.num,
+                        "team_name": slot.team_name,
+                        "user_id": slot.user_id,
+                    }
+                )
+
+        return _list
@@ -1,11 +1,12 @@
 from typing import Tuple
 
+import discord
 import imagehash
 from pydantic import BaseModel, HttpUrl
 from tortoise import fields
 
 import config
-from constants import SSType
+from constants import ExportFormat, SSType
 from core import Context
 from models import BaseDbModel
 from models.helpers import *
@@ -95,12 +96,11 @@ class SSVerify(BaseDbModel):
         diff = self.required_ss - await self.data.filter(author_id=user_id).count()
         return 0 if diff <= 0 else diff
 
-    async def full_delete(self):
-        self.bot.cache.ssverify_channels.discard(self.channel_id)
-        data = await self.data.all()
+    async def export(self, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        return await self.bot.exports.ssverify(self, fmt)
 
-        await SSData.filter(pk__in=[d.id for d in data]).delete()
-        await self.delete()
+    async def full_delete(self):
+        await self.bot.cascade.ssverify([self.pk])
 
     @property
     def filtered_keywords(self):
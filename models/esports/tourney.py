@@ -1,4 +1,3 @@
-import io
 from contextlib import suppress
 from typing import List, Optional, Union
 
@@ -8,14 +7,13 @@ from tortoise import exceptions, fields
 
 from models import BaseDbModel
 from models.helpers import *  # noqa: F401, F403
-from utils import split_list
 
 _dict = {
     "tick": "\N{WHITE HEAVY CHECK MARK}",
     "cross": "\N{CROSS MARK}",
 }
 
-from constants import EsportsLog
+from constants import EsportsLog, ExportFormat, OutboundPriority
 from core import Context
 
 
@@ -139,14 +137,11 @@ class Tourney(BaseDbModel):
     def is_ignorable(member: discord.Member) -> bool:
         return "tourney-mod" in (role.name.lower() for role in member.roles)
 
-    async def _get_groups(self) -> List[List["TMSlot"]]:
-        return split_list(await self.assigned_slots.all().order_by("num"), self.group_size)
+    async def get_groups(self, size: int = None) -> List[List["TMSlot"]]:
+        return await self.bot.tourney_groups.groups(self, size)
 
-    async def get_group(self, num: int) -> List["TMSlot"]:
-        _all = await self._get_groups()
-        for group in _all:
-            if _all.index(group) == num - 1:
-                return group
+    async def get_group(self, num: int, size: int = None) -> Optional[List["TMSlot"]]:
+        return await self.bot.tourney_groups.group(self, num, size)
 
     async def add_assigned_slot(self, slot: "TMSlot", message: discord.Message):
         _e = discord.Embed(color=self.bot.color)
@@ -156,31 +151,39 @@ class Tourney(BaseDbModel):
             _e.description += f"Team: {', '.join([str(m) for m in message.mentions])}"
 
         if _chan := self.confirm_channel:
-            m = await _chan.send(
-                content=message.author.mention, embed=_e, allowed_mentions=discord.AllowedMentions(users=True)
+            m = await self.bot.outbound.submit(
+                OutboundPriority.feedback,
+                _chan.id,
+                lambda: _chan.send(
+                    content=message.author.mention, embed=_e, allowed_mentions=discord.AllowedMentions(users=True)
+                ),
             )
 
-            slot.confirm_jump_url = m.jump_url
+            slot.confirm_jump_url = getattr(m, "jump_url", None)
 
             await slot.save()
             await self.assigned_slots.add(slot)
+            self.bot.tourney_groups.bump(self.id)
 
-    async def finalize_slot(self, ctx: Context, slot: "TMSlot"):
+    def finalize_slot(self, ctx: Context, slot: "TMSlot"):
         """
         Add role to user and reaction to the message
         """
-        with suppress(discord.HTTPException):
-            if not (_role := self.role) in ctx.author.roles:
-                await ctx.author.add_roles(_role)
+        outbound = self.bot.outbound
 
-            await ctx.message.add_reaction(self.check_emoji)
+        outbound.submit(OutboundPriority.feedback, ctx.channel.id, lambda: ctx.message.add_reaction(self.check_emoji))
 
-            if self.success_message:
-                embed = discord.Embed(color=self.bot.color, description=self.success_message)
-                embed.title = f"Message from {ctx.guild.name}"
-                embed.url = slot.jump_url
+        if (_role := self.role) and not _role in ctx.author.roles:
+            outbound.submit(OutboundPriority.role, ctx.guild.id, lambda: ctx.author.add_roles(_role))
 
-                await ctx.author.send(embed=embed, view=ctx.get_dm_view(f"Sent from {ctx.guild.name}"))
+        if self.success_message:
+            embed = discord.Embed(color=self.bot.color, description=self.success_message)
+            embed.title = f"Message from {ctx.guild.name}"
+            embed.url = slot.jump_url
+
+            self.bot.loop.create_task(
+                self.bot.dms.send(ctx.author.id, embed=embed, view=ctx.get_dm_view(f"Sent from {ctx.guild.name}"))
+            )
 
     async def end_process(self):
         from cogs.esports.helpers.utils import toggle_channel
@@ -213,23 +216,8 @@ class Tourney(BaseDbModel):
         slotm_channel = await _category.create_text_channel(name="tourney-slotmanager", overwrites=overwrites)
         return await slotm_channel.send(embed=TourneySlotManager.initial_embed(self), view=_view)
 
-    async def get_csv(self):
-        guild = self.guild
-        member_ids = [_.id for _ in guild.members]
-
-        _x = "Reg Posi,Team Name,Leader,Leader ID,Teammates,Teammates in Server,Jump URL\n"
-
-        async for slot in self.assigned_slots.all().order_by("num"):
-            _team = " | ".join((f"{str(guild.get_member(m))} ({m})" for m in slot.members))
-
-            _x += (
-                f"{slot.num},{slot.team_name},{str(guild.get_member(slot.leader_id))},"
-                f"'{slot.leader_id}',{_team},{sum(1 for i in slot.members if i in member_ids)},{slot.jump_url}\n"
-            )
-
-        fp = io.BytesIO(_x.encode())
-
-        return discord.File(fp, filename=f"tourney_data_{self.id}_{self.bot.current_time.timestamp()}.csv")
+    async def export(self, fmt: ExportFormat = ExportFormat.csv) -> discord.File:
+        return await self.bot.exports.tourney(self, fmt)
 
     async def full_delete(self, member: discord.Member = None) -> None:
         if self.logschan != None:
@@ -237,12 +225,9 @@ class Tourney(BaseDbModel):
             embed = discord.Embed(color=discord.Color.red())
             embed.title = f"A tournament was completely deleted."
             embed.description = f"Tourney name : {self.name} [{self.id}]" + f"\nDeleted by: {member}"
-            await self.logschan.send(embed=embed, file=await self.get_csv())
+            await self.logschan.send(embed=embed, file=await self.export())
 
-        self.bot.cache.tourney_channels.discard(self.registration_channel_id)
-        _data = await self.assigned_slots.all()
-        await TMSlot.filter(pk__in=[_.id for _ in _data]).delete()
-        await self.delete()
+        await self.bot.cascade.tourneys([self.pk])
 
         if self.slotm_channel_id:
             with suppress(discord.HTTPException, AttributeError):
@@ -328,7 +313,9 @@ class Tourney(BaseDbModel):
     async def __start_registrations(self):
         registration_channel = self.registration_channel
 
-        if self.total_slots <= await self.assigned_slots.all().count():
+        ledger = await self.bot.tourney_ledgers.get(self)
+
+        if ledger.is_full(self):
             return False, "Slots are already full, Increase slots to start again."
 
         await Tourney.filter(pk=self.id).update(started_at=self.bot.current_time, closed_at=None)
@@ -340,7 +327,7 @@ class Tourney(BaseDbModel):
             f"**Registration Open for {self.name}**\n"
             "```"
             f"📣 {self.required_mentions} mentions required.\n"
-            f"📣 Total slots: {self.total_slots} [{self.total_slots - await self.assigned_slots.all().count()} slots left]"
+            f"📣 Total slots: {self.total_slots} [{self.total_slots - ledger.filled} slots left]"
             "```"
         )
         _e.set_thumbnail(url=getattr(self.guild.icon, "url", self.bot.user.avatar.url))
@@ -393,6 +380,8 @@ class Tourney(BaseDbModel):
             self.bot.loop.create_task(self.update_confirmed_message(slot.confirm_jump_url))
 
         await slot.delete()
+        self.bot.tourney_groups.bump(self.id)
+        self.bot.tourney_ledgers.release(self.id, slot.leader_id, slot.team_name, slot.message_id)
 
         if not await self.assigned_slots.filter(leader_id=slot.leader_id).exists():
             m = self.guild.get_member(slot.leader_id)
@@ -429,6 +418,7 @@ class Tourney(BaseDbModel):
         except discord.HTTPException:
             msg = await self.slotm_channel.send(embed=_e, view=_view)
             await self.make_changes(slotm_message_id=msg.id)
+            self.bot.cache.tourney_message_ids.add(msg.id)
 
         finally:
             return True
@@ -453,7 +443,7 @@ class TMSlot(BaseDbModel):
     num = fields.IntField()
     team_name = fields.TextField()
     leader_id = fields.BigIntField()
-    message_id = fields.BigIntField(null=True)
+    message_id = fields.BigIntField(null=True, index=True)
     members = ArrayField(fields.BigIntField(), default=list)
     confirm_jump_url = fields.CharField(max_length=300, null=True)
     jump_url = fields.TextField(null=True)
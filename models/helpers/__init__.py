@@ -1,3 +1,4 @@
 from .cfields import *  # noqa: F401, F403
 from .functions import *  # noqa: F401, F403
+from .m2m import *  # noqa: F401, F403
 from .validators import *  # noqa: F401, F403
@@ -0,0 +1,101 @@
+import typing
+
+__all__ = ("M2MTable",)
+
+
+class M2MTable:
+    """
+    Set-based access to the through table of a ManyToMany field.
+
+    tortoise only lets us add/remove relations of one instance at a time,
+    this works on many owners & related rows with a single statement.
+    """
+
+    def __init__(self, model, field: str) -> None:
+        _field = model._meta.fields_map[field]
+
+        self.model = model
+        self.table = self.db.query_class.Table(_field.through)
+
+        self.owner_key = _field.backward_key  # column referencing `model`
+        self.related_key = _field.forward_key  # column referencing the related model
+        self.related_table = _field.related_model._meta.db_table
+        self.related_pk = _field.related_model._meta.db_pk_column
+
+    @property
+    def db(self):
+        # resolved on every use so that queries run inside an active `in_transaction()`
+        return self.model._meta.db
+
+    def _where(self, query, owner_ids: typing.Iterable[int] = None, related_ids: typing.Iterable[int] = None):
+        if owner_ids is not None:
+            query = query.where(self.table[self.owner_key].isin(list(owner_ids)))
+
+        if related_ids is not None:
+            query = query.where(self.table[self.related_key].isin(list(related_ids)))
+
+        return query
+
+    async def pairs(
+        self, owner_ids: typing.Iterable[int] = None, related_ids: typing.Iterable[int] = None
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """(owner_id, related_id) of every relation matching the given ids."""
+        query = self._where(
+            self.db.query_class.from_(self.table).select(self.owner_key, self.related_key), owner_ids, related_ids
+        )
+        _, rows = await self.db.execute_query(*query.get_parameterized_sql())
+        return [(row[self.owner_key], row[self.related_key]) for row in rows]
+
+    async def pairs_by(
+        self,
+        column: str,
+        values: typing.Iterable[typing.Any] = None,
+        owner_ids: typing.Iterable[int] = None,
+        related_ids: typing.Iterable[int] = None,
+    ) -> typing.List[typing.Tuple[int, int, typing.Any]]:
+        """
+        (owner_id, related_id, related.<column>) of every relation matching the given ids,
+        optionally only those whose related row has `column` in `values`.
+        """
+        related = self.db.query_class.Table(self.related_table)
+
+        query = (
+            self.db.query_class.from_(self.table)
+            .join(related)
+            .on(related[self.related_pk] == self.table[self.related_key])
+            .select(self.table[self.owner_key], self.table[self.related_key], related[column])
+        )
+        if values is not None:
+            query = query.where(related[column].isin(list(values)))
+
+        query = self._where(query, owner_ids, related_ids)
+        _, rows = await self.db.execute_query(*query.get_parameterized_sql())
+        return [(row[self.owner_key], row[self.related_key], row[column]) for row in rows]
+
+    async def link(self, pairs: typing.Iterable[typing.Tuple[int, int]]) -> None:
+        """Insert (owner_id, related_id) relations, the caller makes sure they don't exist already."""
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        query = self.db.query_class.into(self.table).columns(self.owner_key, self.related_key)
+        for owner_id, related_id in pairs:
+            query = query.insert(owner_id, related_id)
+
+        await self.db.execute_query(*query.get_parameterized_sql())
+
+    async def unlink(self, owner_ids: typing.Iterable[int] = None, related_ids: typing.Iterable[int] = None) -> None:
+        """Delete every relation matching the given ids."""
+        query = self._where(self.db.query_class.from_(self.table).delete(), owner_ids, related_ids)
+        await self.db.execute_query(*query.get_parameterized_sql())
+
+    async def delete_related(self, owner_ids: typing.Iterable[int]) -> None:
+        """
+        Delete the related rows of the given owners, with one `DELETE ... WHERE pk IN (subquery)`.
+        Only for relations whose related rows belong to a single owner, the relations themselves are left to `unlink`.
+        """
+        related = self.db.query_class.Table(self.related_table)
+        owned = self._where(self.db.query_class.from_(self.table).select(self.related_key), owner_ids)
+
+        query = self.db.query_class.from_(related).where(related[self.related_pk].isin(owned)).delete()
+        await self.db.execute_query(*query.get_parameterized_sql())
@@ -1,4 +1,9 @@
+import hashlib
+import json
+from datetime import datetime
+
 from tortoise import fields, models
+from tortoise.expressions import Q
 
 
 class Timer(models.Model):
@@ -7,6 +12,8 @@ class Timer(models.Model):
     created = fields.DatetimeField(auto_now=True)
     event = fields.TextField()
     extra = fields.JSONField(default=dict)
+    key = fields.CharField(max_length=100, null=True, unique=True)  # event:entity:expiry, see `make_key`
+    entity = fields.CharField(max_length=80, null=True, index=True)  # event:entity, see `entity_prefix`
 
     @property
     def kwargs(self):
@@ -15,3 +22,63 @@ class Timer(models.Model):
     @property
     def args(self):
         return self.extra.get("args", ())
+
+    @staticmethod
+    def entity_prefix(event: str, args, kwargs) -> str:
+        """Key prefix shared by every timer of `event` for the same entity (args & kwargs), whatever its expiry."""
+        _entity = json.dumps([list(args), kwargs], sort_keys=True, default=str)
+        return f"{event}:{hashlib.sha1(_entity.encode()).hexdigest()[:20]}:"
+
+    @classmethod
+    def make_key(cls, event: str, expires: datetime, args, kwargs) -> str:
+        return f"{cls.entity_prefix(event, args, kwargs)}{int(expires.timestamp())}"
+
+    @classmethod
+    async def migrate_key(cls):
+        """
+        Timer tables created before `key` & `entity` existed don't get the columns from generate_schemas,
+        timers saved without them get them here so that `get_or_create` by key and `replace` find them.
+        """
+        db, table = cls._meta.db, cls._meta.db_table
+
+        if db.capabilities.dialect == "sqlite":
+            _, rows = await db.execute_query(f'PRAGMA table_info("{table}")')
+            columns = {_["name"] for _ in rows}
+        else:
+            _, rows = await db.execute_query(
+                f"SELECT column_name FROM information_schema.columns WHERE table_name = '{table}'"
+            )
+            columns = {_["column_name"] for _ in rows}
+
+        if "key" not in columns:
+            await db.execute_script(f'ALTER TABLE "{table}" ADD COLUMN "key" VARCHAR(100);')
+            await db.execute_script(f'CREATE UNIQUE INDEX IF NOT EXISTS "uid_{table}_key" ON "{table}" ("key");')
+
+        if "entity" not in columns:
+            await db.execute_script(f'ALTER TABLE "{table}" ADD COLUMN "entity" VARCHAR(80);')
+            await db.execute_script(f'CREATE INDEX IF NOT EXISTS "idx_{table}_entity" ON "{table}" ("entity");')
+
+        timers = await cls.filter(Q(key__isnull=True) | Q(entity__isnull=True)).order_by("id")
+        if not timers:
+            return
+
+        taken = set(await cls.filter(key__isnull=False).values_list("key", flat=True))
+        keyed, duplicates = [], []
+        for timer in timers:
+            timer.entity = cls.entity_prefix(timer.event, timer.args, timer.kwargs)
+            if timer.key is None:
+                timer.key = cls.make_key(timer.event, timer.expires, timer.args, timer.kwargs)
+                if timer.key in taken:  # the same timer was saved twice, it would only dispatch twice.
+                    duplicates.append(timer.id)
+                    continue
+
+                taken.add(timer.key)
+
+            keyed.append(timer)
+
+        if duplicates:
+            await cls.filter(id__in=duplicates).delete()
+        if keyed:
+            await cls.bulk_update(keyed, fields=["key", "entity"], batch_size=500)
+
+        print(f"Backfilled keys & entities of {len(keyed)} timers, deleted {len(duplicates)} duplicates.")
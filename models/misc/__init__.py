@@ -7,6 +7,7 @@ from .guild import *  # noqa: F401, F403
 from .Lockdown import *
 from .premium import *
 from .Snipe import *
+from .state import *
 from .Tag import *
 from .Timer import *
 from .User import *
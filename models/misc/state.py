@@ -0,0 +1,43 @@
+from tortoise import fields
+
+from models import BaseDbModel
+
+__all__ = ("BotState", "ClosedDM", "DepartedGuild")
+
+
+class BotState(BaseDbModel):
+    """Small key-value store for bot-wide state that should survive restarts."""
+
+    class Meta:
+        table = "bot_state"
+
+    key = fields.CharField(max_length=100, pk=True)
+    value = fields.TextField(null=True)
+
+    @classmethod
+    async def get_value(cls, key: str):
+        return await cls.filter(key=key).first().values_list("value", flat=True)
+
+    @classmethod
+    async def set_value(cls, key: str, value: str) -> None:
+        await cls.update_or_create({"value": value}, key=key)
+
+
+class ClosedDM(BaseDbModel):
+    """Users whose DMs refused a message from the bot, see core.dms.DMDelivery"""
+
+    class Meta:
+        table = "closed_dms"
+
+    user_id = fields.BigIntField(pk=True, generated=False)
+    failed_at = fields.DatetimeField(auto_now=True)
+
+
+class DepartedGuild(BaseDbModel):
+    """Guilds the bot was removed from, their data is purged after a while, see core.guilds.GuildReconciler"""
+
+    class Meta:
+        table = "departed_guilds"
+
+    guild_id = fields.BigIntField(pk=True, generated=False)
+    left_at = fields.DatetimeField(auto_now_add=True, index=True)
@@ -83,12 +83,14 @@ async def premium_success(request: Request, txnId: str):
 
     await User.get(pk=u.pk).update(is_premium=True, premium_expire_time=end_time)
     await User.get(pk=u.user_id).update(made_premium=ArrayAppend("made_premium", u.user_id))
-
-    bot.dispatch("premium_purchase", record.txnid)
+    bot.premium.set_user(u.user_id, end_time)
 
     guild = await Guild.get(pk=record.guild_id)
     end_time = guild.premium_end_time + plan.duration if guild.is_premium else datetime.now(constants.IST) + plan.duration
     await Guild.get(pk=guild.pk).update(is_premium=True, premium_end_time=end_time, made_premium_by=u.user_id)
+    bot.premium.set_guild(guild.pk, end_time)
+
+    bot.dispatch("premium_purchase", record.txnid)
 
     return {"success": "Transaction was successful. Please return to discord App."}
 
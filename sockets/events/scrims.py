@@ -47,13 +47,9 @@ class SocketScrims(Cog):
     async def on_request__bot_scrim_delete(self, u: str, data: dict):
         guild_id, scrim_id = data["guild_id"], data["scrim_id"]
         if scrim_id:
-            scrim = await Scrim.get_or_none(pk=scrim_id)
-            if scrim:
-                await scrim.full_delete()
+            await self.bot.cascade.scrims([scrim_id])
 
         else:
-            scrims = await Scrim.filter(guild_id=guild_id)
-            for scrim in scrims:
-                await scrim.full_delete()
+            await self.bot.cascade.scrims(await Scrim.filter(guild_id=guild_id).values_list("id", flat=True))
 
         return await self.bot.sio.emit(f"bot_scrim_delete__{u}", SockResponse().dict())
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 import dateparser
 
 from constants import IST, AutocleanType, Day
-from models import Guild, Scrim, Timer
+from models import Scrim, Timer
 
 __all__ = ("BaseScrim",)
 
@@ -103,7 +103,7 @@ class BaseScrim(BaseModel):
         return True, True
 
     async def create_scrim(self, bot: Quotient):
-        if not await Guild.filter(guild_id=self.guild_id, is_premium=True).exists():
+        if not bot.premium.is_premium_guild(self.guild_id):
             if await Scrim.filter(guild_id=self.guild_id).count() >= 3:
                 return False, "Cannot create more than 3 scrims without Premium."
 
@@ -114,6 +114,8 @@ class BaseScrim(BaseModel):
         del _d["id"]
 
         scrim = await Scrim.create(**_d)
+        bot.scrim_dashboard.invalidate(scrim.guild_id)
+        bot.cache.tracked_channel_ids.update((scrim.registration_channel_id, scrim.slotlist_channel_id))
 
         await bot.reminders.create_timer(scrim.open_time, "scrim_open", scrim_id=scrim.id)
 
@@ -138,6 +140,8 @@ class BaseScrim(BaseModel):
         del _d["autoclean"]
 
         await Scrim.filter(pk=self.id).update(**_d)
+        bot.scrim_dashboard.invalidate(scrim.guild_id, _d)
+        bot.cache.tracked_channel_ids.update((self.registration_channel_id, self.slotlist_channel_id))
 
         _w = """UPDATE public."sm.scrims" SET autoclean = $1 , open_days = $2 WHERE id = $3"""
         await bot.db.execute(_w, [_.value for _ in self.autoclean], [_.value for _ in self.open_days], self.id)
@@ -3,7 +3,7 @@ from typing import Union
 from discord.ext import commands
 from discord.ext.commands import CheckFailure, Context, has_any_role
 
-from models import Guild, User
+from models import Guild
 
 from .exceptions import *
 
@@ -22,8 +22,7 @@ def has_done_setup():
 
 def is_premium_guild():
     async def predictate(ctx: Context):
-        check = await Guild.get_or_none(guild_id=ctx.guild.id)
-        if not check or check.is_premium is False:
+        if not ctx.bot.premium.is_premium_guild(ctx.guild.id):
             raise NotPremiumGuild()
 
         else:
@@ -34,8 +33,7 @@ def is_premium_guild():
 
 def is_premium_user():
     async def predicate(ctx: Context):
-        check = await User.get_or_none(user_id=ctx.author.id)
-        if not check or check.is_premium is False:
+        if not ctx.bot.premium.is_premium_user(ctx.author.id):
             raise NotPremiumUser()
 
         else:
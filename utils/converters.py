@@ -24,6 +24,9 @@ __all__ = (
 
 
 class to_async:
+    # shared by every decorated function unless one brings its own executor.
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(self, *, executor: Optional[ThreadPoolExecutor] = None):
         self.executor = executor
 
@@ -32,7 +35,10 @@ class to_async:
         async def wrapper(*args, **kwargs):
             loop = asyncio.get_event_loop()
             if not self.executor:
-                self.executor = ThreadPoolExecutor()
+                if to_async._executor is None:
+                    to_async._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="to_async")
+
+                self.executor = to_async._executor
 
             func = partial(blocking, *args, **kwargs)
 
@@ -27,12 +27,12 @@ def split_list(data: list, per_list: int):
     return new
 
 
-def find_team(message: discord.Message):
+def find_team(message: discord.Message, content: str = None):
     """
-    Finds team name from a message
+    Finds team name from a message, or from `content` if it's already been normalized.
     """
     author = message.author
-    teamname = re.search(r"team.*", message.content)
+    teamname = re.search(r"team.*", message.content if content is None else content)
     if teamname is None:
         return f"{author}'s team"
 
@@ -43,11 +43,11 @@ def find_team(message: discord.Message):
     return teamname
 
 
-def find_drop_location(message: discord.Message):
+def find_drop_location(message: discord.Message, content: str = None):
     """
     Find team's drop location from message, if provided.
     """
-    drop_location = re.search(r"drop.*", message.content)
+    drop_location = re.search(r"drop.*", message.content if content is None else content)
     if drop_location is None:
         return None
 
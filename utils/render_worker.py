@@ -0,0 +1,83 @@
+"""
+Functions that run inside the image rendering processes of `core.images.ImageRenderer`.
+
+Worker processes are spawned and unpickle these functions by importing this module, so it must
+never import `core` (that builds a whole bot) or anything else heavier than pillow.
+"""
+
+from __future__ import annotations
+
+import io
+import typing as T
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+__all__ = ("init_worker", "render_rows")
+
+
+DATA_DIR = Path.cwd() / "data"
+
+# flat coloured images barely shrink above this, while encoding time keeps growing.
+PNG_COMPRESS_LEVEL = 3
+
+_fonts: T.Dict[T.Tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+
+def init_worker(fonts: T.Sequence[T.Tuple[str, int]]):
+    """Runs once in every worker process, the fonts stay loaded for its whole life."""
+    for name, size in fonts:
+        _font(name, size)
+
+
+def _font(name: str, size: int) -> ImageFont.FreeTypeFont:
+    if (font := _fonts.get((name, size))) is None:
+        font = _fonts[(name, size)] = ImageFont.truetype(str(DATA_DIR / "font" / f"{name}.ttf"), size)
+
+    return font
+
+
+@lru_cache(maxsize=4)
+def _template(name: str, size: T.Tuple[int, int]) -> Image.Image:
+    """Background images are decoded & resized once per worker and copied for every render."""
+    return Image.open(DATA_DIR / "img" / name).convert("RGBA").resize(size)
+
+
+def _encode(image: Image.Image) -> bytes:
+    fp = io.BytesIO()
+    image.save(fp, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    return fp.getvalue()
+
+
+def render_rows(
+    rows: T.Sequence[str],
+    *,
+    per_image: int,
+    width: int,
+    row_height: int,
+    gap: int,
+    font: T.Tuple[str, int],
+    fill: str,
+    color: str,
+    template: T.Optional[str],
+) -> T.List[bytes]:
+    """Draws every `per_image` rows as strips of one canvas, returns the encoded PNGs."""
+    _f = _font(*font)
+    images = []
+
+    for start in range(0, len(rows), per_image):
+        group = rows[start : start + per_image]
+
+        size = (width, len(group) * (row_height + gap))
+        canvas = _template(template, size).copy() if template else Image.new("RGBA", size)
+        draw = ImageDraw.Draw(canvas)
+
+        for idx, text in enumerate(group):
+            top = idx * (row_height + gap)
+            draw.rectangle((0, top, width - 1, top + row_height - 1), fill=fill)
+            draw.text((10, top + 5), text, font=_f, fill=color)
+
+        images.append(_encode(canvas))
+
+    return images